@@ -0,0 +1,494 @@
+import json
+import os
+import posixpath
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import arcade
+import pyglet
+from PIL import Image
+from asset_pack import AssetPack
+from settings import ASSET_LOADER_THREADS, ASSET_MEMORY_BUDGET, LANE_COUNT, SCREEN_HEIGHT, SCREEN_WIDTH
+
+# Zasoby są wskazywane nazwami logicznymi ("images/heart.png"), niezależnie od katalogu roboczego
+ASSET_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets")
+IMAGE_FOLDER = "images"
+SOUND_FOLDER = "sounds"
+
+# Grafiki przeskalowane i spakowane przez src/build_assets.py; bez nich używane są pliki źródłowe
+BUILD_FOLDER = "build"
+BUILD_MANIFEST_VERSION = 2
+PACK_FILE = os.path.join(ASSET_ROOT, BUILD_FOLDER, "assets.pack")
+
+# Pliki wczytywane przy starcie gry, żeby nawigacja po menu i restarty nie sięgały na dysk
+PRELOAD_MANIFEST = [
+    posixpath.join(IMAGE_FOLDER, "city.png"),
+    posixpath.join(IMAGE_FOLDER, "city1.png"),
+    posixpath.join(IMAGE_FOLDER, "heart.png"),
+    posixpath.join(IMAGE_FOLDER, "girl_avatar.png"),
+    posixpath.join(IMAGE_FOLDER, "szczur.png"),
+    posixpath.join(IMAGE_FOLDER, "notes.png"),
+    posixpath.join(SOUND_FOLDER, "loss.wav"),
+    posixpath.join(SOUND_FOLDER, "coin1.wav"),
+    posixpath.join(SOUND_FOLDER, "burger.wav"),
+    posixpath.join(SOUND_FOLDER, "speed.wav"),
+    posixpath.join(SOUND_FOLDER, "triumph.wav"),
+]
+
+SOUND_EXTENSIONS = (".wav", ".ogg", ".mp3")
+
+
+class AssetEntry:
+    """A decoded asset together with its owners and estimated memory footprint"""
+
+    __slots__ = ("path", "asset", "size", "pinned", "owners")
+
+    def __init__(self, path, asset, size, pinned=False):
+        self.path = path
+        self.asset = asset
+        self.size = size
+        self.pinned = pinned
+        self.owners = weakref.WeakSet()
+
+
+class PackedSound(arcade.Sound):
+    """arcade.Sound decoded from an already opened file instead of a path on disk"""
+
+    def __init__(self, name, file):
+        """Decode a sound
+
+        Args:
+            name (str): Logical name, also used to pick the decoder by extension
+            file (BinaryIO): Opened audio file
+        """
+
+        self.file_name = name
+        self.source = pyglet.media.load(name, file=file, streaming=False)
+        self.min_distance = 100000000
+
+
+class AssetLoad:
+    """A group of assets decoded on worker threads and handed over to the cache in slices
+
+    Workers only read and decode files. Adding the results to the cache and uploading
+    textures to the GPU happens on the main thread in finalize(), which stops as soon as
+    its per-call time budget is used up.
+    """
+
+    def __init__(self, cache, names, pinned, executor):
+        """Submit every asset that is not cached yet
+
+        Args:
+            cache (AssetCache): Cache receiving the assets
+            names (Iterable[str]): Logical names of the assets
+            pinned (bool): Whether the assets must never be evicted
+            executor (concurrent.futures.Executor): Pool running the decoders
+        """
+
+        self.cache = cache
+        self.pinned = pinned
+        self.pending = []
+        for key in dict.fromkeys(cache._key(name) for name in names):
+            entry = cache.entries.get(key)
+            if entry is not None:
+                entry.pinned = entry.pinned or pinned
+                continue
+            cache.misses += 1
+            loader, _ = cache._loader(key)
+            self.pending.append((key, executor.submit(loader, key)))
+        self.total = len(self.pending)
+        self.finished = 0
+
+    @property
+    def progress(self):
+        """float: Share of the assets already in the cache, from 0 to 1"""
+
+        return self.finished / self.total if self.total else 1.0
+
+    @property
+    def done(self):
+        """bool: Whether every asset is in the cache"""
+
+        return not self.pending
+
+    def finalize(self, budget):
+        """Move decoded assets into the cache until the time budget is used up
+
+        At least one ready asset is handled per call, so loading always makes progress.
+        A decoding error is raised here, on the main thread.
+
+        Args:
+            budget (float): Time in seconds this call may take
+
+        Returns:
+            bool: Whether every asset is in the cache
+        """
+
+        start = time.perf_counter()
+        for item in list(self.pending):
+            key, future = item
+            if not future.done():
+                continue
+            self.pending.remove(item)
+            self.cache._finish(key, future.result(), self.pinned)
+            self.finished += 1
+            if time.perf_counter() - start >= budget:
+                break
+        return self.done
+
+
+class AssetCache:
+    """Registry of textures and sounds keyed by logical name, decoding every file only once
+
+    Names are relative to the assets folder ("images/heart.png", "sounds/coin1.wav"), so
+    lookups work from any working directory. Files are read from the memory-mapped
+    asset pack when one was built and from the assets folder otherwise.
+
+    Each lookup may name an owner (usually a view); owners are held weakly, so an entry
+    becomes unused as soon as every view that asked for it is gone. When the estimated
+    memory of all entries exceeds the budget, unused and unpinned entries are evicted
+    in least-recently-used order and the GPU atlas is rebuilt to reclaim their space.
+    Views release their entries when they are hidden.
+
+    Images listed in the build manifest are served from the offline build instead of the
+    source files: backgrounds already scaled to the screen and sprites cut out of one
+    shared atlas at the size they are drawn. Names stay the same for callers, and a
+    missing build or one made for another screen size falls back to the sources.
+    """
+
+    def __init__(self, memory_budget=ASSET_MEMORY_BUDGET, root=ASSET_ROOT, pack_path=PACK_FILE):
+        """Initialize an empty cache
+
+        Args:
+            memory_budget (int, optional): Soft limit in bytes for decoded assets. Defaults to ASSET_MEMORY_BUDGET
+            root (str, optional): Folder the asset names are relative to. Defaults to ASSET_ROOT
+            pack_path (str, optional): Asset pack written by build_assets.py. Defaults to PACK_FILE
+        """
+
+        self.memory_budget = memory_budget
+        self.root = root
+        self.pack_path = pack_path
+        self._pack = None
+        self._built = None
+        self._atlases = {}
+        self._atlas_lock = threading.Lock()
+        self.atlas_memory = 0  # zdekodowane atlasy sprite'ów (tylko pod _atlas_lock)
+        self._executor = None
+        self.entries = OrderedDict()
+        self.memory_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(name):
+        return posixpath.normpath(name.replace(os.sep, "/"))
+
+    @property
+    def pack(self):
+        """AssetPack or None: The mapped asset pack, opened on first use"""
+
+        if self._pack is None:
+            try:
+                self._pack = AssetPack(self.pack_path)
+            except (OSError, ValueError):
+                self._pack = False
+        return self._pack or None
+
+    def open(self, name):
+        """Open an asset file for reading
+
+        Args:
+            name (str): Logical name of the file
+
+        Returns:
+            BinaryIO: A view into the pack, or the file in the assets folder
+        """
+
+        pack = self.pack
+        if pack is not None and name in pack:
+            return pack.open(name)
+        return open(os.path.join(self.root, name), "rb")
+
+    def file_size(self, name):
+        """Return the size in bytes of an asset file
+
+        Args:
+            name (str): Logical name of the file
+
+        Returns:
+            int: Size of the encoded file
+        """
+
+        pack = self.pack
+        if pack is not None and name in pack:
+            return pack.size(name)
+        return os.path.getsize(os.path.join(self.root, name))
+
+    def _loader(self, key):
+        if key.lower().endswith(SOUND_EXTENSIONS):
+            return self._load_sound, self._sound_size
+        return self._load_texture, _texture_size
+
+    def _store(self, key, asset, measure, pinned):
+        entry = AssetEntry(key, asset, measure(key, asset), pinned)
+        self.entries[key] = entry
+        self.memory_used += entry.size
+        return entry
+
+    def _get(self, path, loader, measure, owner, pinned=False):
+        key = self._key(path)
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            entry = self._store(key, loader(key), measure, pinned)
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            entry.pinned = entry.pinned or pinned
+        if owner is not None:
+            entry.owners.add(owner)
+        self.evict()
+        return entry.asset
+
+    def built_images(self):
+        """Return the images provided by the offline build, reading its manifest once
+
+        Returns:
+            dict: Logical name -> manifest entry, empty if the build is missing or outdated
+        """
+
+        if self._built is None:
+            self._built = {}
+            pack = self.pack
+            if pack is not None:
+                manifest = pack.index.get("build", {})
+            else:
+                try:
+                    with open(os.path.join(self.root, BUILD_FOLDER, "manifest.json"), encoding="utf-8") as f:
+                        manifest = json.load(f)
+                except (OSError, ValueError):
+                    return self._built
+            # Rozmiar sprite'ów zależy od ekranu i liczby pasów - inny układ oznacza powrót do plików źródłowych
+            if (manifest.get("version") == BUILD_MANIFEST_VERSION
+                    and manifest.get("screen") == [SCREEN_WIDTH, SCREEN_HEIGHT]
+                    and manifest.get("lane_count") == LANE_COUNT):
+                self._built = {self._key(name): entry for name, entry in manifest["images"].items()}
+        return self._built
+
+    def _decode_image(self, name):
+        with self.open(name) as f, Image.open(f) as image:
+            return image.convert("RGBA")
+
+    def _load_texture(self, key):
+        entry = self.built_images().get(key)
+        if entry is None:
+            return arcade.Texture(self._decode_image(key), hash=key)
+        name = entry["file"]
+        region = entry.get("region")
+        if region is None:
+            return arcade.Texture(self._decode_image(name), hash=key)
+
+        # Atlas jest dekodowany raz, a każdy sprite to tylko wycinek z niego (także przy wczytywaniu w tle)
+        with self._atlas_lock:
+            atlas = self._atlases.get(name)
+            if atlas is None:
+                atlas = self._atlases[name] = self._decode_image(name)
+                self.atlas_memory += atlas.width * atlas.height * 4
+        x, y, width, height = region
+        return arcade.Texture(atlas.crop((x, y, x + width, y + height)), hash=f"{key}@{name}")
+
+    def _load_sound(self, key):
+        with self.open(key) as f:
+            return PackedSound(key, f)
+
+    def _sound_size(self, key, sound):
+        """Estimate sound memory from the size of the file"""
+
+        return self.file_size(key)
+
+    def texture(self, path, owner=None):
+        """Return the texture for a name, decoding it on first use
+
+        Args:
+            path (str): Logical name of the image, e.g. "images/heart.png"
+            owner (object, optional): Object (e.g. a view) that holds the texture. Defaults to None
+
+        Returns:
+            arcade.Texture: The shared texture
+        """
+
+        return self._get(path, self._load_texture, _texture_size, owner)
+
+    def sound(self, path, owner=None):
+        """Return the sound for a name, decoding it on first use
+
+        Args:
+            path (str): Logical name of the audio file, e.g. "sounds/coin1.wav"
+            owner (object, optional): Object (e.g. a view) that holds the sound. Defaults to None
+
+        Returns:
+            arcade.Sound: The shared sound
+        """
+
+        return self._get(path, self._load_sound, self._sound_size, owner)
+
+    def preload(self, manifest=PRELOAD_MANIFEST):
+        """Decode and pin every file listed in the manifest
+
+        Args:
+            manifest (Iterable[str], optional): Logical names of the assets to load. Defaults to PRELOAD_MANIFEST
+        """
+
+        for path in manifest:
+            self._get(path, *self._loader(self._key(path)), None, pinned=True)
+
+    def loaded(self, names):
+        """Return whether every asset is already cached
+
+        Args:
+            names (Iterable[str]): Logical names of the assets
+
+        Returns:
+            bool: True if no asset would have to be decoded
+        """
+
+        return all(self._key(name) in self.entries for name in names)
+
+    def load_async(self, names, pinned=False):
+        """Start decoding assets on the worker threads
+
+        Call finalize() on the returned object once per frame from the main thread until
+        it reports that everything is loaded.
+
+        Args:
+            names (Iterable[str]): Logical names of the assets
+            pinned (bool, optional): Whether the assets must never be evicted. Defaults to False
+
+        Returns:
+            AssetLoad: Handle reporting progress and finishing the load
+        """
+
+        # Paczka i manifest są otwierane tutaj, żeby wątki robocze tylko z nich czytały
+        self.built_images()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(ASSET_LOADER_THREADS, thread_name_prefix="asset-loader")
+        return AssetLoad(self, names, pinned, self._executor)
+
+    def _finish(self, key, asset, pinned):
+        """Add an asset decoded in the background, uploading textures to the GPU atlas"""
+
+        if key in self.entries:
+            return
+        self._store(key, asset, self._loader(key)[1], pinned)
+        if isinstance(asset, arcade.Texture):
+            arcade.get_window().ctx.default_atlas.add(asset)
+        self.evict()
+
+    def release(self, owner):
+        """Drop every reference held by an owner
+
+        Args:
+            owner (object): Object previously passed as owner
+        """
+
+        for entry in self.entries.values():
+            entry.owners.discard(owner)
+        self.evict()
+
+    def owners(self, path):
+        """Return the objects currently holding an asset
+
+        Args:
+            path (str): Logical name of the asset
+
+        Returns:
+            list: Live owners of the asset, empty if it is not cached
+        """
+
+        entry = self.entries.get(self._key(path))
+        return list(entry.owners) if entry else []
+
+    def _over_budget(self):
+        return self.memory_used + self.atlas_memory > self.memory_budget
+
+    def evict(self):
+        """Evict unused, unpinned entries (oldest first) until memory use fits the budget
+
+        Decoded sprite atlases go first: they are only needed to cut sprites that are not
+        loaded yet.
+        """
+
+        if not self._over_budget():
+            return
+        with self._atlas_lock:
+            self._atlases.clear()
+            self.atlas_memory = 0
+        textures_evicted = False
+        for key in list(self.entries):
+            if not self._over_budget():
+                break
+            entry = self.entries[key]
+            if entry.pinned or len(entry.owners):
+                continue
+            del self.entries[key]
+            self.memory_used -= entry.size
+            self.evictions += 1
+            textures_evicted = textures_evicted or isinstance(entry.asset, arcade.Texture)
+        entry = None  # ostatnia usunięta tekstura nie może zostać w zmiennej lokalnej
+        if textures_evicted:
+            self._compact_atlas()
+
+    def _compact_atlas(self):
+        """Rebuild the GPU atlas so the space of evicted textures can be reused
+
+        The default atlas drops a texture once nothing references it, but its region is
+        only reused after a rebuild.
+        """
+
+        try:
+            window = arcade.get_window()
+        except RuntimeError:
+            return
+        window.ctx.default_atlas.rebuild()
+
+    def stats(self):
+        """Return cache statistics
+
+        Returns:
+            dict: Entry count, memory used by entries and by decoded atlases, budget, hits,
+                  misses and evictions
+        """
+
+        return {
+            "entries": len(self.entries),
+            "memory_used": self.memory_used,
+            "atlas_memory": self.atlas_memory,
+            "memory_budget": self.memory_budget,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+def _texture_size(path, texture):
+    """Estimate texture memory as RGBA bytes"""
+
+    return texture.width * texture.height * 4
+
+
+cache = AssetCache()
+
+
+def load_texture(path, owner=None):
+    """Shortcut for cache.texture()"""
+
+    return cache.texture(path, owner)
+
+
+def load_sound(path, owner=None):
+    """Shortcut for cache.sound()"""
+
+    return cache.sound(path, owner)
@@ -0,0 +1,170 @@
+import io
+import json
+import mmap
+import struct
+
+# Format paczki: nagłówek (magic, wersja, długość indeksu), indeks JSON, potem dane plików
+MAGIC = b"WCGPACK\0"
+PACK_VERSION = 1
+HEADER = struct.Struct("<8sII")
+ALIGNMENT = 16
+
+
+class PackFile(io.RawIOBase):
+    """Read-only, seekable file object over a slice of a memory-mapped pack
+
+    Reads copy straight from the mapping into the caller's buffer, so decoders never see
+    an intermediate copy of the whole file.
+    """
+
+    def __init__(self, view):
+        """Wrap a memoryview
+
+        Args:
+            view (memoryview): Bytes of a single packed file
+        """
+
+        super().__init__()
+        self._view = view
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        count = max(0, min(len(buffer), len(self._view) - self._position))
+        buffer[:count] = self._view[self._position:self._position + count]
+        self._position += count
+        return count
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        if offset < 0:
+            raise ValueError("negative seek position")
+        self._position = offset
+        return offset
+
+    def tell(self):
+        return self._position
+
+    def close(self):
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+
+class AssetPack:
+    """Single indexed file holding many assets, opened once and memory-mapped
+
+    Files are looked up by their logical name (e.g. "images/heart.png"), independent of
+    the working directory. Besides file offsets the index may carry extra metadata, such
+    as the manifest of the image build.
+    """
+
+    def __init__(self, path):
+        """Open and map a pack, reading its index
+
+        Args:
+            path (str): Path of the pack file
+
+        Raises:
+            ValueError: If the file is not a pack of a supported version
+        """
+
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, index_length = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != PACK_VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not an asset pack of version {PACK_VERSION}")
+        self.index = json.loads(self._map[HEADER.size:HEADER.size + index_length])
+        self.files = self.index.pop("files")
+        self.path = path
+
+    def __contains__(self, name):
+        return name in self.files
+
+    def names(self):
+        """Return the names of all packed files
+
+        Returns:
+            list[str]: Logical names
+        """
+
+        return list(self.files)
+
+    def size(self, name):
+        """Return the size of a packed file in bytes"""
+
+        return self.files[name][1]
+
+    def view(self, name):
+        """Return the bytes of a packed file without copying them
+
+        Args:
+            name (str): Logical name of the file
+
+        Returns:
+            memoryview: Read-only slice of the mapping
+        """
+
+        offset, length = self.files[name]
+        return memoryview(self._map)[offset:offset + length]
+
+    def open(self, name):
+        """Open a packed file for reading
+
+        Args:
+            name (str): Logical name of the file
+
+        Returns:
+            PackFile: File object over the mapped bytes
+        """
+
+        return PackFile(self.view(name))
+
+
+def write_pack(path, files, **metadata):
+    """Write a pack file
+
+    Args:
+        path (str): Output path
+        files (dict): Logical name -> path of the file on disk
+        **metadata: Extra JSON-serializable entries stored in the index
+
+    Returns:
+        dict: Logical name -> (offset, length) of every packed file
+    """
+
+    blobs = {}
+    for name, source in files.items():
+        with open(source, "rb") as f:
+            blobs[name] = f.read()
+
+    # Offsety zależą od długości indeksu, a ta od offsetów - liczymy do skutku
+    index_length = 0
+    while True:
+        offset = HEADER.size + index_length
+        entries = {}
+        for name, data in blobs.items():
+            offset += -offset % ALIGNMENT
+            entries[name] = (offset, len(data))
+            offset += len(data)
+        index = json.dumps({**metadata, "files": entries}, ensure_ascii=False).encode("utf-8")
+        if len(index) <= index_length:
+            break
+        index_length = len(index)
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, PACK_VERSION, index_length))
+        f.write(index.ljust(index_length))
+        for name, data in blobs.items():
+            f.seek(entries[name][0])
+            f.write(data)
+    return entries
@@ -0,0 +1,235 @@
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from profiler import FrameProfiler
+from simulation.engine import Simulation, FIXED_TIMESTEP, OBSTACLE, BONUS, MOVE_UP, MOVE_DOWN
+
+# Benchmark logiki gry bez okna i bez GPU:  python src/benchmark.py --output wyniki.json
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+IMMORTAL_LIVES = 10 ** 9
+INPUT_PERIOD = 0.5  # co ile sekund gry bot zmienia pas
+
+
+def scenario_idle(seed):
+    """Nothing spawns; measures the fixed per-step overhead"""
+
+    sim = Simulation("Łatwy", seed=seed)
+    sim.timeline.next_obstacle_time = sim.timeline.next_bonus_time = math.inf
+    return sim
+
+
+def scenario_easy(seed):
+    """Regular easy game with an immortal player"""
+
+    sim = Simulation("Łatwy", seed=seed)
+    sim.lives = IMMORTAL_LIVES
+    return sim
+
+
+def scenario_hard_max(seed):
+    """Hard game already at maximum speed and minimum obstacle interval"""
+
+    sim = Simulation("Trudny", seed=seed)
+    sim.lives = IMMORTAL_LIVES
+    sim.speed = sim.timeline.speed = sim.max_speed
+    sim.timeline.base_obstacle_interval = 0
+    return sim
+
+
+def scenario_stress(seed, lane_count=8, per_lane=300):
+    """Very wide, many-lane playfield pre-filled with hundreds of entities per lane"""
+
+    width = 120 * per_lane
+    sim = Simulation("Trudny", seed=seed, lane_count=lane_count, width=width, height=600 * lane_count / 3)
+    sim.lives = IMMORTAL_LIVES
+    sim.speed = sim.timeline.speed = sim.max_speed
+    sim.timeline.base_obstacle_interval = 0
+    rng = random.Random(seed)
+    for lane in range(lane_count):
+        for i in range(per_lane):
+            sim.spawn(OBSTACLE if rng.random() < 0.7 else BONUS, lane, 200 + i * 120)
+    sim.events = []
+    return sim
+
+
+SCENARIOS = {
+    "idle": scenario_idle,
+    "easy": scenario_easy,
+    "hard_max": scenario_hard_max,
+    "stress": scenario_stress,
+}
+
+
+def _drive(sim, ticks, seed):
+    """Step a simulation with a seeded bot that changes lanes every INPUT_PERIOD seconds"""
+
+    rng = random.Random(seed)
+    period = max(1, round(INPUT_PERIOD / FIXED_TIMESTEP))
+    for tick in range(ticks):
+        if tick % period == 0:
+            sim.apply_input(rng.choice((MOVE_UP, MOVE_DOWN)))
+        sim.step(FIXED_TIMESTEP)
+
+
+def run_scenario(name, seconds, seed):
+    """Run one scenario three times: plain timing, per-phase profile and memory tracing
+
+    Args:
+        name (str): Key of SCENARIOS
+        seconds (float): Simulated game time per run
+        seed (int): Seed for the simulation and the bot
+
+    Returns:
+        dict: Costs in milliseconds and bytes per simulated second plus run details
+    """
+
+    build = SCENARIOS[name]
+    ticks = round(seconds / FIXED_TIMESTEP)
+
+    sim = build(seed)
+    gc.collect()
+    collections = sum(stat["collections"] for stat in gc.get_stats())
+    start = time.perf_counter()
+    _drive(sim, ticks, seed)
+    elapsed = time.perf_counter() - start
+    collections = sum(stat["collections"] for stat in gc.get_stats()) - collections
+
+    sim = build(seed)
+    profiler = FrameProfiler(window=ticks, max_rows=ticks)
+    sim.profiler = profiler
+    rng = random.Random(seed)
+    period = max(1, round(INPUT_PERIOD / FIXED_TIMESTEP))
+    for tick in range(ticks):
+        if tick % period == 0:
+            sim.apply_input(rng.choice((MOVE_UP, MOVE_DOWN)))
+        profiler.begin()
+        sim.step(FIXED_TIMESTEP)
+        profiler.end_frame()
+    phases = {}
+    for phase in profiler.phases:
+        total_ms = sum(row.get(phase, 0.0) for row in profiler.rows)
+        phases[phase] = total_ms / seconds
+
+    sim = build(seed)
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    _drive(sim, ticks, seed)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "scenario": name,
+        "seed": seed,
+        "simulated_seconds": seconds,
+        "steps": ticks,
+        "update_ms_per_sim_s": elapsed * 1000 / seconds,
+        "realtime_factor": seconds / elapsed if elapsed else math.inf,
+        "spawn_ms_per_sim_s": phases.get("update.spawn", 0.0),
+        "collision_ms_per_sim_s": phases.get("update.collide", 0.0),
+        "move_ms_per_sim_s": phases.get("update.move", 0.0),
+        "cull_ms_per_sim_s": phases.get("update.cull", 0.0),
+        "memory_growth_bytes_per_sim_s": (current - baseline) / seconds,
+        "memory_peak_bytes": peak - baseline,
+        "gc_collections_per_sim_s": collections / seconds,
+        "final_entities": sim.entity_count,
+        "final_score": sim.score,
+    }
+
+
+def run_batch(count, seconds, seed):
+    """Step a batch of independent immortal hard games with NumPy and compare it to the scalar engine
+
+    Args:
+        count (int): Number of games in the batch
+        seconds (float): Simulated game time per game
+        seed (int): Seed of the batch
+
+    Returns:
+        dict: Game steps per wall-clock second and the speed-up over a single Simulation
+    """
+
+    from simulation.batch import BatchEnv
+
+    ticks = round(seconds / FIXED_TIMESTEP)
+    env = BatchEnv(count, "Trudny", seed=seed)
+    env.lives[:] = IMMORTAL_LIVES
+    rng = random.Random(seed)
+    period = max(1, round(INPUT_PERIOD / FIXED_TIMESTEP))
+    start = time.perf_counter()
+    for tick in range(ticks):
+        env.step(rng.choice((MOVE_UP, MOVE_DOWN)) if tick % period == 0 else None)
+    elapsed = time.perf_counter() - start
+
+    scalar = run_scenario("easy", seconds, seed)
+    steps_per_s = count * ticks / elapsed
+    scalar_steps_per_s = scalar["steps"] / (scalar["update_ms_per_sim_s"] * seconds / 1000)
+    return {
+        "scenario": "batch",
+        "games": count,
+        "simulated_seconds": seconds,
+        "game_steps_per_s": steps_per_s,
+        "scalar_game_steps_per_s": scalar_steps_per_s,
+        "speedup": steps_per_s / scalar_steps_per_s,
+    }
+
+
+def _revision():
+    """Return the current git commit, if available"""
+
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=BASE_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    """Run the selected scenarios, print a summary and optionally write JSON results"""
+
+    parser = argparse.ArgumentParser(description="Headless benchmark of the gameplay hot paths")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="scenario to run (repeatable, default: all)")
+    parser.add_argument("--seconds", type=float, default=120, help="simulated seconds per run")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--batch", type=int, metavar="N", help="also run N games at once with the NumPy batch")
+    parser.add_argument("--output", help="path of the JSON results file")
+    args = parser.parse_args(argv)
+
+    results = []
+    for name in args.scenario or list(SCENARIOS):
+        result = run_scenario(name, args.seconds, args.seed)
+        results.append(result)
+        print(f"{name:<10} {result['update_ms_per_sim_s']:8.3f} ms/s  x{result['realtime_factor']:<9.0f}"
+              f" spawn {result['spawn_ms_per_sim_s']:.3f}  collide {result['collision_ms_per_sim_s']:.3f}"
+              f"  mem {result['memory_growth_bytes_per_sim_s']:.0f} B/s")
+    if args.batch:
+        result = run_batch(args.batch, args.seconds, args.seed)
+        results.append(result)
+        print(f"batch x{args.batch:<5} {result['game_steps_per_s']:12.0f} steps/s"
+              f"  scalar {result['scalar_game_steps_per_s']:.0f} steps/s  speed-up x{result['speedup']:.1f}")
+
+    report = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "revision": _revision(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4)
+    return report
+
+
+if __name__ == "__main__":
+    main()
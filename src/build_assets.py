@@ -0,0 +1,195 @@
+import argparse
+import json
+import os
+import sys
+import time
+from PIL import Image
+from asset_pack import write_pack
+from settings import LANE_COUNT, SCREEN_HEIGHT, SCREEN_WIDTH
+from rendering.hud import HEART_SIZE
+from simulation.engine import Simulation
+
+# Przygotowanie grafik w rozmiarach, w jakich są rysowane:  python src/build_assets.py
+# Wynik (atlas, tła, manifest i paczka assets.pack) trafia do assets/build/ i jest używany przez asset_manager.
+
+ASSET_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets")
+IMAGE_FOLDER = os.path.join(ASSET_ROOT, "images")
+SOUND_FOLDER = os.path.join(ASSET_ROOT, "sounds")
+BUILD_FOLDER = os.path.join(ASSET_ROOT, "build")
+MANIFEST_NAME = "manifest.json"
+ATLAS_NAME = "atlas.png"
+PACK_NAME = "assets.pack"
+MANIFEST_VERSION = 2
+ATLAS_WIDTH = 256
+PADDING = 2  # odstęp między obrazkami w atlasie, żeby filtrowanie nie łapało sąsiadów
+
+# Tła są rozciągane na cały ekran i nie mieszczą się sensownie w atlasie
+BACKGROUNDS = ("city.png", "city1.png")
+SPRITES = ("girl_avatar.png", "szczur.png", "notes.png", "heart.png")
+
+
+def target_sizes(width=SCREEN_WIDTH, height=SCREEN_HEIGHT, lane_count=LANE_COUNT):
+    """Return the on-screen size of every image for a screen layout
+
+    Args:
+        width (int, optional): Screen width. Defaults to SCREEN_WIDTH
+        height (int, optional): Screen height. Defaults to SCREEN_HEIGHT
+        lane_count (int, optional): Number of lanes. Defaults to LANE_COUNT
+
+    Returns:
+        dict: File name -> (width or None to keep the aspect ratio, height) in pixels
+    """
+
+    lane_height = Simulation(width=width, height=height, lane_count=lane_count).lane_height
+    return {
+        "city.png": (width, height),
+        "city1.png": (width, height),
+        "girl_avatar.png": (None, lane_height),
+        "szczur.png": (None, lane_height * 0.5),
+        "notes.png": (None, lane_height * 0.5),
+        "heart.png": (HEART_SIZE, HEART_SIZE),
+    }
+
+
+def _resize(image, size):
+    """Downsample an image to (width or None, height), never enlarging it"""
+
+    width, height = size
+    if width is None:
+        width = image.width * height / image.height
+    width, height = round(width), round(height)
+    if width >= image.width and height >= image.height:
+        return image
+    return image.resize((width, height), Image.LANCZOS)
+
+
+def pack(images, atlas_width=ATLAS_WIDTH, padding=PADDING):
+    """Place images on shelves of an atlas, tallest first
+
+    Args:
+        images (dict): Name -> PIL image
+        atlas_width (int, optional): Width of the atlas. Defaults to ATLAS_WIDTH
+        padding (int, optional): Empty pixels around every image. Defaults to PADDING
+
+    Returns:
+        tuple: (atlas PIL image, dict name -> [x, y, width, height] from the top-left corner)
+    """
+
+    regions = {}
+    x = y = shelf_height = 0
+    for name in sorted(images, key=lambda name: -images[name].height):
+        image = images[name]
+        if x + image.width + padding > atlas_width:
+            x, y = 0, y + shelf_height
+            shelf_height = 0
+        regions[name] = [x + padding, y + padding, image.width, image.height]
+        x += image.width + padding
+        shelf_height = max(shelf_height, image.height + padding)
+    atlas_height = y + shelf_height + padding
+
+    atlas = Image.new("RGBA", (atlas_width, atlas_height), (0, 0, 0, 0))
+    for name, (left, top, _, _) in regions.items():
+        atlas.paste(images[name], (left, top))
+    return atlas, regions
+
+
+def build(output=BUILD_FOLDER, width=SCREEN_WIDTH, height=SCREEN_HEIGHT, lane_count=LANE_COUNT):
+    """Downsample every image, pack the sprites into an atlas and write the manifest
+
+    Manifest keys are the logical names used with asset_manager ("images/city.png"),
+    and files are named relative to the assets folder ("build/atlas.png").
+
+    Args:
+        output (str, optional): Output folder. Defaults to BUILD_FOLDER
+        width (int, optional): Screen width. Defaults to SCREEN_WIDTH
+        height (int, optional): Screen height. Defaults to SCREEN_HEIGHT
+        lane_count (int, optional): Number of lanes. Defaults to LANE_COUNT
+
+    Returns:
+        dict: The written manifest
+    """
+
+    os.makedirs(output, exist_ok=True)
+    sizes = target_sizes(width, height, lane_count)
+    manifest = {"version": MANIFEST_VERSION, "screen": [width, height], "lane_count": lane_count, "images": {}}
+
+    for name in BACKGROUNDS:
+        with Image.open(os.path.join(IMAGE_FOLDER, name)) as source:
+            image = _resize(source.convert("RGBA"), sizes[name])
+        image.save(os.path.join(output, name), optimize=True)
+        manifest["images"][f"images/{name}"] = {"file": f"build/{name}"}
+
+    sprites = {}
+    for name in SPRITES:
+        with Image.open(os.path.join(IMAGE_FOLDER, name)) as source:
+            sprites[name] = _resize(source.convert("RGBA"), sizes[name])
+    atlas, regions = pack(sprites)
+    atlas.save(os.path.join(output, ATLAS_NAME), optimize=True)
+    for name, region in regions.items():
+        manifest["images"][f"images/{name}"] = {"file": f"build/{ATLAS_NAME}", "region": region}
+
+    with open(os.path.join(output, MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=4)
+    return manifest
+
+
+def pack_assets(manifest, output=BUILD_FOLDER):
+    """Write every image, sound and built file into a single pack
+
+    Args:
+        manifest (dict): Manifest returned by build(), stored in the pack's index
+        output (str, optional): Folder of the built files and of the pack. Defaults to BUILD_FOLDER
+
+    Returns:
+        str: Path of the written pack
+    """
+
+    files = {}
+    for prefix, folder in (("images", IMAGE_FOLDER), ("sounds", SOUND_FOLDER)):
+        for name in sorted(os.listdir(folder)):
+            files[f"{prefix}/{name}"] = os.path.join(folder, name)
+    for entry in manifest["images"].values():
+        files[entry["file"]] = os.path.join(output, os.path.basename(entry["file"]))
+
+    path = os.path.join(output, PACK_NAME)
+    write_pack(path, files, build=manifest)
+    return path
+
+
+def _folder_size(paths):
+    return sum(os.path.getsize(path) for path in paths)
+
+
+def main(argv=None):
+    """Build the assets and print how much smaller they are than the sources"""
+
+    parser = argparse.ArgumentParser(description="Offline build of pre-scaled images and the sprite atlas")
+    parser.add_argument("--output", default=BUILD_FOLDER)
+    parser.add_argument("--width", type=int, default=SCREEN_WIDTH)
+    parser.add_argument("--height", type=int, default=SCREEN_HEIGHT)
+    parser.add_argument("--lane-count", type=int, default=LANE_COUNT)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    manifest = build(args.output, args.width, args.height, args.lane_count)
+    pack_path = pack_assets(manifest, args.output)
+    elapsed = time.perf_counter() - start
+
+    sources = [os.path.join(IMAGE_FOLDER, name) for name in BACKGROUNDS + SPRITES]
+    outputs = {os.path.join(args.output, os.path.basename(entry["file"])) for entry in manifest["images"].values()}
+    pixels_before = pixels_after = 0
+    for path in sources:
+        with Image.open(path) as image:
+            pixels_before += image.width * image.height
+    for path in outputs:
+        with Image.open(path) as image:
+            pixels_after += image.width * image.height
+    print(f"{len(manifest['images'])} images -> {len(outputs)} files in {elapsed:.1f} s")
+    print(f"files   {_folder_size(sources) / 1024:8.0f} KiB -> {_folder_size(outputs) / 1024:8.0f} KiB")
+    print(f"texture {pixels_before * 4 / 1024:8.0f} KiB -> {pixels_after * 4 / 1024:8.0f} KiB (RGBA)")
+    print(f"pack    {os.path.getsize(pack_path) / 1024:8.0f} KiB  {pack_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,324 @@
+import argparse
+import hashlib
+import itertools
+import json
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, fields, replace
+import numpy as np
+from simulation.batch import BatchEnv
+from simulation.engine import Simulation, DIFFICULTIES, FIXED_TIMESTEP, OBSTACLE
+
+# Przegląd parametrów trudności na wszystkich rdzeniach, np.:
+#   python src/difficulty_sweep.py --base Łatwy --param speed=300,400,500 --param double_chance=0.2,0.33
+# Wyniki punktów siatki są zapisywane w src/sweeps/ i przy kolejnym uruchomieniu tylko wczytywane.
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(BASE_DIR, "sweeps")
+CACHE_VERSION = 1
+CHUNK_GAMES = {"reflex": 1000, "lookahead": 50}  # wektorowy bot potrzebuje większych paczek
+HISTOGRAM_BINS = 10
+PLAYERS = ("reflex", "lookahead")
+POSITIVE_PARAMETERS = ("speed", "max_speed", "obstacle_interval", "bonus_interval")  # przy zerze lub mniej symulacja dzieli przez zero
+BONUS_WEIGHT = 0.25  # ile sekund zapasu bot lookahead odda za jeden bonus
+
+
+def reflex_actions(env, observation, danger_time):
+    """Vectorized scripted player: dodge the obstacle ahead, otherwise steer towards a safe bonus
+
+    Args:
+        env (BatchEnv): Batch being played
+        observation (dict): Result of env.observe()
+        danger_time (float): Seconds before contact at which an obstacle is dodged
+
+    Returns:
+        np.ndarray: Lane change per game
+    """
+
+    rows = np.arange(env.count)
+    lane = observation["player_lane"]
+    speed = observation["speed"][:, None]
+    obstacle = observation["nearest"][:, :, 0] / speed
+    bonus = observation["nearest"][:, :, 1] / speed
+    up = np.minimum(lane + 1, env.lane_count - 1)
+    down = np.maximum(lane - 1, 0)
+
+    current = obstacle[rows, lane]
+    up_time = np.where(lane + 1 < env.lane_count, obstacle[rows, up], -math.inf)
+    down_time = np.where(lane > 0, obstacle[rows, down], -math.inf)
+    best = np.where(up_time >= down_time, 1, -1)
+    dodge = (current < danger_time) & (np.maximum(up_time, down_time) > current)
+
+    def attractive(target, valid):
+        return valid & (bonus[rows, target] < obstacle[rows, target]) & (obstacle[rows, target] > danger_time)
+
+    here = attractive(lane, True)
+    seek = np.where(attractive(up, lane + 1 < env.lane_count), 1,
+                    np.where(attractive(down, lane > 0), -1, 0))
+    return np.where(dodge, best, np.where((current >= danger_time) & ~here, seek, 0))
+
+
+def _lane_value(sim, lane, horizon):
+    """Seconds until the first obstacle in a lane (capped at horizon) plus a reward for bonuses before it"""
+
+    value = 0.0
+    for contact, entity in sim.contacts(lane):
+        if contact > horizon:
+            break
+        if entity.kind == OBSTACLE:
+            return contact + value
+        value += BONUS_WEIGHT
+    return horizon + value
+
+
+def lookahead_action(sim, horizon):
+    """Scalar player that searches the reachable lanes and picks the one with the most time to spare
+
+    Args:
+        sim (Simulation): Simulation being played
+        horizon (float): How far ahead, in seconds, contacts are considered
+
+    Returns:
+        int: Lane change, 0 to stay
+    """
+
+    lane = sim.player_lane
+    best, best_value = 0, _lane_value(sim, lane, horizon)
+    for direction in (1, -1):
+        if 0 <= lane + direction < sim.lane_count:
+            value = _lane_value(sim, lane + direction, horizon)
+            if value > best_value:
+                best, best_value = direction, value
+    return best
+
+
+def _play_reflex(difficulty, games, seed, max_seconds, reaction):
+    env = BatchEnv(games, difficulty, seed=seed)
+    period = max(1, round(reaction / FIXED_TIMESTEP))
+    phase = np.arange(games) % period  # gracze nie reagują wszyscy w tym samym kroku
+    observation = env.observe()
+    for tick in range(round(max_seconds / FIXED_TIMESTEP)):
+        actions = np.where(phase == tick % period, reflex_actions(env, observation, reaction * 2), 0)
+        observation = env.step(actions)
+        if observation["done"].all():
+            break
+    return env.time.tolist(), env.score.tolist()
+
+
+def _play_lookahead(difficulty, games, seed, max_seconds, reaction):
+    period = max(1, round(reaction / FIXED_TIMESTEP))
+    ticks = round(max_seconds / FIXED_TIMESTEP)
+    times, scores = [], []
+    for game in range(games):
+        sim = Simulation(difficulty, seed=seed * 1_000_003 + game)
+        for tick in range(ticks):
+            if sim.game_over:
+                break
+            if tick % period == 0:
+                direction = lookahead_action(sim, reaction * 4)
+                if direction:
+                    sim.apply_input(direction)
+            sim.step(FIXED_TIMESTEP)
+        times.append(sim.time)
+        scores.append(sim.score)
+    return times, scores
+
+
+def play_chunk(task):
+    """Play one chunk of games of a grid point; runs in a worker process
+
+    Args:
+        task (tuple): (difficulty, player, games, seed, max_seconds, reaction)
+
+    Returns:
+        tuple: (survival times, scores) of every game in the chunk
+    """
+
+    difficulty, player, games, seed, max_seconds, reaction = task
+    play = _play_reflex if player == "reflex" else _play_lookahead
+    return play(difficulty, games, seed, max_seconds, reaction)
+
+
+def summarize(times, scores, max_seconds):
+    """Reduce per-game results to distribution statistics
+
+    Args:
+        times (list of float): Survival time of every game
+        scores (list of int): Final score of every game
+        max_seconds (float): Time limit of a game
+
+    Returns:
+        dict: Means, percentiles, the share of games that reached the limit and a survival histogram
+    """
+
+    times = np.asarray(times)
+    scores = np.asarray(scores)
+    counts, _ = np.histogram(np.minimum(times, max_seconds), bins=HISTOGRAM_BINS, range=(0, max_seconds))
+    summary = {"games": int(times.size)}
+    for name, values in (("survival", times), ("score", scores)):
+        summary[f"{name}_mean"] = float(values.mean())
+        for q in (10, 50, 90):
+            summary[f"{name}_p{q}"] = float(np.percentile(values, q))
+    summary["survived_share"] = float((times >= max_seconds - FIXED_TIMESTEP).mean())
+    summary["survival_histogram"] = counts.tolist()
+    return summary
+
+
+def point_key(params):
+    """Return the cache key of a grid point
+
+    Args:
+        params (dict): Everything that influences the result of the point
+
+    Returns:
+        str: Hex digest of the canonical JSON form of params
+    """
+
+    return hashlib.sha256(json.dumps(params, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def _load_cached(key):
+    try:
+        with open(os.path.join(CACHE_DIR, key + ".json"), "r", encoding="utf-8") as f:
+            return json.load(f)["summary"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _store_cached(key, params, summary):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = os.path.join(CACHE_DIR, key + ".json")
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump({"params": params, "summary": summary}, f, indent=4)
+    os.replace(path + ".tmp", path)
+
+
+def parse_grid(base, specs):
+    """Build the grid of difficulty presets from --param specifications
+
+    Args:
+        base (str): Name of the preset the grid starts from
+        specs (list of str): Entries like "speed=300,400,500"
+
+    Returns:
+        tuple: (list of swept parameter names, list of Difficulty)
+
+    Raises:
+        ValueError: If a parameter is not a Difficulty field, has no values, or a speed or
+            interval is not positive
+    """
+
+    names = [field.name for field in fields(DIFFICULTIES[base])]
+    axes = {}
+    for spec in specs:
+        name, _, values = spec.partition("=")
+        if name not in names or not values:
+            raise ValueError(f"expected NAME=V1,V2,... with NAME one of {', '.join(names)}: {spec!r}")
+        axes[name] = [float(value) for value in values.split(",")]
+        if name in POSITIVE_PARAMETERS and not all(value > 0 for value in axes[name]):
+            raise ValueError(f"{name} must be positive: {spec!r}")
+    swept = list(axes)
+    grid = [replace(DIFFICULTIES[base], **dict(zip(swept, values))) for values in itertools.product(*axes.values())]
+    return swept, grid
+
+
+def sweep(grid, player="reflex", games=2000, seed=1234, max_seconds=300, reaction=0.2,
+          workers=None, use_cache=True):
+    """Play every grid point, reusing cached points and spreading the rest over a process pool
+
+    Args:
+        grid (list of Difficulty): Presets to evaluate
+        player (str, optional): "reflex" (vectorized script) or "lookahead" (lane search). Defaults to "reflex"
+        games (int, optional): Games per point. Defaults to 2000
+        seed (int, optional): Base seed; every point plays the same seeds. Defaults to 1234
+        max_seconds (float, optional): Time limit of a game. Defaults to 300
+        reaction (float, optional): Seconds between the player's decisions. Defaults to 0.2
+        workers (int, optional): Number of processes. Defaults to the number of CPUs
+        use_cache (bool, optional): Read and write cached points. Defaults to True
+
+    Returns:
+        list of dict: One result per point with its parameters, cache key, summary and whether it was cached
+    """
+
+    results = []
+    tasks = []
+    for difficulty in grid:
+        params = {"version": CACHE_VERSION, "chunk": CHUNK_GAMES[player], "difficulty": asdict(difficulty), "player": player,
+                  "games": games, "seed": seed, "max_seconds": max_seconds, "reaction": reaction}
+        key = point_key(params)
+        summary = _load_cached(key) if use_cache else None
+        results.append({"difficulty": asdict(difficulty), "key": key, "params": params,
+                        "summary": summary, "cached": summary is not None})
+        if summary is None:
+            size = CHUNK_GAMES[player]
+            for chunk, start in enumerate(range(0, games, size)):
+                chunk_seed = seed + chunk * 7919
+                task = (difficulty, player, min(size, games - start), chunk_seed, max_seconds, reaction)
+                tasks.append((len(results) - 1, task))
+
+    if tasks:
+        collected = {}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            outcomes = pool.map(play_chunk, [task for _, task in tasks])
+            for (index, _), (times, scores) in zip(tasks, outcomes):
+                point_times, point_scores = collected.setdefault(index, ([], []))
+                point_times.extend(times)
+                point_scores.extend(scores)
+        for index, (times, scores) in collected.items():
+            result = results[index]
+            result["summary"] = summarize(times, scores, max_seconds)
+            if use_cache:
+                _store_cached(result["key"], result["params"], result["summary"])
+
+    for result in results:
+        del result["params"]
+    return results
+
+
+def main(argv=None):
+    """Sweep the requested grid, print a table of distributions and optionally write JSON results"""
+
+    parser = argparse.ArgumentParser(description="Monte Carlo sweep of the difficulty parameters")
+    parser.add_argument("--base", choices=sorted(DIFFICULTIES), default="Łatwy", help="preset the grid starts from")
+    parser.add_argument("--param", action="append", default=[], metavar="NAME=V1,V2",
+                        help="values of one Difficulty field (repeatable)")
+    parser.add_argument("--player", choices=PLAYERS, default="reflex")
+    parser.add_argument("--games", type=int, default=2000, help="games per grid point")
+    parser.add_argument("--max-seconds", type=float, default=300, help="time limit of one game")
+    parser.add_argument("--reaction", type=float, default=0.2, help="seconds between the player's decisions")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--workers", type=int, help="number of processes (default: all CPUs)")
+    parser.add_argument("--no-cache", action="store_true", help="ignore and do not write cached points")
+    parser.add_argument("--output", help="path of the JSON results file")
+    args = parser.parse_args(argv)
+
+    try:
+        swept, grid = parse_grid(args.base, args.param)
+    except ValueError as e:
+        parser.error(str(e))
+
+    start = time.perf_counter()
+    results = sweep(grid, args.player, args.games, args.seed, args.max_seconds, args.reaction,
+                    args.workers, not args.no_cache)
+    elapsed = time.perf_counter() - start
+
+    for result in results:
+        point = "  ".join(f"{name}={result['difficulty'][name]:g}" for name in swept) or args.base
+        summary = result["summary"]
+        print(f"{point:<40} survival p10/p50/p90 {summary['survival_p10']:6.1f} {summary['survival_p50']:6.1f}"
+              f" {summary['survival_p90']:6.1f} s  score p50/p90 {summary['score_p50']:5.0f}"
+              f" {summary['score_p90']:5.0f}  full {summary['survived_share']:5.1%}"
+              f"{'  (cache)' if result['cached'] else ''}")
+    print(f"{len(results)} points in {elapsed:.1f} s")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"base": args.base, "player": args.player, "games": args.games,
+                       "max_seconds": args.max_seconds, "results": results}, f, indent=4)
+    return results
+
+
+if __name__ == "__main__":
+    main()
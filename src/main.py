@@ -1,17 +1,23 @@
 import arcade
+import asset_manager
+import score_manager
 from views.main_menu import MainMenuView
-from settings import SCREEN_HEIGHT, SCREEN_WIDTH
+from views.loading import LoadingView
+from settings import SCREEN_HEIGHT, SCREEN_WIDTH, TEXTURE_ATLAS_SIZE
 
 SCREEN_TITLE = "Wrocław City Girl"
 
 def main():
     """
-    Create the game window, set the main menu view and start the Arcade event loop.
+    Create the game window, start the Arcade event loop and preload shared assets in the background,
+    showing a loading screen until the main menu can be displayed.
+    Pending scores are flushed to disk once the window closes.
     """
     window = arcade.Window(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE)
-    menu_view = MainMenuView()
-    window.show_view(menu_view)
+    window.ctx.atlas_size = (TEXTURE_ATLAS_SIZE, TEXTURE_ATLAS_SIZE)
+    window.show_view(LoadingView(asset_manager.PRELOAD_MANIFEST, MainMenuView, pinned=True))
     arcade.run()
+    score_manager.flush()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,319 @@
+import threading
+import wave
+import numpy as np
+import pyglet
+from pyglet.media.codecs.base import AudioData, AudioFormat
+import asset_manager
+from settings import MUSIC_BUFFER_BYTES, MUSIC_CROSSFADE, MUSIC_VOLUME
+
+MENU_MUSIC = "sounds/boba.wav"
+GAME_MUSIC = "sounds/tram.wav"
+
+# Wszystkie utwory są miksowane do jednego formatu: 16 bitów, stereo, 44,1 kHz
+SAMPLE_RATE = 44100
+CHANNELS = 2
+FRAME_BYTES = CHANNELS * 2
+CHUNK_FRAMES = 4096  # ile ramek dekoder czyta z pliku naraz
+
+
+class RingBuffer:
+    """Fixed-size byte queue between one writing and one reading thread"""
+
+    def __init__(self, capacity):
+        """Allocate the buffer
+
+        Args:
+            capacity (int): Size in bytes; never grows
+        """
+
+        self.data = bytearray(capacity)
+        self.capacity = capacity
+        self.start = 0
+        self.size = 0
+        self.closed = False
+        self.condition = threading.Condition()
+
+    def write(self, chunk):
+        """Append bytes, waiting until there is room for all of them
+
+        Args:
+            chunk (bytes): Data no longer than the capacity
+
+        Returns:
+            bool: False if the buffer was closed instead
+        """
+
+        with self.condition:
+            while self.capacity - self.size < len(chunk) and not self.closed:
+                self.condition.wait()
+            if self.closed:
+                return False
+            end = (self.start + self.size) % self.capacity
+            first = min(len(chunk), self.capacity - end)
+            self.data[end:end + first] = chunk[:first]
+            self.data[:len(chunk) - first] = chunk[first:]
+            self.size += len(chunk)
+            return True
+
+    def read(self, count):
+        """Take up to count bytes without waiting
+
+        Args:
+            count (int): Maximum number of bytes
+
+        Returns:
+            bytes: The oldest buffered bytes, shorter than count if the writer fell behind
+        """
+
+        with self.condition:
+            count = min(count, self.size)
+            first = min(count, self.capacity - self.start)
+            chunk = bytes(self.data[self.start:self.start + first]) + bytes(self.data[:count - first])
+            self.start = (self.start + count) % self.capacity
+            self.size -= count
+            self.condition.notify()
+            return chunk
+
+    def close(self):
+        """Wake up and stop the writer"""
+
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+
+def to_output(frames, sample_width, channels):
+    """Convert PCM frames to 16-bit stereo
+
+    Args:
+        frames (bytes): Little-endian PCM data
+        sample_width (int): Bytes per sample (1, 2 or 3)
+        channels (int): 1 or 2
+
+    Returns:
+        bytes: 16-bit stereo PCM
+    """
+
+    if sample_width == 1:
+        samples = (np.frombuffer(frames, np.uint8).astype(np.int16) - 128) << 8
+    elif sample_width == 3:
+        # Z 24 bitów zostają dwa najstarsze bajty każdej próbki
+        samples = np.frombuffer(frames, np.uint8).reshape(-1, 3)[:, 1:].copy().view("<i2").ravel()
+    else:
+        samples = np.frombuffer(frames, "<i2")
+    if channels == 1:
+        samples = np.repeat(samples, 2)
+    return samples.tobytes()
+
+
+class Track:
+    """A looping WAV track decoded chunk by chunk into a ring buffer on its own thread
+
+    When the file ends the decoder rewinds and keeps writing, so the loop point has no
+    gap. Only the ring buffer and one chunk are resident, whatever the track's length.
+    """
+
+    def __init__(self, name, buffer_bytes):
+        """Open the track and start decoding
+
+        Args:
+            name (str): Logical name of a PCM WAV file at 44.1 kHz
+            buffer_bytes (int): Size of the ring buffer
+
+        Raises:
+            ValueError: If the file is not in a supported format
+        """
+
+        self.name = name
+        self.file = asset_manager.cache.open(name)
+        self.wave = wave.open(self.file, "rb")
+        self.sample_width = self.wave.getsampwidth()
+        self.channels = self.wave.getnchannels()
+        if (self.wave.getframerate() != SAMPLE_RATE or self.sample_width not in (1, 2, 3)
+                or self.channels not in (1, 2)):
+            self.file.close()
+            raise ValueError(f"{name}: music must be 8, 16 or 24-bit PCM at {SAMPLE_RATE} Hz")
+
+        self.buffer = RingBuffer(buffer_bytes - buffer_bytes % FRAME_BYTES)
+        self.gain = 0.0
+        self.target = 1.0
+        self.loops = 0
+        self.primed = False
+        self.thread = threading.Thread(target=self._decode, name=f"music-{name}", daemon=True)
+        self.thread.start()
+
+    def _decode(self):
+        try:
+            while True:
+                frames = self.wave.readframes(CHUNK_FRAMES)
+                if not frames:
+                    self.wave.rewind()
+                    self.loops += 1
+                    continue
+                if not self.buffer.write(to_output(frames, self.sample_width, self.channels)):
+                    break
+        finally:
+            self.file.close()
+
+    def close(self):
+        """Stop the decoder thread; it closes the file on its way out"""
+
+        self.buffer.close()
+
+
+class MusicStream(pyglet.media.StreamingSource):
+    """Endless pyglet source filled by MusicPlayer.mix() on the audio thread"""
+
+    def __init__(self, music_player):
+        self.audio_format = AudioFormat(channels=CHANNELS, sample_size=16, sample_rate=SAMPLE_RATE)
+        self._music_player = music_player
+
+    def is_precise(self):
+        return True
+
+    def get_audio_data(self, num_bytes, compensation_time=0.0):
+        data = self._music_player.mix(num_bytes - num_bytes % FRAME_BYTES)
+        return AudioData(data, len(data))
+
+
+class MusicPlayer:
+    """Background music streamed from disk with cross-fades between tracks
+
+    Each track decodes on its own thread into a small ring buffer; the audio thread
+    mixes whatever tracks are active, ramping their gains so that switching tracks
+    fades the old one out while the new one fades in. A buffer that runs dry plays
+    silence instead of stalling the audio thread and is counted as an underrun.
+    """
+
+    def __init__(self, volume=MUSIC_VOLUME, crossfade=MUSIC_CROSSFADE, buffer_bytes=MUSIC_BUFFER_BYTES):
+        """Initialize a silent player
+
+        Args:
+            volume (float, optional): Music volume from 0.0 to 1.0. Defaults to MUSIC_VOLUME
+            crossfade (float, optional): Duration of a fade in seconds. Defaults to MUSIC_CROSSFADE
+            buffer_bytes (int, optional): Ring buffer size of a single track. Defaults to MUSIC_BUFFER_BYTES
+        """
+
+        self.volume = volume
+        self.crossfade = crossfade
+        self.buffer_bytes = buffer_bytes
+        self.tracks = []
+        self.current = None
+        self.underruns = 0
+        self.lock = threading.Lock()
+        self._player = None
+
+    def play(self, name):
+        """Fade to a track, looping it until another one is requested
+
+        Requesting the track that is already playing does nothing; requesting one that
+        is still fading out fades it back in from where it is.
+
+        Args:
+            name (str): Logical name of the track, e.g. MENU_MUSIC
+        """
+
+        if self.current is not None and self.current.name == name:
+            return
+        # Wyszukanie i przywrócenie wygaszanej ścieżki w jednej sekcji krytycznej: inaczej
+        # mix() mógłby ją w międzyczasie zamknąć i usunąć, a play() dodałby ją z powrotem zamkniętą
+        with self.lock:
+            track = next((track for track in self.tracks if track.name == name), None)
+            if track is not None:
+                self._fade_to(track)
+        if track is None:
+            # Nowa ścieżka otwiera plik poza blokadą, żeby wątek audio nie czekał na dysk;
+            # mix() nie widzi jej, dopóki nie trafi do self.tracks
+            track = Track(name, self.buffer_bytes)
+            with self.lock:
+                self.tracks.append(track)
+                self._fade_to(track)
+
+        if self._player is None:
+            self._player = pyglet.media.Player()
+            self._player.queue(MusicStream(self))
+            self._player.play()
+
+    def _fade_to(self, track):
+        """Fade every other track out and the given one in; the caller holds the lock"""
+
+        for other in self.tracks:
+            other.target = 0.0
+        track.target = 1.0
+        self.current = track
+
+    def stop(self):
+        """Fade out every track"""
+
+        with self.lock:
+            for track in self.tracks:
+                track.target = 0.0
+            self.current = None
+
+    def mix(self, num_bytes):
+        """Mix the next block of every active track (called on the audio thread)
+
+        Args:
+            num_bytes (int): Requested amount of 16-bit stereo data, a multiple of the frame size
+
+        Returns:
+            bytes: Exactly num_bytes of audio
+        """
+
+        frames = num_bytes // FRAME_BYTES
+        mixed = np.zeros(frames * CHANNELS, np.float32)
+        step = frames / (SAMPLE_RATE * self.crossfade)
+        with self.lock:
+            tracks = list(self.tracks)
+
+        finished = []
+        for track in tracks:
+            data = track.buffer.read(num_bytes)
+            if len(data) < num_bytes and track.primed:
+                self.underruns += 1
+            track.primed = track.primed or bool(data)
+            if track.gain < track.target:
+                gain = min(track.gain + step, track.target)
+            else:
+                gain = max(track.gain - step, track.target)
+            samples = np.frombuffer(data, np.int16)
+            ramp = np.repeat(np.linspace(track.gain, gain, frames, endpoint=False, dtype=np.float32), CHANNELS)
+            mixed[:len(samples)] += samples * ramp[:len(samples)]
+            track.gain = gain
+            if gain == 0.0 and track.target == 0.0:
+                finished.append(track)
+
+        if finished:
+            with self.lock:
+                for track in finished:
+                    if track.target == 0.0 and track in self.tracks:
+                        self.tracks.remove(track)
+                        track.close()
+        mixed *= self.volume
+        return np.clip(mixed, -32768, 32767).astype(np.int16).tobytes()
+
+    def stats(self):
+        """Return streaming statistics
+
+        Returns:
+            dict: Active tracks, bytes held in ring buffers, loops completed and underruns
+        """
+
+        with self.lock:
+            tracks = list(self.tracks)
+        return {
+            "tracks": [track.name for track in tracks],
+            "resident_bytes": sum(track.buffer.capacity for track in tracks),
+            "buffered_bytes": sum(track.buffer.size for track in tracks),
+            "loops": sum(track.loops for track in tracks),
+            "underruns": self.underruns,
+        }
+
+
+player = MusicPlayer()
+
+
+def play(name):
+    """Shortcut for player.play()"""
+
+    player.play(name)
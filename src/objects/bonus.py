@@ -1,5 +1,5 @@
 import arcade
-import os
+import asset_manager
 
 class Bonus(arcade.Sprite):
     """A collectible bonus sprite that moves horizontally across the screen"""
@@ -11,8 +11,8 @@ class Bonus(arcade.Sprite):
         """Load the shared texture for all bonus instances if not already loaded"""
 
         if cls.shared_texture is None:
-            path = os.path.join("assets", "images", "notes.png")
-            cls.shared_texture = arcade.load_texture(path)
+            path = "images/notes.png"
+            cls.shared_texture = asset_manager.load_texture(path)
 
     def __init__(self, x, y, speed=1.0, lane_height=100):
         """Initialize a Bonus instance with position, speed, and scaling based on lane height
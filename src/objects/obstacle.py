@@ -1,5 +1,5 @@
 import arcade
-import os
+import asset_manager
 
 class Obstacle(arcade.Sprite):
     """A moving obstacle sprite that represents a hazard on screen. Inherits from arcade.sprite"""
@@ -11,8 +11,8 @@ class Obstacle(arcade.Sprite):
         """Load the shared texture for all obstacle instances if not already loaded"""
 
         if cls.shared_texture is None:
-            path = os.path.join("assets", "images", "szczur.png")
-            cls.shared_texture = arcade.load_texture(path)
+            path = "images/szczur.png"
+            cls.shared_texture = asset_manager.load_texture(path)
 
     def __init__(self, x, y, speed=200, width=0, height=0):
         """Initialize an Obstacle instance with position, speed, and optional scaling
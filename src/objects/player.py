@@ -1,5 +1,5 @@
 import arcade
-import os
+import asset_manager
 
 class Player(arcade.Sprite):
     """A controllable player character that moves vertically between lanes"""
@@ -20,9 +20,9 @@ class Player(arcade.Sprite):
 
         self.fixed_x = 100
 
-        # Wczytaj teksturę ręcznie
-        avatar_path = os.path.join("assets", "images", "girl_avatar.png")
-        self.texture = arcade.load_texture(avatar_path)
+        # Tekstura pochodzi ze wspólnej pamięci podręcznej zasobów
+        avatar_path = "images/girl_avatar.png"
+        self.texture = asset_manager.load_texture(avatar_path)
 
         # Oblicz skalę na podstawie wysokości toru
         self.scale = lane_height / self.texture.height
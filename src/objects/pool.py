@@ -0,0 +1,115 @@
+import arcade
+
+
+class SpritePool:
+    """Recycles pre-built sprites of a single kind instead of allocating new ones
+
+    All sprites, active or not, live permanently in one SpriteList; inactive ones are
+    simply hidden, so handing a sprite out or taking it back never allocates nor
+    mutates the list.
+    """
+
+    def __init__(self, factory, size=0):
+        """Initialize the pool and pre-build sprites
+
+        Args:
+            factory (Callable[[], arcade.Sprite]): Builds a new, already scaled sprite
+            size (int, optional): Number of sprites to build up front. Defaults to 0
+        """
+
+        self.factory = factory
+        self.sprite_list = arcade.SpriteList()
+        self.free = []
+        self.created = 0
+        self.acquired = 0
+        self.reused = 0
+        self.grow(size)
+
+    def grow(self, count):
+        """Build additional hidden sprites
+
+        Args:
+            count (int): Number of sprites to add
+        """
+
+        for _ in range(count):
+            sprite = self.factory()
+            sprite.visible = False
+            self.sprite_list.append(sprite)
+            self.free.append(sprite)
+            self.created += 1
+
+    def acquire(self, x, y, speed):
+        """Hand out a sprite placed at (x, y), growing the pool if it is empty
+
+        Args:
+            x (float): Horizontal position
+            y (float): Vertical position
+            speed (float): Horizontal speed stored on the sprite
+
+        Returns:
+            arcade.Sprite: A visible sprite owned by the caller until released
+        """
+
+        self.acquired += 1
+        if self.free:
+            self.reused += 1
+        else:
+            self.grow(1)
+        sprite = self.free.pop()
+        sprite.center_x = x
+        sprite.center_y = y
+        sprite.speed = speed
+        sprite.visible = True
+        return sprite
+
+    def release(self, sprite):
+        """Return a sprite to the pool
+
+        Args:
+            sprite (arcade.Sprite): Sprite previously obtained from acquire()
+        """
+
+        sprite.visible = False
+        self.free.append(sprite)
+
+    def release_all(self):
+        """Return every sprite to the pool"""
+
+        for sprite in self.sprite_list:
+            sprite.visible = False
+        self.free = list(self.sprite_list)
+
+    @property
+    def size(self):
+        """int: Total number of sprites owned by the pool"""
+
+        return len(self.sprite_list)
+
+    @property
+    def active(self):
+        """int: Number of sprites currently handed out"""
+
+        return len(self.sprite_list) - len(self.free)
+
+    @property
+    def hit_rate(self):
+        """float: Fraction of acquisitions served without building a new sprite"""
+
+        return self.reused / self.acquired if self.acquired else 1.0
+
+    def stats(self):
+        """Return pool statistics
+
+        Returns:
+            dict: Pool size, active and free counts, created sprites, acquisitions and hit rate
+        """
+
+        return {
+            "size": self.size,
+            "active": self.active,
+            "free": len(self.free),
+            "created": self.created,
+            "acquired": self.acquired,
+            "hit_rate": self.hit_rate,
+        }
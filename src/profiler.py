@@ -0,0 +1,198 @@
+import csv
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PROFILE_DIR = os.path.join(BASE_DIR, "profiles")
+
+HISTOGRAM_BIN_MS = 1.0
+HISTOGRAM_BINS = 34  # ostatni przedział zbiera wszystkie klatki dłuższe niż 33 ms
+MAX_ROWS = 18000  # około 5 minut przy 60 FPS; starsze klatki wypadają z eksportu CSV
+
+
+class FrameProfiler:
+    """Collects per-phase timings of each frame
+
+    A frame is split into groups (update, draw) that start with begin() and are cut
+    into phases with mark(), each mark charging the time since the previous mark to
+    the named phase. end_frame() closes the frame, updates the rolling windows and the
+    frame-time histogram, and keeps a row for the CSV export. Only the last max_rows
+    rows are kept, so a long session does not grow memory without limit.
+    """
+
+    enabled = True
+
+    def __init__(self, window=300, max_rows=MAX_ROWS):
+        """Initialize an empty profiler
+
+        Args:
+            window (int, optional): Number of recent frames used for percentiles. Defaults to 300
+            max_rows (int, optional): Number of recent frames kept for the CSV export. Defaults to MAX_ROWS
+        """
+
+        self.window = window
+        self.phases = []
+        self.samples = {}
+        self.frame_samples = deque(maxlen=window)
+        self.histogram = [0] * HISTOGRAM_BINS
+        self.rows = deque(maxlen=max_rows)
+        self.frame_count = 0
+        self._current = {}
+        self._last = None
+        self._frame_start = None
+        self._previous_end = None
+
+    def begin(self):
+        """Start timing a group of phases (e.g. the update or the draw callback)"""
+
+        self._last = time.perf_counter()
+        if self._frame_start is None:
+            self._frame_start = self._last
+
+    def mark(self, phase):
+        """Charge the time since the last mark to a phase
+
+        Args:
+            phase (str): Name of the phase that just finished
+        """
+
+        now = time.perf_counter()
+        self._current[phase] = self._current.get(phase, 0.0) + now - self._last
+        self._last = now
+
+    def end_frame(self):
+        """Close the frame and record its timings"""
+
+        now = time.perf_counter()
+        if self._previous_end is not None:
+            frame_ms = (now - self._previous_end) * 1000
+        else:
+            frame_ms = (now - (self._frame_start or now)) * 1000
+        self._previous_end = now
+        self._frame_start = None
+
+        for phase in self._current:
+            if phase not in self.samples:
+                self.phases.append(phase)
+                self.samples[phase] = deque(maxlen=self.window)
+        row = {"frame": self.frame_count, "frame_ms": frame_ms}
+        self.frame_count += 1
+        for phase in self.phases:
+            value = self._current.get(phase, 0.0) * 1000
+            self.samples[phase].append(value)
+            row[phase] = value
+        self.rows.append(row)
+        self.frame_samples.append(frame_ms)
+        self.histogram[min(int(frame_ms / HISTOGRAM_BIN_MS), HISTOGRAM_BINS - 1)] += 1
+        self._current = {}
+
+    def percentiles(self, phase=None):
+        """Return the p50, p95 and p99 of a phase over the rolling window
+
+        Args:
+            phase (str, optional): Phase name; None means the whole frame. Defaults to None
+
+        Returns:
+            tuple of float: (p50, p95, p99) in milliseconds, zeros if nothing was recorded
+        """
+
+        samples = self.frame_samples if phase is None else self.samples.get(phase, ())
+        if not samples:
+            return 0.0, 0.0, 0.0
+        ordered = sorted(samples)
+        last = len(ordered) - 1
+        return tuple(ordered[round(last * q)] for q in (0.50, 0.95, 0.99))
+
+    def write_csv(self, path=None):
+        """Write every kept frame to a CSV file
+
+        Args:
+            path (str, optional): Target file. Defaults to a timestamped file in PROFILE_DIR
+
+        Returns:
+            str or None: Path of the written file, None if no frame was recorded
+        """
+
+        if not self.rows:
+            return None
+        return _write_rows(_csv_path(path), list(self.rows), list(self.phases))
+
+    def write_csv_async(self, path=None):
+        """Write every kept frame to a CSV file on a background thread
+
+        The rows are snapshotted on the calling thread, so the game can keep recording
+        while the file is written. The thread is not a daemon, so the interpreter waits
+        for the export to finish on exit.
+
+        Args:
+            path (str, optional): Target file. Defaults to a timestamped file in PROFILE_DIR
+
+        Returns:
+            threading.Thread or None: The writer thread, None if no frame was recorded
+        """
+
+        if not self.rows:
+            return None
+        thread = threading.Thread(
+            target=_write_rows,
+            args=(_csv_path(path), list(self.rows), list(self.phases)),
+            name="profiler-csv",
+        )
+        thread.start()
+        return thread
+
+
+def _csv_path(path):
+    """Return the given path or a new timestamped file in PROFILE_DIR"""
+
+    if path is not None:
+        return path
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    return os.path.join(PROFILE_DIR, datetime.now().strftime("session-%Y%m%d-%H%M%S.csv"))
+
+
+def _write_rows(path, rows, phases):
+    """Write profiler rows to a CSV file
+
+    Args:
+        path (str): Target file
+        rows (list of dict): Frame rows with the frame number, frame time and phase times
+        phases (list of str): Phase columns, in order of first appearance
+
+    Returns:
+        str: Path of the written file
+    """
+
+    fields = ["frame", "frame_ms"] + phases
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fields, restval=0.0)
+        writer.writeheader()
+        writer.writerows(rows)
+    return path
+
+
+class NullProfiler:
+    """Drop-in profiler that records nothing; used when profiling is off"""
+
+    enabled = False
+
+    def begin(self):
+        pass
+
+    def mark(self, phase):
+        pass
+
+    def end_frame(self):
+        pass
+
+    def write_csv(self, path=None):
+        return None
+
+    def write_csv_async(self, path=None):
+        return None
+
+
+NULL_PROFILER = NullProfiler()
@@ -0,0 +1,235 @@
+import os
+import sys
+
+# Tryb bez okna musi zostać włączony przed pierwszym importem arcade/pygleta
+if "--windowed" not in sys.argv:
+    os.environ.setdefault("ARCADE_HEADLESS", "1")
+
+import argparse
+import atexit
+import hashlib
+import json
+import shutil
+import tempfile
+import time
+import arcade
+import pyglet
+from settings import SCREEN_HEIGHT, SCREEN_WIDTH
+
+# Benchmark rysowania w niewidocznym buforze (EGL / Mesa llvmpipe):
+#   python src/render_benchmark.py --frames 300 --output render.json
+#   python src/render_benchmark.py --golden golden.json [--update-golden]
+
+DRAW_FUNCTIONS = (
+    "glDrawArrays", "glDrawElements", "glDrawArraysInstanced", "glDrawElementsInstanced",
+    "glMultiDrawArrays", "glMultiDrawElements",
+)
+SEED = 1234
+
+
+def _game_view():
+    from views.game import GameView
+    view = GameView()
+    view.setup(seed=SEED)
+    return view
+
+
+def _main_menu_view():
+    from views.main_menu import MainMenuView
+    return MainMenuView()
+
+
+def _rules_view():
+    from views.rules import RulesView
+    return RulesView()
+
+
+def _about_view():
+    from views.about import AboutView
+    return AboutView()
+
+
+def _scores_view():
+    from views.scores import ScoresView
+    return ScoresView()
+
+
+def _configuration_view():
+    from views.configuration import ConfigurationView
+    return ConfigurationView()
+
+
+VIEWS = {
+    "game": _game_view,
+    "main_menu": _main_menu_view,
+    "rules": _rules_view,
+    "about": _about_view,
+    "scores": _scores_view,
+    "configuration": _configuration_view,
+}
+# Widoki pomijane, gdy nie wybrano ich jawnie przez --view (z powodem wypisywanym w podsumowaniu)
+SKIPPED_VIEWS = {
+    "about": "images/pwr.jpg is not shipped in assets/, so AboutView cannot load its background",
+}
+
+
+class DrawCallCounter:
+    """Counts GL draw calls by wrapping the draw entry points of pyglet.gl and the modules that import them"""
+
+    def __init__(self):
+        self.count = 0
+        self._patched = []
+
+    def install(self):
+        """Wrap every draw function found in the GL-facing modules"""
+
+        modules = [pyglet.gl]
+        for name in ("pyglet.graphics.vertexdomain", "pyglet.graphics.vertexarray"):
+            module = sys.modules.get(name)
+            if module is not None:
+                modules.append(module)
+        for module in modules:
+            for name in DRAW_FUNCTIONS:
+                original = getattr(module, name, None)
+                if original is None:
+                    continue
+                setattr(module, name, self._wrap(original))
+                self._patched.append((module, name, original))
+
+    def _wrap(self, original):
+        def counted(*args, **kwargs):
+            self.count += 1
+            return original(*args, **kwargs)
+        return counted
+
+    def uninstall(self):
+        """Restore the original functions"""
+
+        for module, name, original in reversed(self._patched):
+            setattr(module, name, original)
+        self._patched = []
+
+
+def _percentile(ordered, q):
+    return ordered[round((len(ordered) - 1) * q)] if ordered else 0.0
+
+
+def render_view(window, name, frames, counter):
+    """Render a view into an offscreen framebuffer and measure every frame
+
+    Args:
+        window (arcade.Window): Window providing the GL context
+        name (str): Key of VIEWS
+        frames (int): Number of frames to render
+        counter (DrawCallCounter): Installed draw call counter
+
+    Returns:
+        dict: Frame time distribution, draw calls per frame and the hash of the last frame
+    """
+
+    ctx = window.ctx
+    view = VIEWS[name]()
+    window.show_view(view)
+    texture = ctx.texture((SCREEN_WIDTH, SCREEN_HEIGHT), components=4)
+    framebuffer = ctx.framebuffer(color_attachments=[texture])
+
+    times = []
+    draw_calls = []
+    with framebuffer.activate():
+        for _ in range(frames):
+            view.on_update(1 / 60)
+            counter.count = 0
+            start = time.perf_counter()
+            view.on_draw()
+            ctx.finish()
+            times.append((time.perf_counter() - start) * 1000)
+            draw_calls.append(counter.count)
+        pixels = framebuffer.read(components=4)
+
+    ordered = sorted(times)
+    return {
+        "view": name,
+        "frames": frames,
+        "mean_ms": sum(times) / len(times),
+        "p50_ms": _percentile(ordered, 0.50),
+        "p95_ms": _percentile(ordered, 0.95),
+        "p99_ms": _percentile(ordered, 0.99),
+        "max_ms": ordered[-1],
+        "draw_calls_per_frame": sum(draw_calls) / len(draw_calls),
+        "frame_sha256": hashlib.sha256(pixels).hexdigest(),
+    }
+
+
+def _use_temporary_scores():
+    """Point score_manager at an empty database in a temporary folder
+
+    The game view saves its score on game over and the scores view reads the table,
+    so without this the benchmark would write to the player's scores.db and the
+    rendered frames would depend on local results.
+    """
+
+    import score_manager
+    folder = tempfile.mkdtemp(prefix="render-benchmark-")
+    atexit.register(shutil.rmtree, folder, ignore_errors=True)
+    score_manager.DB_FILE = os.path.join(folder, "scores.db")
+    score_manager.SCORES_FILE = os.path.join(folder, "scores.json")
+    score_manager.JOURNAL_FILE = os.path.join(folder, "scores.journal")
+
+
+def main(argv=None):
+    """Render every selected view, print a summary and optionally write results or check golden hashes"""
+
+    parser = argparse.ArgumentParser(description="Offscreen render benchmark of the game views")
+    parser.add_argument("--view", action="append", choices=sorted(VIEWS),
+                        help="view to render (repeatable, default: all except SKIPPED_VIEWS)")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--output", help="path of the JSON results file")
+    parser.add_argument("--golden", help="JSON file with expected frame hashes")
+    parser.add_argument("--update-golden", action="store_true", help="write the current hashes to --golden")
+    parser.add_argument("--windowed", action="store_true", help="use a regular window instead of headless GL")
+    args = parser.parse_args(argv)
+
+    _use_temporary_scores()
+    window = arcade.Window(SCREEN_WIDTH, SCREEN_HEIGHT, "render benchmark", visible=args.windowed)
+    counter = DrawCallCounter()
+    counter.install()
+
+    results = []
+    failed = False
+    if not args.view:
+        for name, reason in SKIPPED_VIEWS.items():
+            print(f"{name:<14} skipped: {reason}")
+    for name in args.view or [name for name in VIEWS if name not in SKIPPED_VIEWS]:
+        try:
+            result = render_view(window, name, args.frames, counter)
+        except Exception as e:  # jeden zepsuty widok nie przerywa pomiaru pozostałych
+            result = {"view": name, "error": repr(e)}
+            failed = True
+            print(f"{name:<14} ERROR {e!r}")
+        else:
+            print(f"{name:<14} p50 {result['p50_ms']:7.3f} ms  p99 {result['p99_ms']:7.3f} ms"
+                  f"  draw calls {result['draw_calls_per_frame']:6.1f}")
+        results.append(result)
+    counter.uninstall()
+
+    hashes = {r["view"]: r["frame_sha256"] for r in results if "frame_sha256" in r}
+    if args.golden and args.update_golden:
+        with open(args.golden, "w", encoding="utf-8") as f:
+            json.dump(hashes, f, indent=4)
+    elif args.golden:
+        with open(args.golden, "r", encoding="utf-8") as f:
+            expected = json.load(f)
+        for view, digest in expected.items():
+            if hashes.get(view) != digest:
+                print(f"{view:<14} frame differs from golden image")
+                failed = True
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"gl_renderer": window.ctx.info.RENDERER, "results": results}, f, indent=4)
+    window.close()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+import arcade
+from arcade.shape_list import ShapeElementList, create_rectangle_filled
+from rendering.text_layer import TextLayer
+
+HEART_SIZE = 30
+HEART_SPACING = 40
+HEART_MARGIN = 30
+OVERLAY_COLOR = (0, 0, 0, 180)
+BUTTON_COLOR = arcade.color.LIGHT_BLUE
+
+
+class Hud:
+    """In-game overlay: score, hearts and the game-over panel
+
+    All geometry is built once for the given layout. Changing the score, the number of
+    lives or the game-over state only updates a label or toggles sprites; drawing is a
+    sprite batch plus a text batch, and the panel's shape and text batches after the game
+    has ended.
+    """
+
+    def __init__(self, heart_texture, width, height, max_lives, menu_button):
+        """Build the HUD for a screen layout
+
+        Args:
+            heart_texture (arcade.Texture): Texture of a single life
+            width (int): Screen width
+            height (int): Screen height
+            max_lives (int): Number of heart sprites to prepare
+            menu_button (tuple): (center_x, center_y, width, height) of the game-over menu button
+        """
+
+        self.hearts = arcade.SpriteList()
+        for i in range(max_lives):
+            heart = arcade.Sprite(heart_texture, center_x=width - HEART_MARGIN - i * HEART_SPACING,
+                                  center_y=height - HEART_MARGIN)
+            heart.width = HEART_SIZE
+            heart.height = HEART_SIZE
+            self.hearts.append(heart)
+
+        self.text = TextLayer()
+        self.text.add("score", "Wynik: 0", 20, height - 40, arcade.color.WHITE, 20)
+
+        button_x, button_y, button_width, button_height = menu_button
+        self.panel = ShapeElementList()
+        self.panel.append(create_rectangle_filled(width / 2, height / 2, width, height, OVERLAY_COLOR))
+        self.panel.append(create_rectangle_filled(button_x, button_y, button_width, button_height, BUTTON_COLOR))
+        self.panel_text = TextLayer()
+        self.panel_text.add("title", "Koniec Gry", width // 2, height // 2 + 40,
+                            arcade.color.WHITE, 40, anchor_x="center")
+        self.panel_text.add("menu", "Menu", button_x, button_y,
+                            arcade.color.BLACK, 20, anchor_x="center", anchor_y="center")
+
+        self.lives = max_lives
+        self.game_over = False
+
+    def set_score(self, score):
+        """Show a new score
+
+        Args:
+            score (int): Current score
+        """
+
+        self.text.set_text("score", f"Wynik: {score}")
+
+    def set_lives(self, lives):
+        """Show as many hearts as there are lives left
+
+        Args:
+            lives (int): Remaining lives
+        """
+
+        if lives == self.lives:
+            return
+        self.lives = lives
+        for i, heart in enumerate(self.hearts):
+            heart.visible = i < lives
+
+    def set_game_over(self, game_over):
+        """Show or hide the game-over panel
+
+        Args:
+            game_over (bool): Whether the run has ended
+        """
+
+        self.game_over = game_over
+
+    def reset(self, score, lives):
+        """Bring the HUD back to the start of a run
+
+        Args:
+            score (int): Starting score
+            lives (int): Starting lives
+        """
+
+        self.set_score(score)
+        self.set_lives(lives)
+        self.set_game_over(False)
+
+    def draw(self):
+        """Draw the HUD and, after the game has ended, the game-over panel"""
+
+        self.text.draw()
+        self.hearts.draw()
+        if self.game_over:
+            self.panel.draw()
+            self.panel_text.draw()
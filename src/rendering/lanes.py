@@ -0,0 +1,99 @@
+import arcade
+from arcade.shape_list import ShapeElementList, create_lines, create_rectangle_outline
+
+LANE_COLORS = [
+    (100, 255, 100, 150),  # jasny zielony (pastelowy)
+    (150, 230, 255, 150),  # bardzo jasny niebieski
+    (255, 100, 120, 150)   # różowy pozostaje bez zmian
+]
+
+BORDER_COLORS = [
+    (80, 230, 80),
+    (150, 230, 255),
+    (255, 160, 170)
+]
+
+LINE_SPACING = 4
+BORDER_WIDTH = 2
+
+# Geometria pasów jest budowana raz dla danego układu i współdzielona przez kolejne gry
+_lane_shapes_cache = {}
+
+
+def build_lane_shapes(width, lane_count, lane_height):
+    """Build the lane borders and stripes as a single GPU shape batch
+
+    Args:
+        width (int): Width of the lanes in pixels
+        lane_count (int): Number of lanes stacked from the bottom of the screen
+        lane_height (int): Height of a single lane
+
+    Returns:
+        ShapeElementList: Batch containing every border and stripe
+    """
+
+    shapes = ShapeElementList()
+    for i in range(lane_count):
+        bottom = i * lane_height
+        top = bottom + lane_height
+
+        shapes.append(create_rectangle_outline(
+            width / 2, (bottom + top) / 2, width, lane_height,
+            BORDER_COLORS[i % len(BORDER_COLORS)], border_width=BORDER_WIDTH
+        ))
+
+        points = []
+        for y_line in range(bottom, top, LINE_SPACING):
+            points.append((0, y_line))
+            points.append((width, y_line))
+        shapes.append(create_lines(points, LANE_COLORS[i % len(LANE_COLORS)]))
+    return shapes
+
+
+def get_lane_shapes(width, lane_count, lane_height):
+    """Return the cached lane batch for a layout, building it on first use
+
+    Args:
+        width (int): Width of the lanes in pixels
+        lane_count (int): Number of lanes
+        lane_height (int): Height of a single lane
+
+    Returns:
+        ShapeElementList: Shared batch for this layout
+    """
+
+    key = (width, lane_count, lane_height)
+    shapes = _lane_shapes_cache.get(key)
+    if shapes is None:
+        shapes = build_lane_shapes(width, lane_count, lane_height)
+        _lane_shapes_cache[key] = shapes
+    return shapes
+
+
+class LaneBackground:
+    """Pre-baked game backdrop: a full-screen texture plus the cached lane batch"""
+
+    def __init__(self, texture, width, height, lane_count, lane_height):
+        """Prepare the backdrop sprite and fetch the lane batch for the given layout
+
+        Args:
+            texture (arcade.Texture): Backdrop texture stretched over the whole screen
+            width (int): Screen width
+            height (int): Screen height
+            lane_count (int): Number of lanes
+            lane_height (int): Height of a single lane
+        """
+
+        backdrop = arcade.Sprite(texture, center_x=width / 2, center_y=height / 2)
+        backdrop.width = width
+        backdrop.height = height
+        self.backdrop_list = arcade.SpriteList()
+        self.backdrop_list.append(backdrop)
+
+        self.lane_shapes = get_lane_shapes(width, lane_count, lane_height)
+
+    def draw(self):
+        """Draw the backdrop and all lanes"""
+
+        self.backdrop_list.draw()
+        self.lane_shapes.draw()
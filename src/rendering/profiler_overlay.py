@@ -0,0 +1,79 @@
+import arcade
+from profiler import HISTOGRAM_BINS
+
+PANEL_COLOR = (0, 0, 0, 170)
+TEXT_COLOR = arcade.color.WHITE
+BAR_COLOR = arcade.color.ORANGE
+LINE_HEIGHT = 14
+FONT_SIZE = 10
+HISTOGRAM_HEIGHT = 40
+BAR_WIDTH = 6
+
+
+class ProfilerOverlay:
+    """Toggleable on-screen table of phase percentiles with a frame-time histogram"""
+
+    def __init__(self, profiler, left=10, top=520, status=None):
+        """Initialize a hidden overlay
+
+        Args:
+            profiler (FrameProfiler): Profiler whose statistics are shown
+            left (int, optional): Left edge of the panel. Defaults to 10
+            top (int, optional): Top edge of the panel. Defaults to 520
+            status (Callable[[], list[str]], optional): Extra lines shown below the phases. Defaults to None
+        """
+
+        self.profiler = profiler
+        self.status = status
+        self.left = left
+        self.top = top
+        self.visible = False
+        self.texts = []
+
+    def toggle(self):
+        """Show or hide the overlay"""
+
+        self.visible = not self.visible
+
+    def _lines(self):
+        """Format one line for the whole frame and one per phase"""
+
+        lines = ["faza               p50    p95    p99 [ms]"]
+        p50, p95, p99 = self.profiler.percentiles()
+        lines.append(f"{'frame':<16} {p50:6.2f} {p95:6.2f} {p99:6.2f}")
+        for phase in self.profiler.phases:
+            p50, p95, p99 = self.profiler.percentiles(phase)
+            lines.append(f"{phase:<16} {p50:6.2f} {p95:6.2f} {p99:6.2f}")
+        if self.status is not None:
+            lines.extend(self.status())
+        return lines
+
+    def draw(self):
+        """Draw the overlay if it is visible"""
+
+        if not self.visible:
+            return
+
+        lines = self._lines()
+        while len(self.texts) < len(lines):
+            self.texts.append(arcade.Text("", self.left + 6, 0, TEXT_COLOR, FONT_SIZE, font_name="Courier New"))
+
+        width = BAR_WIDTH * HISTOGRAM_BINS + 12
+        bottom = self.top - LINE_HEIGHT * len(lines) - HISTOGRAM_HEIGHT - 16
+        arcade.draw_lrbt_rectangle_filled(self.left, self.left + max(width, 300), bottom, self.top, PANEL_COLOR)
+
+        for index, line in enumerate(lines):
+            text = self.texts[index]
+            if text.text != line:
+                text.text = line
+            text.y = self.top - LINE_HEIGHT * (index + 1)
+            text.draw()
+
+        histogram = self.profiler.histogram
+        peak = max(histogram) or 1
+        base = bottom + 6
+        for index, count in enumerate(histogram):
+            if count:
+                left = self.left + 6 + index * BAR_WIDTH
+                height = HISTOGRAM_HEIGHT * count / peak
+                arcade.draw_lrbt_rectangle_filled(left, left + BAR_WIDTH - 1, base, base + height, BAR_COLOR)
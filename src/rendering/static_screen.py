@@ -0,0 +1,59 @@
+from arcade.gl import geometry
+
+
+class StaticScreen:
+    """Render-once cache for screens whose content rarely changes
+
+    The screen is drawn into an offscreen texture the size of the window's framebuffer
+    and afterwards shown as a single full-screen quad. It is drawn again only after
+    invalidate() or when the framebuffer size changes.
+    """
+
+    def __init__(self, draw_content):
+        """Prepare an empty cache
+
+        Args:
+            draw_content (Callable[[], None]): Draws the whole screen with regular arcade calls
+        """
+
+        self.draw_content = draw_content
+        self.dirty = True
+        self.renders = 0
+        self._size = None
+        self._texture = None
+        self._framebuffer = None
+        self._quad = None
+
+    def invalidate(self):
+        """Mark the cached image as outdated so the next draw() renders it again"""
+
+        self.dirty = True
+
+    def draw(self, window):
+        """Draw the cached image, rendering it first if needed
+
+        Args:
+            window (arcade.Window): Window whose context and framebuffer size are used
+        """
+
+        ctx = window.ctx
+        size = window.get_framebuffer_size()
+        if size != self._size:
+            self._size = size
+            self._texture = ctx.texture(size, components=4)
+            self._framebuffer = ctx.framebuffer(color_attachments=[self._texture])
+            self.dirty = True
+        if self._quad is None:
+            self._quad = geometry.quad_2d_fs()
+
+        if self.dirty:
+            with self._framebuffer.activate() as framebuffer:
+                framebuffer.clear()
+                self.draw_content()
+            self.dirty = False
+            self.renders += 1
+
+        # Obraz zawiera już wymieszane półprzezroczyste warstwy, więc kopiujemy go bez mieszania
+        self._texture.use(0)
+        with ctx.enabled_only():
+            self._quad.render(ctx.utility_textured_quad_program)
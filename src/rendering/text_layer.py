@@ -0,0 +1,93 @@
+import arcade
+import pyglet
+
+
+class TextLayer:
+    """Long-lived text labels drawn together with a single batch
+
+    Every label is laid out once when it is added. Changing its string or color only
+    touches the label when the value really differs, and the bounding boxes used for
+    hit testing are measured at layout time instead of on every mouse move.
+    """
+
+    def __init__(self):
+        """Create an empty layer"""
+
+        self.batch = pyglet.graphics.Batch()
+        self.texts = {}
+        self.bounds = {}
+
+    def add(self, key, text, x, y, color=arcade.color.WHITE, font_size=12, **kwargs):
+        """Create a label in the layer
+
+        Args:
+            key (Hashable): Name used to update the label later
+            text (str): Initial string
+            x (float): X position of the anchor
+            y (float): Y position of the anchor
+            color (Color, optional): Text color. Defaults to white
+            font_size (float, optional): Font size. Defaults to 12
+            **kwargs: Other arcade.Text options such as anchor_x or anchor_y
+
+        Returns:
+            arcade.Text: The created label
+        """
+
+        label = arcade.Text(text, x, y, color, font_size, batch=self.batch, **kwargs)
+        self.texts[key] = label
+        self._measure(key)
+        return label
+
+    def _measure(self, key):
+        label = self.texts[key]
+        self.bounds[key] = (label.left, label.right, label.bottom, label.top)
+
+    def set_text(self, key, text):
+        """Change the string of a label, re-laying it out only if it differs
+
+        Args:
+            key (Hashable): Name of the label
+            text (Any): New value, converted to str
+        """
+
+        label = self.texts[key]
+        text = str(text)
+        if label.text != text:
+            label.text = text
+            self._measure(key)
+
+    def set_color(self, key, color):
+        """Change the color of a label if it differs
+
+        Args:
+            key (Hashable): Name of the label
+            color (Color): New color
+        """
+
+        label = self.texts[key]
+        color = arcade.color.Color.from_iterable(color)
+        if label.color != color:
+            label.color = color
+
+    def hit(self, x, y, keys=None):
+        """Return the label under a point
+
+        Args:
+            x (float): X coordinate
+            y (float): Y coordinate
+            keys (Iterable, optional): Only test these labels. Defaults to all labels
+
+        Returns:
+            Hashable or None: Key of the first label whose bounding box contains the point
+        """
+
+        for key in self.bounds if keys is None else keys:
+            left, right, bottom, top = self.bounds[key]
+            if left <= x <= right and bottom <= y <= top:
+                return key
+        return None
+
+    def draw(self):
+        """Draw every label of the layer"""
+
+        self.batch.draw()
@@ -0,0 +1,16 @@
+import score_manager
+
+# Ponowna weryfikacja wszystkich zapisanych powtórek, np. po zmianach w zasadach gry:
+#   python src/revalidate_scores.py
+
+
+def main():
+    """Re-simulate every stored replay and print how many scores failed"""
+    checked, failed = score_manager.revalidate_scores()
+    print(f"Sprawdzono {checked} powtórek, odrzucono {len(failed)}")
+    if failed:
+        print("Odrzucone id:", ", ".join(str(row_id) for row_id in failed))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,41 +1,419 @@
+import atexit
 import json
 import os
+import queue
+import sqlite3
+import threading
 from datetime import datetime
+from simulation.replay import Replay
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_FILE = os.path.join(BASE_DIR, "scores.db")
+# Pliki z poprzednich wersji - ich zawartość jest importowana do bazy przy pierwszym otwarciu
 SCORES_FILE = os.path.join(BASE_DIR, "scores.json")
+JOURNAL_FILE = os.path.join(BASE_DIR, "scores.journal")
+
+TOP_SCORES = 10
+FLUSH_TIMEOUT = 2.0  # maksymalny czas oczekiwania na zapis przy wyjściu (w sekundach)
+RETRY_DELAY = 0.5  # odstęp między próbami zapisu po błędzie bazy (w sekundach)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    score INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    replay BLOB,
+    verified INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_scores_score ON scores (score DESC, date);
+CREATE INDEX IF NOT EXISTS idx_scores_difficulty_score ON scores (difficulty, score DESC, date);
+CREATE INDEX IF NOT EXISTS idx_scores_date ON scores (date);
+-- Indeksy częściowe dla rankingu (verified = 1); kolumna verified w kluczu pozwala
+-- policzyć wyniki bez zaglądania do tabeli
+CREATE INDEX IF NOT EXISTS idx_scores_ranked_score ON scores (score DESC, date, verified) WHERE verified = 1;
+CREATE INDEX IF NOT EXISTS idx_scores_ranked_difficulty_score ON scores (difficulty, score DESC, date, verified) WHERE verified = 1;
+"""
+
+_queue = queue.Queue()
+_lock = threading.Lock()
+_pending = []
+_writer = None
+_read_connection = None
+_cache = {}
+rejected = 0  # liczba wyników odrzuconych, bo powtórka nie odtworzyła zgłoszonego wyniku
+write_errors = 0  # liczba nieudanych prób zapisu; wpisy czekają wtedy na ponowienie
+last_error = None
+_imported = False  # stare pliki wyników importujemy tylko raz na proces
+_generation = 0  # zwiększane przy każdym zapisie; chroni przed buforowaniem nieaktualnych wyników
+
+
+def _connect():
+    """Open a connection to the score database, creating the schema if needed"""
+
+    connection = sqlite3.connect(DB_FILE)
+    # WAL + FULL: zatwierdzony wpis przetrwa awarię, a odczyty nie blokują zapisu
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=FULL")
+    connection.executescript(SCHEMA)
+    # Bazy z wcześniejszych wersji nie mają kolumn na powtórki
+    columns = {row[1] for row in connection.execute("PRAGMA table_info(scores)")}
+    for column, kind in (("replay", "BLOB"), ("verified", "INTEGER")):
+        if column not in columns:
+            with connection:
+                connection.execute(f"ALTER TABLE scores ADD COLUMN {column} {kind}")
+    return connection
+
+
+def _import_legacy(connection):
+    """Copy scores from the old JSON file and journal into an empty database
+
+    Both the reader and the writer connection call this; only the first call does the
+    import, and the emptiness check and the inserts share one write transaction, so
+    another process opening the database at the same time cannot import them twice.
+    """
+
+    global _imported
+    with _lock:
+        if _imported:
+            return
+        connection.execute("BEGIN IMMEDIATE")
+        with connection:
+            if not connection.execute("SELECT 1 FROM scores LIMIT 1").fetchone():
+                connection.executemany(
+                    "INSERT INTO scores (score, date, difficulty) VALUES (?, ?, ?)",
+                    _legacy_entries()
+                )
+        _imported = True
+
+
+def _legacy_entries():
+    """Read the entries of the old JSON file and journal, without duplicates"""
+
+    entries = []
+    if os.path.exists(SCORES_FILE):
+        try:
+            with open(SCORES_FILE, "r", encoding="utf-8") as f:
+                entries.extend(json.load(f))
+        except (json.JSONDecodeError, OSError):
+            pass
+    if os.path.exists(JOURNAL_FILE):
+        with open(JOURNAL_FILE, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+    return list(dict.fromkeys((e["score"], e["date"], e.get("difficulty", "")) for e in entries))
+
+
+def _reader():
+    """Return the connection used for reads on the calling (game) thread"""
+
+    global _read_connection
+    if _read_connection is None:
+        _read_connection = _connect()
+        _import_legacy(_read_connection)
+    return _read_connection
+
+
+def _where(difficulty, since, until, ranked):
+    """Build the WHERE clause and parameters shared by the queries"""
+
+    # Do rankingu trafiają tylko wyniki potwierdzone powtórką; wyniki bez powtórki
+    # (np. zaimportowane ze starych plików) i odrzucone przy ponownej weryfikacji
+    # zostają jedynie w historii
+    clauses = ["verified = 1"] if ranked else []
+    params = []
+    if difficulty is not None:
+        clauses.append("difficulty = ?")
+        params.append(difficulty)
+    if since is not None:
+        clauses.append("date >= ?")
+        params.append(since)
+    if until is not None:
+        clauses.append("date <= ?")
+        params.append(until)
+    return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+
+def _matches(entry, difficulty, since, until):
+    return ((difficulty is None or entry["difficulty"] == difficulty) and
+            (since is None or entry["date"] >= since) and
+            (until is None or entry["date"] <= until))
+
+
+def _cached(key, query):
+    """Return a cached read result, running the query on a miss
+
+    The result is stored only if no insert was committed while the query ran.
+    """
+
+    result = _cache.get(key)
+    if result is None:
+        generation = _generation
+        result = query()
+        with _lock:
+            if generation == _generation:
+                _cache[key] = result
+    return result
+
+
+def _query_top(limit, offset, difficulty, since, until, ranked):
+    """Run (or fetch from the cache) an indexed top-N query"""
+
+    def query():
+        where, params = _where(difficulty, since, until, ranked)
+        rows = _reader().execute(
+            "SELECT score, date, difficulty FROM scores" + where +
+            " ORDER BY score DESC, date LIMIT ? OFFSET ?",
+            params + [limit, offset]
+        ).fetchall()
+        return [{"score": s, "date": d, "difficulty": diff} for s, d, diff in rows]
+
+    return _cached(("top", limit, offset, difficulty, since, until, ranked), query)
+
+
+def top_scores(limit=TOP_SCORES, offset=0, difficulty=None, since=None, until=None, ranked=True):
+    """
+    Return one page of the leaderboard, highest scores first.
+
+    The ranking holds only scores whose replay was verified, so an entry shows up there
+    once the background writer has checked it. The full history also lists scores without
+    a replay (legacy imports) and entries not yet written.
+
+    Args:
+        limit (int, optional): Page size. Defaults to TOP_SCORES.
+        offset (int, optional): Number of entries to skip. Defaults to 0.
+        difficulty (str, optional): Only scores of this difficulty. Defaults to all.
+        since (str, optional): Earliest date ("YYYY-MM-DD HH:MM:SS" or a prefix). Defaults to None.
+        until (str, optional): Latest date, inclusive. Defaults to None.
+        ranked (bool, optional): Only verified scores; False returns the full history. Defaults to True.
+
+    Returns:
+        list of dict: Entries with 'score' (int), 'date' (str) and 'difficulty' (str).
+    """
+    pending = []
+    if not ranked:
+        with _lock:
+            pending = [e for e in _pending if _matches(e, difficulty, since, until)]
+    if not pending:
+        return list(_query_top(limit, offset, difficulty, since, until, ranked))
+    # Słownik usuwa wpis, który zapisano do bazy w trakcie zapytania
+    merged = {(e["score"], e["date"], e["difficulty"]): e
+              for e in _query_top(offset + limit, 0, difficulty, since, until, ranked) + pending}
+    merged = sorted(merged.values(), key=lambda x: (-x["score"], x["date"]))
+    return merged[offset:offset + limit]
+
+
+def count_scores(difficulty=None, since=None, until=None, ranked=True):
+    """
+    Return how many stored scores match the filters.
+
+    Args:
+        difficulty (str, optional): Only scores of this difficulty. Defaults to all.
+        since (str, optional): Earliest date. Defaults to None.
+        until (str, optional): Latest date, inclusive. Defaults to None.
+        ranked (bool, optional): Count only verified scores; False counts the full history. Defaults to True.
+
+    Returns:
+        int: Number of matching entries; the history count includes entries not yet written.
+    """
+    def query():
+        where, params = _where(difficulty, since, until, ranked)
+        return _reader().execute("SELECT COUNT(*) FROM scores" + where, params).fetchone()[0]
+
+    pending = 0
+    if not ranked:
+        with _lock:
+            pending = sum(1 for e in _pending if _matches(e, difficulty, since, until))
+    return _cached(("count", difficulty, since, until, ranked), query) + pending
+
 
 def load_scores():
     """
-    Load and return the list of top scores from the JSON file.
+    Load and return the list of top scores.
 
     Returns:
-        list of dict: List of score entries sorted by score descending.
-                      Each entry contains 'score' (int) and 'date' (str).
-                      Returns empty list if file does not exist or is invalid.
+        list of dict: The best TOP_SCORES entries of all difficulties, sorted by score descending.
+                      Each entry contains 'score' (int), 'date' (str) and 'difficulty' (str).
     """
-    if not os.path.exists(SCORES_FILE):
-        return []
-    try:
-        with open(SCORES_FILE, "r", encoding="utf-8") as f:
-            scores = json.load(f)
-            scores.sort(key=lambda x: x["score"], reverse=True)
-            return scores
-    except json.JSONDecodeError as e:
-        return []
+    return top_scores(TOP_SCORES)
 
-def add_score(score, difficulty):
+
+def add_score(score, difficulty, replay=None):
     """
-    Add a new score entry to the score list and save top 10 scores to the file.
+    Queue a new score entry for the background writer and return immediately.
+
+    When a replay is given, the writer re-simulates it and stores the score only if the
+    replay reproduces it; the encoded replay is kept with the score as its proof. A score
+    without a replay is stored unverified and appears only in the history, never in the ranking.
 
     Args:
         score (int): The score to add.
         difficulty (str): The difficulty level associated with the score.
+        replay (Replay, optional): Recording of the run. Defaults to None.
     """
-    scores = load_scores()
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    scores.append({"score": score, "date": now, "difficulty": difficulty})
-    scores.sort(key=lambda x: x["score"], reverse=True)
-    scores = scores[:10]  # Keep only top 10 scores
-    with open(SCORES_FILE, "w", encoding="utf-8") as f:
-        json.dump(scores, f, indent=4)
+    global _generation
+    entry = {"score": score, "date": now, "difficulty": difficulty}
+    with _lock:
+        _pending.append(entry)
+        _generation += 1
+    _ensure_writer()
+    _queue.put((entry, replay.encode() if replay is not None else None))
+
+
+def revision():
+    """
+    Return a number that changes whenever the visible scores may have changed.
+
+    Returns:
+        int: Current revision of the score store.
+    """
+    return _generation
+
+
+def _verify(entry, blob):
+    """Check that an encoded replay reproduces the claimed score and difficulty"""
+
+    try:
+        replay = Replay.decode(blob)
+        return replay.score == entry["score"] and replay.difficulty == entry["difficulty"] and replay.verify()
+    except Exception:
+        # Powtórka pochodzi z zewnątrz - jeśli nie da się jej nawet odtworzyć, nie jest dowodem wyniku
+        return False
+
+
+def revalidate_scores(batch_size=1000):
+    """
+    Re-simulate every stored replay and mark the scores it no longer reproduces.
+
+    Meant to be run after gameplay changes; scores marked invalid drop out of the ranking.
+
+    Args:
+        batch_size (int, optional): Number of rows read and updated per transaction. Defaults to 1000.
+
+    Returns:
+        tuple: (number of replays checked, list of ids of scores that failed).
+    """
+    global _generation
+    connection = _connect()
+    checked = 0
+    failed = []
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            "SELECT id, score, date, difficulty, replay FROM scores"
+            " WHERE replay IS NOT NULL AND id > ? ORDER BY id LIMIT ?",
+            (last_id, batch_size)
+        ).fetchall()
+        if not rows:
+            break
+        updates = []
+        for row_id, score, date, difficulty, blob in rows:
+            valid = _verify({"score": score, "date": date, "difficulty": difficulty}, blob)
+            updates.append((1 if valid else 0, row_id))
+            if not valid:
+                failed.append(row_id)
+        with connection:
+            connection.executemany("UPDATE scores SET verified = ? WHERE id = ?", updates)
+        checked += len(rows)
+        last_id = rows[-1][0]
+    connection.close()
+    with _lock:
+        _cache.clear()
+        _generation += 1
+    return checked, failed
+
+
+def flush(timeout=FLUSH_TIMEOUT):
+    """
+    Wait until every queued score is committed, but at most `timeout` seconds.
+
+    Args:
+        timeout (float, optional): Upper bound on the wait in seconds. Defaults to FLUSH_TIMEOUT.
+
+    Returns:
+        bool: True if everything reached the disk in time.
+    """
+    if _writer is None:
+        return True
+    done = threading.Event()
+    _queue.put(done)
+    return done.wait(timeout)
+
+
+def _writer_loop():
+    """Background loop committing queued entries in batches
+
+    A failed write never stops the thread: the rows stay queued and the insert is
+    retried every RETRY_DELAY seconds, together with entries queued in the meantime.
+    """
+
+    global _generation, rejected, write_errors, last_error
+    connection = None
+    rows = []  # zweryfikowane wiersze czekające na zapis
+    consumed = 0  # ile wpisów z _pending obejmują (łącznie z odrzuconymi)
+    waiters = []
+    while True:
+        try:
+            item = _queue.get(timeout=RETRY_DELAY if consumed else None)
+        except queue.Empty:
+            item = None
+        while item is not None:
+            if isinstance(item, threading.Event):
+                waiters.append(item)
+            else:
+                entry, blob = item
+                if blob is None:
+                    rows.append((entry["score"], entry["date"], entry["difficulty"], None, None))
+                elif _verify(entry, blob):
+                    rows.append((entry["score"], entry["date"], entry["difficulty"], blob, 1))
+                else:
+                    rejected += 1
+                consumed += 1
+            try:
+                item = _queue.get_nowait()
+            except queue.Empty:
+                item = None
+
+        try:
+            if connection is None:
+                connection = _connect()
+                _import_legacy(connection)
+            if rows:
+                with connection:
+                    connection.executemany(
+                        "INSERT INTO scores (score, date, difficulty, replay, verified) VALUES (?, ?, ?, ?, ?)",
+                        rows
+                    )
+        except Exception as e:
+            write_errors += 1
+            last_error = e
+            if connection is not None:
+                connection.close()
+                connection = None
+            continue
+
+        if consumed:
+            with _lock:
+                # Wpisy są już w bazie - unieważnij pamięć podręczną odczytów
+                _cache.clear()
+                _generation += 1
+                del _pending[:consumed]
+            rows = []
+            consumed = 0
+        for waiter in waiters:
+            waiter.set()
+        waiters = []
+
+
+def _ensure_writer():
+    """Start the background writer thread on first use"""
+
+    global _writer
+    if _writer is None:
+        _writer = threading.Thread(target=_writer_loop, name="score-writer", daemon=True)
+        _writer.start()
+        atexit.register(flush)
@@ -2,4 +2,23 @@
 
 difficulty = "Łatwy"  # domyślny poziom trudności
 SCREEN_WIDTH = 800
-SCREEN_HEIGHT = 600
\ No newline at end of file
+SCREEN_HEIGHT = 600
+LANE_COUNT = 3  # liczba pasów; od niej zależy rozmiar sprite'ów w assets/build
+
+SIMULATION_RATE = 60  # liczba kroków logiki gry na sekundę, niezależna od liczby klatek
+MAX_CATCH_UP_STEPS = 5  # ile kroków logiki można nadrobić w jednej klatce
+
+PROFILER_ENABLED = False  # pomiar czasu faz klatki; F3 w trakcie gry pokazuje nakładkę
+
+ASSET_MEMORY_BUDGET = 64 * 1024 * 1024  # limit pamięci na zdekodowane tekstury i dźwięki (w bajtach)
+
+ASSET_LOADER_THREADS = 4  # liczba wątków dekodujących grafiki i dźwięki w tle
+LOADING_FRAME_BUDGET = 0.004  # ile czasu klatki (w sekundach) ekran ładowania może poświęcić na przekazanie zasobów
+TEXTURE_ATLAS_SIZE = 2048  # początkowy rozmiar atlasu tekstur na GPU, żeby nie był powiększany w trakcie ładowania
+
+MAX_SOUND_VOICES = 8  # ile efektów dźwiękowych może grać jednocześnie
+SOUND_COALESCE_WINDOW = 0.05  # ten sam efekt wywołany ponownie w tym czasie (w sekundach) gra tylko raz
+
+MUSIC_VOLUME = 0.5  # głośność muzyki w tle (0.0 - 1.0)
+MUSIC_CROSSFADE = 1.5  # czas przenikania utworów między menu a grą (w sekundach)
+MUSIC_BUFFER_BYTES = 128 * 1024  # bufor dekodowanej muzyki na utwór; tyle zajmuje utwór w pamięci niezależnie od długości
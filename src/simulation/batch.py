@@ -0,0 +1,231 @@
+import numpy as np
+from settings import SCREEN_HEIGHT, SCREEN_WIDTH
+from simulation.engine import (get_difficulty, FIXED_TIMESTEP, SPEED_UP_PERIOD, MIN_OBSTACLE_INTERVAL,
+                               BONUS_POINTS, START_LIVES, PLAYER_X,
+                               PLAYER_ASPECT, OBSTACLE_ASPECT, BONUS_ASPECT)
+
+EMPTY = 0
+OBSTACLE = 1
+BONUS = 2
+
+
+class BatchEnv:
+    """Many independent games stepped together with NumPy
+
+    Every game follows the rules of simulation.engine.Simulation, but the state of all
+    games lives in arrays: one row per game, and a fixed number of entity slots per
+    game. Movement, spawning, spacing checks and swept collisions are computed for all
+    games at once.
+
+    The batch draws from a single NumPy generator, so runs are reproducible per batch
+    seed but not bit-identical to a Simulation with the same seed. Entities in one lane
+    may pass through each other, as in the original game, instead of queueing.
+    """
+
+    def __init__(self, count, difficulty="Łatwy", seed=None, lane_count=3, slots=16,
+                 width=SCREEN_WIDTH, height=SCREEN_HEIGHT, delta_time=FIXED_TIMESTEP):
+        """Initialize the batch and reset every game
+
+        Args:
+            count (int): Number of games
+            difficulty (str, Difficulty or list, optional): One preset for all games or one per game. Defaults to "Łatwy"
+            seed (int, optional): Seed of the batch generator. Defaults to None
+            lane_count (int, optional): Number of lanes. Defaults to 3
+            slots (int, optional): Maximum number of entities per game; spawns beyond it are dropped. Defaults to 16
+            width (int, optional): Width of the playfield. Defaults to SCREEN_WIDTH
+            height (int, optional): Height of the playfield. Defaults to SCREEN_HEIGHT
+            delta_time (float, optional): Length of one step. Defaults to FIXED_TIMESTEP
+        """
+
+        self.count = count
+        self.lane_count = lane_count
+        self.slots = slots
+        self.delta_time = delta_time
+        self.spawn_x = width + 40
+        self.lane_height = int((1 / 2) * height // lane_count)
+        self.lane_y = np.array([self.lane_height // 2 + i * self.lane_height for i in range(lane_count)], dtype=np.float64)
+
+        self.player_left = PLAYER_X - self.lane_height * PLAYER_ASPECT / 2
+        self.player_right = PLAYER_X + self.lane_height * PLAYER_ASPECT / 2
+        # Połowy szerokości indeksowane rodzajem: EMPTY, OBSTACLE, BONUS
+        self.half_widths = np.array([0.0, self.lane_height * 0.25 * OBSTACLE_ASPECT, self.lane_height * 0.25 * BONUS_ASPECT])
+
+        presets = difficulty if isinstance(difficulty, (list, tuple)) else [difficulty] * count
+        presets = [get_difficulty(preset) for preset in presets]
+        self.initial_speed = np.array([p.speed for p in presets], dtype=np.float64)
+        self.max_speed = np.array([p.max_speed for p in presets], dtype=np.float64)
+        self.speed_increment = np.array([p.speed_increment for p in presets], dtype=np.float64)
+        self.base_obstacle_interval = np.array([p.obstacle_interval for p in presets], dtype=np.float64)
+        self.bonus_interval = np.array([p.bonus_interval for p in presets], dtype=np.float64)
+        self.interval_step = np.array([p.interval_step for p in presets], dtype=np.float64)
+        self.double_chance = np.array([p.double_chance for p in presets], dtype=np.float64)
+
+        self.rng = np.random.default_rng(seed)
+        self.speed = np.empty(count)
+        self.next_obstacle_time = np.empty(count)
+        self.next_bonus_time = np.empty(count)
+        self.time_since_speed_increase = np.empty(count)
+        self.time = np.empty(count)
+        self.score = np.empty(count, dtype=np.int64)
+        self.lives = np.empty(count, dtype=np.int64)
+        self.done = np.empty(count, dtype=bool)
+        self.player_lane = np.empty(count, dtype=np.int64)
+
+        # Stany gier w wierszach, encje w stałej liczbie slotów; pusty slot ma rodzaj EMPTY
+        self.x = np.zeros((count, slots), dtype=np.float32)
+        self.half_width = np.zeros((count, slots), dtype=np.float32)
+        self.entity_speed = np.zeros((count, slots), dtype=np.float32)
+        self.lane = np.zeros((count, slots), dtype=np.int64)
+        self.kind = np.zeros((count, slots), dtype=np.int8)
+        self.dropped_spawns = 0
+        self.reset()
+
+    def reset(self, mask=None):
+        """Reset some or all games to the starting state
+
+        Args:
+            mask (np.ndarray, optional): Boolean array selecting games to reset. Defaults to all games
+        """
+
+        if mask is None:
+            mask = np.ones(self.count, dtype=bool)
+        n = int(mask.sum())
+        self.speed[mask] = self.initial_speed[mask]
+        self.next_obstacle_time[mask] = self.base_obstacle_interval[mask] + self.rng.uniform(-0.3, 0.3, n)
+        self.next_bonus_time[mask] = self.bonus_interval[mask] + self.rng.uniform(-0.5, 0.5, n)
+        self.time_since_speed_increase[mask] = 0
+        self.time[mask] = 0
+        self.score[mask] = 0
+        self.lives[mask] = START_LIVES
+        self.done[mask] = False
+        self.player_lane[mask] = 1
+        self.kind[mask] = EMPTY
+        self.entity_speed[mask] = 0
+
+    def _too_close(self, games, x, lane, min_distance, kind=None):
+        """Vectorized spacing check of one candidate spawn per selected game"""
+
+        kinds = self.kind[games]
+        occupied = kinds != EMPTY if kind is None else kinds == kind
+        dx = x - self.x[games]
+        dy = self.lane_y[lane][:, None] - self.lane_y[self.lane[games]]
+        return (occupied & (np.hypot(dx, dy) < min_distance)).any(axis=1)
+
+    def _insert(self, games, kind, lane, x):
+        """Put new entities into the first free slot of each selected game"""
+
+        free = self.kind[games] == EMPTY
+        has_free = free.any(axis=1)
+        self.dropped_spawns += int((~has_free).sum())
+        games = games[has_free]
+        slot = free[has_free].argmax(axis=1)
+        self.kind[games, slot] = kind
+        self.lane[games, slot] = lane[has_free]
+        self.x[games, slot] = x
+        self.half_width[games, slot] = self.half_widths[kind]
+        self.entity_speed[games, slot] = self.speed[games]
+
+    def _remove(self, mask):
+        """Free the selected slots; an empty slot does not move"""
+
+        self.kind[mask] = EMPTY
+        self.entity_speed[mask] = 0
+
+    def _spawn(self, dt):
+        """Run the obstacle and bonus spawn timers of every live game"""
+
+        live = ~self.done
+        rng = self.rng
+        obstacle_interval = np.maximum(self.base_obstacle_interval - (self.score // 100) * self.interval_step, MIN_OBSTACLE_INTERVAL)
+
+        self.next_obstacle_time[live] -= dt
+        due = np.flatnonzero(live & (self.next_obstacle_time <= 0))
+        if due.size:
+            self.next_obstacle_time[due] = obstacle_interval[due] + rng.uniform(-0.3, 0.3, due.size)
+            lane = rng.integers(0, self.lane_count, due.size)
+            ok = ~self._too_close(due, self.spawn_x, lane, 80)
+            games, lane = due[ok], lane[ok]
+            self._insert(games, OBSTACLE, lane, self.spawn_x)
+
+            # 33% szans na podwójną przeszkodę w innym pasie
+            double = rng.random(games.size) < self.double_chance[games]
+            games, lane = games[double], lane[double]
+            other = (lane + rng.integers(1, 3, games.size)) % self.lane_count
+            ok = ~self._too_close(games, self.spawn_x + 60, other, 80, kind=OBSTACLE)
+            self._insert(games[ok], OBSTACLE, other[ok], self.spawn_x + 60)
+
+        self.next_bonus_time[live] -= dt
+        due = np.flatnonzero(live & (self.next_bonus_time <= 0))
+        if due.size:
+            self.next_bonus_time[due] = self.bonus_interval[due] + rng.uniform(-0.5, 0.5, due.size)
+            lane = rng.integers(0, self.lane_count, due.size)
+            ok = ~self._too_close(due, self.spawn_x, lane, 120)
+            self._insert(due[ok], BONUS, lane[ok], self.spawn_x)
+
+    def step(self, actions=None):
+        """Advance every live game by one step
+
+        Args:
+            actions (np.ndarray, optional): Per-game lane change: 1 up, -1 down, 0 stay. Defaults to no input
+
+        Returns:
+            dict: Observation arrays, see observe()
+        """
+
+        dt = self.delta_time
+        live = ~self.done
+        if actions is not None:
+            moved = np.clip(self.player_lane + actions, 0, self.lane_count - 1)
+            self.player_lane = np.where(live, moved, self.player_lane)
+
+        self.time[live] += dt
+        self.time_since_speed_increase[live] += dt
+        ramp = live & (self.time_since_speed_increase >= SPEED_UP_PERIOD)
+        self.speed[ramp] = np.minimum(self.speed[ramp] + self.speed_increment[ramp], self.max_speed[ramp])
+        self.time_since_speed_increase[ramp] = 0
+
+        self._spawn(dt)
+
+        # Kolizje liczone analitycznie przed ruchem, jak w Simulation._collide
+        left = self.x - self.half_width
+        hit = ((self.kind != EMPTY) & (self.lane == self.player_lane[:, None]) &
+               (self.x + self.half_width > self.player_left) &
+               (left - self.player_right <= self.entity_speed * dt))
+        if hit.any():
+            self.lives -= (hit & (self.kind == OBSTACLE)).sum(axis=1)
+            self.score += BONUS_POINTS * (hit & (self.kind == BONUS)).sum(axis=1)
+            self._remove(hit)
+            ended = live & (self.lives <= 0)
+            if ended.any():
+                self.done |= ended
+                self._remove(ended[:, None] & (self.kind != EMPTY))
+
+        self.x -= self.entity_speed * dt
+        self._remove((self.kind != EMPTY) & (self.x + self.half_width < 0))
+        return self.observe()
+
+    def observe(self):
+        """Return the observable state of every game
+
+        Returns:
+            dict: 'player_lane', 'lives', 'score', 'speed', 'time', 'done' arrays of shape (count,)
+                  and 'nearest' of shape (count, lane_count, 2) with the distance from the
+                  player's right edge to the next obstacle (index 0) and bonus (index 1) in
+                  each lane, inf if there is none
+        """
+
+        # Jedno przejście po zajętych slotach zamiast osobnej redukcji dla każdego pasa i rodzaju
+        nearest = np.full((self.count, self.lane_count * 2), np.inf, dtype=np.float32)
+        rows, slots = np.nonzero((self.kind != EMPTY) & (self.x + self.half_width > self.player_left))
+        cells = rows * (self.lane_count * 2) + self.lane[rows, slots] * 2 + (self.kind[rows, slots] - OBSTACLE)
+        gaps = self.x[rows, slots] - self.half_width[rows, slots] - self.player_right
+        np.minimum.at(nearest.ravel(), cells, gaps)
+        return {
+            "player_lane": self.player_lane.copy(),
+            "lives": self.lives.copy(),
+            "score": self.score.copy(),
+            "speed": self.speed.copy(),
+            "time": self.time.copy(),
+            "done": self.done.copy(),
+            "nearest": nearest.reshape(self.count, self.lane_count, 2),
+        }
@@ -0,0 +1,809 @@
+import heapq
+import math
+import random
+from collections import deque, namedtuple
+from dataclasses import dataclass
+from profiler import NULL_PROFILER
+from settings import SCREEN_HEIGHT, SCREEN_WIDTH
+
+# Symulacja nie importuje arcade ani pygleta - da się ją uruchomić bez okna
+
+FIXED_TIMESTEP = 1 / 60
+SPEED_UP_PERIOD = 15
+MIN_OBSTACLE_INTERVAL = 0.6
+INTERVAL_STEP = 0.2
+DOUBLE_OBSTACLE_CHANCE = 0.33
+BONUS_POINTS = 10
+TRIUMPH_STEP = 100
+START_LIVES = 3
+
+LOOKAHEAD = 5.0  # ile sekund gry harmonogram generuje naprzód
+CHUNK_TICKS = 30  # maksymalna liczba kroków generowanych za jednym razem
+TRACK_DISTANCE = 300  # jak daleko za punktem startu śledzić obiekty do sprawdzania odstępów
+
+PLAYER_X = 100
+SPAWN_X = SCREEN_WIDTH + 40
+
+# Proporcje (szerokość / wysokość) tekstur używanych przez sprite'y
+PLAYER_ASPECT = 500 / 500
+OBSTACLE_ASPECT = 680 / 609
+BONUS_ASPECT = 512 / 512
+
+OBSTACLE = "obstacle"
+BONUS = "bonus"
+
+MOVE_UP = 1
+MOVE_DOWN = -1
+
+EVENT_SPAWN = "spawn"
+EVENT_DESPAWN = "despawn"
+EVENT_HIT = "hit"
+EVENT_COLLECT = "collect"
+EVENT_SPEED_UP = "speed_up"
+EVENT_TRIUMPH = "triumph"
+EVENT_GAME_OVER = "game_over"
+
+SpawnEvent = namedtuple("SpawnEvent", "tick seq kind lane x speed")
+
+
+@dataclass(frozen=True)
+class Difficulty:
+    """Tunable parameters of a difficulty preset"""
+
+    speed: float
+    max_speed: float
+    speed_increment: float
+    obstacle_interval: float
+    bonus_interval: float
+    interval_step: float = INTERVAL_STEP  # o ile krótszy odstęp przeszkód co 100 punktów
+    double_chance: float = DOUBLE_OBSTACLE_CHANCE
+
+
+DIFFICULTIES = {
+    "Łatwy": Difficulty(speed=400, max_speed=700, speed_increment=50, obstacle_interval=1.8, bonus_interval=3.5),
+    "Trudny": Difficulty(speed=600, max_speed=1000, speed_increment=75, obstacle_interval=1.2, bonus_interval=4.0),
+}
+
+
+def get_difficulty(name):
+    """Return the preset for a difficulty name; unknown names fall back to "Trudny" like the original setup
+
+    Args:
+        name (str or Difficulty): Difficulty name or an already built preset
+
+    Returns:
+        Difficulty: The matching preset
+    """
+
+    if isinstance(name, Difficulty):
+        return name
+    return DIFFICULTIES.get(name, DIFFICULTIES["Trudny"])
+
+
+class Entity:
+    """A lane-bound obstacle or bonus moving right-to-left at a constant speed"""
+
+    __slots__ = ("uid", "kind", "lane", "x", "prev_x", "y", "speed", "half_width", "half_height")
+
+    def __init__(self, uid, kind, lane, x, y, speed, width, height):
+        """Initialize an entity
+
+        Args:
+            uid (int): Identifier unique within one simulation
+            kind (str): OBSTACLE or BONUS
+            lane (int): Index of the lane the entity moves in
+            x (float): Horizontal center position
+            y (float): Vertical center position
+            speed (float): Horizontal speed in pixels per second
+            width (float): Width of the hit box
+            height (float): Height of the hit box
+        """
+
+        self.uid = uid
+        self.kind = kind
+        self.lane = lane
+        self.x = x
+        self.prev_x = x
+        self.y = y
+        self.speed = speed
+        self.half_width = width / 2
+        self.half_height = height / 2
+
+    def interpolated_x(self, alpha):
+        """Return the position between the previous and the current step
+
+        Args:
+            alpha (float): 0 for the previous step, 1 for the current one
+
+        Returns:
+            float: Interpolated horizontal position
+        """
+
+        return self.prev_x + (self.x - self.prev_x) * alpha
+
+    def copy(self):
+        """Return an independent copy of the entity
+
+        Returns:
+            Entity: Entity with the same attributes
+        """
+
+        clone = Entity.__new__(Entity)
+        clone.uid = self.uid
+        clone.kind = self.kind
+        clone.lane = self.lane
+        clone.x = self.x
+        clone.prev_x = self.prev_x
+        clone.y = self.y
+        clone.speed = self.speed
+        clone.half_width = self.half_width
+        clone.half_height = self.half_height
+        return clone
+
+    @property
+    def left(self):
+        """float: Left edge of the hit box"""
+
+        return self.x - self.half_width
+
+    @property
+    def right(self):
+        """float: Right edge of the hit box"""
+
+        return self.x + self.half_width
+
+
+def _too_close(lanes, lane_ys, lane_height, x, lane, min_distance, kind=None):
+    """Check if a new object at x in a lane would be too close to an existing entity
+
+    Lanes are sorted left to right, so only the entities at the right end of the lanes
+    within reach of min_distance are inspected; the walk stops as soon as the horizontal
+    gap alone reaches min_distance.
+
+    Args:
+        lanes (list of deque): Entities of every lane, left to right
+        lane_ys (list of float): Vertical center of every lane
+        lane_height (float): Distance between neighbouring lanes
+        x (float): X coordinate of the new object
+        lane (int): Lane of the new object
+        min_distance (float): Minimum allowed distance
+        kind (str, optional): Only compare with OBSTACLE or BONUS entities; None compares
+                              with both. Defaults to None
+
+    Returns:
+        bool: True if an entity is too close, False otherwise
+    """
+
+    reach = math.ceil(min_distance / lane_height)
+    y = lane_ys[lane]
+    for other in range(max(0, lane - reach), min(len(lanes), lane + reach + 1)):
+        dy = y - lane_ys[other]
+        for entity in reversed(lanes[other]):
+            dx = x - entity.x
+            if dx >= min_distance:
+                break
+            if (kind is None or entity.kind == kind) and math.hypot(dx, dy) < min_distance:
+                return True
+    return False
+
+
+def _advance(lanes, delta_time):
+    """Move every entity left, queueing entities that catch up with the one ahead
+
+    Args:
+        lanes (list of deque): Entities of every lane, left to right
+        delta_time (float): Length of the step
+    """
+
+    for lane in lanes:
+        ahead = None
+        for entity in lane:
+            entity.prev_x = entity.x
+            entity.x -= entity.speed * delta_time
+            if ahead is not None:
+                limit = ahead.x + ahead.half_width + entity.half_width
+                if entity.x < limit:
+                    entity.x = limit
+                    entity.speed = ahead.speed
+            ahead = entity
+
+
+class SpawnTimeline:
+    """Validated spawn events of the next few seconds, generated ahead of the simulation
+
+    The timeline owns the spawn timers and the simulation's random generator. It runs
+    the spawn rules of the original game step by step, but ahead of time and in chunks
+    of at most CHUNK_TICKS steps, and keeps the resulting events in a heap ordered by
+    step. The simulation only pops the events that are due.
+
+    Spacing checks need the positions of earlier entities near the spawn point. The
+    timeline keeps its own copies of the entities within TRACK_DISTANCE of the spawn
+    point and moves them with the same code as the simulation; the generated pattern is
+    the same as spawning on the fly.
+
+    The player influences the future in two ways: the score shortens the obstacle
+    interval, and on a narrow playfield a hit or a pickup can remove an entity the
+    copies still track. Before every obstacle roll the generator state is saved; when
+    the score reaches a new hundred or a tracked entity is removed, the timeline rewinds
+    to the current step and regenerates from there.
+    """
+
+    def __init__(self, sim, lookahead=LOOKAHEAD, chunk_ticks=CHUNK_TICKS):
+        """Attach a timeline to a simulation
+
+        Args:
+            sim (Simulation): Simulation the events are generated for
+            lookahead (float, optional): Seconds of events kept ready by fill(). Defaults to LOOKAHEAD
+            chunk_ticks (int, optional): Maximum number of steps generated per call. Defaults to CHUNK_TICKS
+        """
+
+        self.sim = sim
+        self.lookahead = lookahead
+        self.chunk_ticks = chunk_ticks
+
+    def reset(self):
+        """Reset the generator to the start of a game using the simulation's difficulty and RNG"""
+
+        sim = self.sim
+        config = sim.difficulty
+        self.rng = sim.rng
+        self.speed = config.speed
+        self.max_speed = config.max_speed
+        self.speed_increment = config.speed_increment
+        self.base_obstacle_interval = config.obstacle_interval
+        self.bonus_interval = config.bonus_interval
+        self.interval_step = config.interval_step
+        self.double_chance = config.double_chance
+
+        # losowy rozrzut czasowy
+        self.next_obstacle_time = config.obstacle_interval + self.rng.uniform(-0.3, 0.3)
+        self.next_bonus_time = config.bonus_interval + self.rng.uniform(-0.5, 0.5)
+        self.time_since_speed_increase = 0
+
+        self.events = []
+        self.checkpoints = []
+        self.tracked = None
+        self.tick = sim.tick
+        self.delta_time = None
+        self.bracket = sim.score // 100
+        self.seq = 0
+        self.rejected = 0
+
+    @property
+    def horizon(self):
+        """int: Last simulation step whose events have been generated"""
+
+        return self.tick
+
+    def upcoming(self):
+        """Return the pending events in the order they will be spawned
+
+        Returns:
+            list of SpawnEvent: Generated events that have not been popped yet
+        """
+
+        return sorted(self.events)
+
+    def _track(self):
+        """Copy the simulation's entities near the spawn point"""
+
+        threshold = self.sim.spawn_x - TRACK_DISTANCE
+        return [deque(entity.copy() for entity in lane if entity.x >= threshold)
+                for lane in self.sim.lane_entities]
+
+    def _start(self, tick, delta_time):
+        """Begin generating at step `tick` from the simulation's current entities"""
+
+        self.delta_time = delta_time
+        self.tick = tick - 1
+        self.tracked = self._track()
+        self._checkpoint()
+
+    def _checkpoint(self):
+        """Save the generator state at the start of step self.tick + 1"""
+
+        self.checkpoints.append((
+            self.tick, self.rng.getstate(), self.speed, self.time_since_speed_increase,
+            self.next_obstacle_time, self.next_bonus_time, self.seq, self.rejected,
+            [[entity.copy() for entity in lane] for lane in self.tracked],
+        ))
+
+    def _restore(self, checkpoint):
+        (self.tick, state, self.speed, self.time_since_speed_increase, self.next_obstacle_time,
+         self.next_bonus_time, self.seq, self.rejected, tracked) = checkpoint
+        self.rng.setstate(state)
+        self.tracked = [deque(entity.copy() for entity in lane) for lane in tracked]
+
+    def _rewind(self, tick):
+        """Bring the generator back to the end of `tick` and drop every event after it"""
+
+        index = 0
+        while index + 1 < len(self.checkpoints) and self.checkpoints[index + 1][0] <= tick:
+            index += 1
+        self._restore(self.checkpoints[index])
+        del self.checkpoints[index + 1:]
+        while self.tick < tick:
+            self._step(emit=False)
+        self.events = [event for event in self.events if event.tick <= tick]
+        heapq.heapify(self.events)
+
+    def rescore(self, score):
+        """Account for a score change made during the simulation's current step
+
+        Args:
+            score (int): New score of the simulation
+        """
+
+        bracket = score // 100
+        if bracket == self.bracket:
+            return
+        if self.tracked is None:
+            self.bracket = bracket
+            return
+        if self.tick > self.sim.tick:
+            self._rewind(self.sim.tick)
+        self.bracket = bracket
+        # Późniejsze cofanie (np. przy zmianie długości kroku) nie może przejść przez zmianę
+        # progu, bo powtórzyłoby wcześniejsze kroki z nowym odstępem przeszkód
+        self._checkpoint()
+
+    def resync(self):
+        """Account for entities removed near the spawn point during the simulation's current step
+
+        Call after the simulation has moved its entities: the copies are replaced with the
+        simulation's own entities at the end of the step.
+        """
+
+        if self.tracked is None:
+            return
+        if self.tick > self.sim.tick:
+            self._rewind(self.sim.tick)
+        self.tracked = self._track()
+        self._checkpoint()
+
+    def _too_close(self, x, lane, min_distance, kind=None):
+        sim = self.sim
+        return _too_close(self.tracked, sim.lanes, sim.lane_height, x, lane, min_distance, kind)
+
+    def _emit(self, emit, kind, lane, x):
+        sim = self.sim
+        width, height = sim.obstacle_size if kind == OBSTACLE else sim.bonus_size
+        self.tracked[lane].append(Entity(self.seq, kind, lane, x, sim.lanes[lane], self.speed, width, height))
+        if emit:
+            heapq.heappush(self.events, SpawnEvent(self.tick, self.seq, kind, lane, x, self.speed))
+        self.seq += 1
+
+    def _step(self, emit=True):
+        """Generate the spawns of the next simulation step"""
+
+        sim = self.sim
+        dt = self.delta_time
+        if self.next_obstacle_time - dt <= 0:
+            self._checkpoint()
+        self.tick += 1
+
+        self.time_since_speed_increase += dt
+        if self.time_since_speed_increase >= SPEED_UP_PERIOD:
+            self.speed = min(self.speed + self.speed_increment, self.max_speed)
+            self.time_since_speed_increase = 0
+
+        # Dynamiczne zmniejszanie odstępu między przeszkodami wraz z wynikiem
+        obstacle_interval = max(self.base_obstacle_interval - self.bracket * self.interval_step, MIN_OBSTACLE_INTERVAL)
+
+        rng = self.rng
+        spawn_x = sim.spawn_x
+        self.next_obstacle_time -= dt
+        if self.next_obstacle_time <= 0:
+            self.next_obstacle_time = obstacle_interval + rng.uniform(-0.3, 0.3)
+
+            lane = rng.randint(0, sim.lane_count - 1)
+            if self._too_close(spawn_x, lane, 80):
+                self.rejected += 1
+            else:
+                self._emit(emit, OBSTACLE, lane, spawn_x)
+
+                # 33% szans na podwójną przeszkodę w innym pasie
+                if rng.random() < self.double_chance:
+                    other_lane = (lane + rng.choice([1, 2])) % sim.lane_count
+                    if self._too_close(spawn_x + 60, other_lane, 80, kind=OBSTACLE):
+                        self.rejected += 1
+                    else:
+                        self._emit(emit, OBSTACLE, other_lane, spawn_x + 60)
+
+        self.next_bonus_time -= dt
+        if self.next_bonus_time <= 0:
+            self.next_bonus_time = self.bonus_interval + rng.uniform(-0.5, 0.5)
+
+            lane = rng.randint(0, sim.lane_count - 1)
+            if self._too_close(spawn_x, lane, 120):
+                self.rejected += 1
+            else:
+                self._emit(emit, BONUS, lane, spawn_x)
+
+        # Śledzone kopie poruszają się tym samym kodem co obiekty w Simulation._move
+        _advance(self.tracked, dt)
+        threshold = spawn_x - TRACK_DISTANCE
+        for lane in self.tracked:
+            while lane and lane[0].x < threshold:
+                lane.popleft()
+
+    def generate(self, max_ticks=None):
+        """Generate at most one chunk of steps ahead
+
+        Args:
+            max_ticks (int, optional): Step limit of this call. Defaults to chunk_ticks
+
+        Returns:
+            int: Number of steps generated
+        """
+
+        if self.tracked is None:
+            return 0
+        count = self.chunk_ticks if max_ticks is None else max_ticks
+        for _ in range(count):
+            self._step()
+        return count
+
+    def fill(self, max_chunks=None):
+        """Generate chunks until the lookahead is covered; meant for idle time between frames
+
+        Args:
+            max_chunks (int, optional): Upper bound on the chunks generated by this call. Defaults to no bound
+
+        Returns:
+            int: Number of steps generated
+        """
+
+        if self.tracked is None:
+            return 0
+        target = self.sim.tick + math.ceil(self.lookahead / self.delta_time)
+        generated = chunks = 0
+        while self.tick < target and (max_chunks is None or chunks < max_chunks):
+            generated += self.generate(min(self.chunk_ticks, target - self.tick))
+            chunks += 1
+        return generated
+
+    def pop_due(self, tick, delta_time):
+        """Remove and return the events of a simulation step, generating more if needed
+
+        Args:
+            tick (int): Step being simulated
+            delta_time (float): Length of that step
+
+        Returns:
+            list of SpawnEvent: Events to spawn during the step, in spawn order
+        """
+
+        if self.tracked is None:
+            self._start(tick, delta_time)
+        elif delta_time != self.delta_time:
+            # Inna długość kroku: wygenerowana przyszłość jest nieaktualna
+            self._rewind(tick - 1)
+            self.delta_time = delta_time
+            self._checkpoint()  # późniejsze cofanie nie może przejść przez zmianę długości kroku
+        while self.tick < tick:
+            self.generate()
+
+        checkpoints = self.checkpoints
+        while len(checkpoints) > 1 and checkpoints[1][0] < tick:
+            del checkpoints[0]
+
+        events = self.events
+        due = []
+        while events and events[0].tick <= tick:
+            due.append(heapq.heappop(events))
+        return due
+
+
+
+class Simulation:
+    """Window-free, deterministic game logic driven by GameView or by headless runs
+
+    All randomness comes from a private random.Random, so the same seed and the same
+    input stream always produce the same run. Every call to step() returns a list of
+    (event, entity) tuples describing what happened during that step.
+
+    Entities are kept in one deque per lane, ordered from left to right. A faster
+    entity that catches up with the one ahead of it in the same lane queues behind it
+    instead of passing through, so the order never changes: culling only pops from the
+    left and the player is tested only against the first entries of its own lane.
+    Collisions are resolved from exact contact times, independent of the step length.
+    Spawns are popped from a SpawnTimeline generated ahead of the current step.
+    """
+
+    def __init__(self, difficulty="Łatwy", seed=None, lane_count=3,
+                 width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+        """Initialize the simulation and reset it to the starting state
+
+        Args:
+            difficulty (str or Difficulty, optional): Difficulty preset. Defaults to "Łatwy"
+            seed (int, optional): RNG seed; None seeds from the OS. Defaults to None
+            lane_count (int, optional): Number of lanes. Defaults to 3
+            width (int, optional): Width of the playfield. Defaults to SCREEN_WIDTH
+            height (int, optional): Height of the playfield. Defaults to SCREEN_HEIGHT
+        """
+
+        self.width = width
+        self.spawn_x = width + 40
+        self.lane_count = lane_count
+        self.lane_height = int((1 / 2) * height // lane_count)
+        self.lanes = [self.lane_height // 2 + i * self.lane_height for i in range(lane_count)]
+
+        self.player_half_width = self.lane_height * PLAYER_ASPECT / 2
+        self.player_half_height = self.lane_height / 2
+        self.obstacle_size = (self.lane_height * 0.5 * OBSTACLE_ASPECT, self.lane_height * 0.5)
+        self.bonus_size = (self.lane_height * 0.5 * BONUS_ASPECT, self.lane_height * 0.5)
+
+        self.rng = random.Random()
+        self.profiler = NULL_PROFILER
+        self.timeline = SpawnTimeline(self)
+        self.reset(difficulty, seed)
+
+    def reset(self, difficulty=None, seed=None):
+        """Reset the game state, optionally switching difficulty and reseeding
+
+        Args:
+            difficulty (str or Difficulty, optional): New difficulty preset. Defaults to the current one
+            seed (int, optional): New RNG seed. Defaults to the seed given previously
+        """
+
+        if difficulty is not None:
+            self.difficulty = get_difficulty(difficulty)
+        if seed is not None or not hasattr(self, "seed"):
+            self.seed = seed
+        self.rng.seed(self.seed)
+
+        config = self.difficulty
+        self.speed = config.speed
+        self.max_speed = config.max_speed
+        self.speed_increment = config.speed_increment
+
+        self.time_since_speed_increase = 0
+        self.time = 0.0
+        self.tick = 0
+        self.score = 0
+        self.lives = START_LIVES
+        self.game_over = False
+        self.next_score_sound_threshold = TRIUMPH_STEP
+        self.player_lane = 1
+
+        self.lane_entities = [deque() for _ in range(self.lane_count)]
+        self.entity_count = 0
+        self.events = []
+        self._next_uid = 0
+        self.timeline.reset()
+
+    @property
+    def obstacles(self):
+        """list of Entity: Obstacles currently on the playfield"""
+
+        return [entity for entity in self.entities() if entity.kind == OBSTACLE]
+
+    @property
+    def bonuses(self):
+        """list of Entity: Bonuses currently on the playfield"""
+
+        return [entity for entity in self.entities() if entity.kind == BONUS]
+
+    def entities(self):
+        """Iterate over every entity, lane by lane from left to right
+
+        Yields:
+            Entity: Entities currently on the playfield
+        """
+
+        for lane in self.lane_entities:
+            yield from lane
+
+    @property
+    def player_y(self):
+        """float: Vertical center of the player"""
+
+        return self.lanes[self.player_lane]
+
+    def move_up(self):
+        """Move the player up by one lane if not already in the top lane"""
+
+        if self.player_lane < self.lane_count - 1:
+            self.player_lane += 1
+
+    def move_down(self):
+        """Move the player down by one lane if not already in the bottom lane"""
+
+        if self.player_lane > 0:
+            self.player_lane -= 1
+
+    def apply_input(self, direction):
+        """Apply a lane change
+
+        Args:
+            direction (int): MOVE_UP or MOVE_DOWN
+        """
+
+        if direction == MOVE_UP:
+            self.move_up()
+        elif direction == MOVE_DOWN:
+            self.move_down()
+
+    def spawn(self, kind, lane, x, speed=None):
+        """Create an entity, append it to its lane and emit a spawn event
+
+        Args:
+            kind (str): OBSTACLE or BONUS
+            lane (int): Lane index
+            x (float): Horizontal position; must not be left of the lane's last entity
+            speed (float, optional): Speed of the entity. Defaults to the current game speed
+
+        Returns:
+            Entity: The new entity
+        """
+
+        width, height = self.obstacle_size if kind == OBSTACLE else self.bonus_size
+        speed = self.speed if speed is None else speed
+        entity = Entity(self._next_uid, kind, lane, x, self.lanes[lane], speed, width, height)
+        self._next_uid += 1
+        self.lane_entities[lane].append(entity)
+        self.entity_count += 1
+        self.events.append((EVENT_SPAWN, entity))
+        return entity
+
+    def _move(self, delta_time):
+        """Move every entity left, queueing entities that catch up with the one ahead"""
+
+        _advance(self.lane_entities, delta_time)
+
+    def _cull(self):
+        """Pop entities that left the screen from the front of each lane"""
+
+        events = self.events
+        for lane in self.lane_entities:
+            while lane and lane[0].right < 0:
+                events.append((EVENT_DESPAWN, lane.popleft()))
+                self.entity_count -= 1
+
+    def contact_time(self, entity):
+        """Return how long until an entity starts touching the player, if both share a lane
+
+        Motion is constant-velocity along the lane, so the contact time is exact:
+        the distance between the entity's left edge and the player's right edge divided
+        by the entity's speed. Zero or less means the two already overlap.
+
+        Args:
+            entity (Entity): Entity to check
+
+        Returns:
+            float: Seconds until contact, or math.inf if the entity has already passed the player
+        """
+
+        if entity.right <= PLAYER_X - self.player_half_width:
+            return math.inf
+        return (entity.left - PLAYER_X - self.player_half_width) / entity.speed
+
+    def contacts(self, lane):
+        """Iterate over the upcoming contacts in a lane, nearest first
+
+        Args:
+            lane (int): Lane index
+
+        Yields:
+            tuple: (seconds until contact, entity) for every entity that has not passed the player yet
+        """
+
+        for entity in self.lane_entities[lane]:
+            contact = self.contact_time(entity)
+            if contact != math.inf:
+                yield contact, entity
+
+    def _collide(self, delta_time):
+        """Resolve every contact in the player's lane scheduled within the next delta_time
+
+        Contacts are predicted analytically before the entities move, so a long step
+        (a frame hitch) cannot carry an entity through the player unnoticed. Lanes are a
+        full lane height apart while entities are half a lane tall, so an entity can only
+        touch the player when both are in the same lane.
+
+        Returns:
+            bool: Whether a removed entity was near enough to the spawn point for the timeline to track it
+        """
+
+        lane = self.lane_entities[self.player_lane]
+        threshold = self.spawn_x - TRACK_DISTANCE
+        near_spawn = False
+        index = 0
+        while index < len(lane):
+            entity = lane[index]
+            contact = self.contact_time(entity)
+            if contact == math.inf:
+                index += 1
+                continue
+            if contact > delta_time:
+                break
+
+            del lane[index]
+            self.entity_count -= 1
+            near_spawn = near_spawn or entity.x >= threshold
+            if entity.kind == OBSTACLE:
+                self.events.append((EVENT_HIT, entity))
+                self.lives -= 1
+                if self.lives <= 0:
+                    self.game_over = True
+            else:
+                self.events.append((EVENT_COLLECT, entity))
+                self.score += BONUS_POINTS
+                if self.score >= self.next_score_sound_threshold:
+                    self.events.append((EVENT_TRIUMPH, None))
+                    self.next_score_sound_threshold += TRIUMPH_STEP
+        return near_spawn
+
+    def step(self, delta_time=FIXED_TIMESTEP):
+        """Advance the game by one step
+
+        Args:
+            delta_time (float, optional): Simulated time of the step. Defaults to FIXED_TIMESTEP
+
+        Returns:
+            list of tuple: (event, entity) pairs emitted during the step; entity is None
+                           for events not tied to a single object
+        """
+
+        self.events = events = []
+        if self.game_over:
+            return events
+
+        self.tick += 1
+        self.time += delta_time
+
+        self.time_since_speed_increase += delta_time
+        if self.time_since_speed_increase >= SPEED_UP_PERIOD:
+            self.speed = min(self.speed + self.speed_increment, self.max_speed)
+            events.append((EVENT_SPEED_UP, None))
+            self.time_since_speed_increase = 0
+
+        for event in self.timeline.pop_due(self.tick, delta_time):
+            self.spawn(event.kind, event.lane, event.x, event.speed)
+
+        profiler = self.profiler
+        profiler.mark("update.spawn")
+        score = self.score
+        near_spawn = self._collide(delta_time)
+        if self.score != score:
+            self.timeline.rescore(self.score)
+        profiler.mark("update.collide")
+        self._move(delta_time)
+        if near_spawn:
+            self.timeline.resync()
+        profiler.mark("update.move")
+        self._cull()
+        profiler.mark("update.cull")
+
+        if self.game_over:
+            events.append((EVENT_GAME_OVER, None))
+        return events
+
+    def run(self, ticks, inputs=(), delta_time=FIXED_TIMESTEP):
+        """Run the simulation headlessly for a number of fixed steps
+
+        Args:
+            ticks (int): Maximum number of steps to simulate
+            inputs (Iterable[tuple], optional): (tick, direction) lane changes applied once
+                                                `tick` steps have been completed. Defaults to ()
+            delta_time (float, optional): Length of one step. Defaults to FIXED_TIMESTEP
+
+        Returns:
+            list of tuple: (tick, score, lives) recorded at the start and whenever score or lives change
+        """
+
+        pending = sorted(inputs, key=lambda item: item[0])
+        index = 0
+        trace = [(self.tick, self.score, self.lives)]
+        for _ in range(ticks):
+            if self.game_over:
+                break
+            while index < len(pending) and pending[index][0] <= self.tick:
+                self.apply_input(pending[index][1])
+                index += 1
+            score, lives = self.score, self.lives
+            self.step(delta_time)
+            if self.score != score or self.lives != lives:
+                trace.append((self.tick, self.score, self.lives))
+        return trace
@@ -0,0 +1,138 @@
+import struct
+from dataclasses import dataclass, field
+from simulation.engine import Simulation, MOVE_UP, MOVE_DOWN
+
+# Format pliku (little endian):
+#   nagłówek  MAGIC, wersja u8, seed u64, kroki/s u16, liczba pasów u8, wynik u32, liczba kroków u32,
+#             długość nazwy poziomu u8 + nazwa w UTF-8, liczba wejść u32
+#   wejścia   varint((różnica kroków << 1) | 1 dla ruchu w górę)
+
+MAGIC = b"WCGR"
+VERSION = 1
+HEADER = struct.Struct("<4sBQHBII")
+
+
+class ReplayError(ValueError):
+    """Raised when replay data cannot be decoded"""
+
+
+@dataclass
+class Replay:
+    """Everything needed to re-simulate a run: seed, settings and timestamped lane changes"""
+
+    seed: int
+    difficulty: str
+    rate: int = 60
+    lane_count: int = 3
+    inputs: list = field(default_factory=list)
+    score: int = 0
+    ticks: int = 0
+
+    def record(self, tick, direction):
+        """Append a lane change made after `tick` simulation steps
+
+        Args:
+            tick (int): Number of steps completed when the key was pressed
+            direction (int): MOVE_UP or MOVE_DOWN
+        """
+
+        self.inputs.append((tick, direction))
+
+    def finish(self, score, ticks):
+        """Store the outcome of the run
+
+        Args:
+            score (int): Final score
+            ticks (int): Number of steps until the game ended
+        """
+
+        self.score = score
+        self.ticks = ticks
+
+    def encode(self):
+        """Serialize the replay into the compact binary format
+
+        Returns:
+            bytes: Encoded replay
+        """
+
+        name = self.difficulty.encode("utf-8")
+        out = bytearray(HEADER.pack(MAGIC, VERSION, self.seed, self.rate, self.lane_count, self.score, self.ticks))
+        out.append(len(name))
+        out += name
+        out += struct.pack("<I", len(self.inputs))
+        previous = 0
+        for tick, direction in self.inputs:
+            value = ((tick - previous) << 1) | (1 if direction == MOVE_UP else 0)
+            previous = tick
+            while value >= 0x80:
+                out.append((value & 0x7F) | 0x80)
+                value >>= 7
+            out.append(value)
+        return bytes(out)
+
+    @classmethod
+    def decode(cls, data):
+        """Build a replay from bytes produced by encode()
+
+        Args:
+            data (bytes): Encoded replay
+
+        Returns:
+            Replay: The decoded replay
+
+        Raises:
+            ReplayError: If the data is truncated, not a replay, or has a zero rate or lane count
+        """
+
+        try:
+            magic, version, seed, rate, lane_count, score, ticks = HEADER.unpack_from(data)
+            if magic != MAGIC or version != VERSION:
+                raise ReplayError("not a replay or unsupported version")
+            if rate == 0 or lane_count == 0:
+                raise ReplayError(f"invalid replay header: rate {rate}, {lane_count} lanes")
+            offset = HEADER.size
+            name_length = data[offset]
+            difficulty = bytes(data[offset + 1:offset + 1 + name_length]).decode("utf-8")
+            offset += 1 + name_length
+            (count,) = struct.unpack_from("<I", data, offset)
+            offset += 4
+
+            inputs = []
+            tick = 0
+            for _ in range(count):
+                value = 0
+                shift = 0
+                while True:
+                    byte = data[offset]
+                    offset += 1
+                    value |= (byte & 0x7F) << shift
+                    shift += 7
+                    if byte < 0x80:
+                        break
+                tick += value >> 1
+                inputs.append((tick, MOVE_UP if value & 1 else MOVE_DOWN))
+        except (struct.error, IndexError, UnicodeDecodeError) as e:
+            raise ReplayError(f"truncated or corrupted replay: {e}") from e
+        return cls(seed, difficulty, rate, lane_count, inputs, score, ticks)
+
+    def simulate(self):
+        """Re-simulate the run as fast as possible
+
+        Returns:
+            Simulation: The simulation after the recorded number of steps (or game over)
+        """
+
+        sim = Simulation(self.difficulty, seed=self.seed, lane_count=self.lane_count)
+        sim.run(self.ticks, self.inputs, delta_time=1 / self.rate)
+        return sim
+
+    def verify(self):
+        """Check that re-simulating the inputs reproduces the recorded outcome
+
+        Returns:
+            bool: True if the game ends with the recorded score after the recorded number of steps
+        """
+
+        sim = self.simulate()
+        return sim.game_over and sim.score == self.score and sim.tick == self.ticks
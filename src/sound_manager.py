@@ -0,0 +1,126 @@
+import time
+import pyglet
+import asset_manager
+from settings import MAX_SOUND_VOICES, SOUND_COALESCE_WINDOW
+
+
+class SoundManager:
+    """Plays short sound effects on a bounded pool of reusable voices
+
+    Effects are decoded once through asset_manager and kept for the whole session. At
+    most max_voices play at the same time: a new effect takes a voice that has finished,
+    and when none has, it stops the one that has been playing the longest. The same
+    effect triggered again within coalesce_window seconds (e.g. several pickups handled
+    in one frame) is played only once.
+    """
+
+    def __init__(self, max_voices=MAX_SOUND_VOICES, coalesce_window=SOUND_COALESCE_WINDOW, clock=time.perf_counter):
+        """Initialize a manager without voices
+
+        Args:
+            max_voices (int, optional): Maximum number of effects playing at once. Defaults to MAX_SOUND_VOICES
+            coalesce_window (float, optional): Seconds within which repeated triggers of one effect are merged.
+                Defaults to SOUND_COALESCE_WINDOW
+            clock (Callable[[], float], optional): Time source in seconds. Defaults to time.perf_counter
+        """
+
+        self.max_voices = max_voices
+        self.coalesce_window = coalesce_window
+        self.clock = clock
+        self.sounds = {}
+        self.voices = []
+        self.started = {}
+        self.last_played = {}
+        self.played = 0
+        self.coalesced = 0
+        self.stolen = 0
+
+    def load(self, names):
+        """Decode effects ahead of time
+
+        Args:
+            names (Iterable[str]): Logical names of the sounds, e.g. "sounds/coin1.wav"
+        """
+
+        for name in names:
+            if name not in self.sounds:
+                self.sounds[name] = asset_manager.cache.sound(name, owner=self)
+
+    def _voice(self, now):
+        """Return a voice ready for a new effect, creating or stealing one if needed"""
+
+        for voice in self.voices:
+            if voice.source is None:
+                break
+        else:
+            if len(self.voices) < self.max_voices:
+                voice = pyglet.media.Player()
+                self.voices.append(voice)
+            else:
+                voice = min(self.voices, key=self.started.__getitem__)
+                voice.pause()
+                voice.next_source()
+                self.stolen += 1
+        self.started[voice] = now
+        return voice
+
+    def play(self, name, volume=1.0):
+        """Play an effect unless the same one has just started
+
+        Args:
+            name (str): Logical name of the sound
+            volume (float, optional): Volume from 0.0 to 1.0. Defaults to 1.0
+
+        Returns:
+            pyglet.media.Player or None: The voice playing the effect, None if it was merged with a recent trigger
+        """
+
+        now = self.clock()
+        last = self.last_played.get(name)
+        if last is not None and now - last < self.coalesce_window:
+            self.coalesced += 1
+            return None
+        self.last_played[name] = now
+
+        if name not in self.sounds:
+            self.load([name])
+        voice = self._voice(now)
+        voice.volume = volume
+        voice.queue(self.sounds[name].source)
+        voice.play()
+        self.played += 1
+        return voice
+
+    def active_voices(self):
+        """Return the number of effects currently playing
+
+        Returns:
+            int: Voices that have not finished yet
+        """
+
+        return sum(1 for voice in self.voices if voice.source is not None)
+
+    def stats(self):
+        """Return playback statistics
+
+        Returns:
+            dict: Voice count, active voices, voice limit, played, coalesced and stolen effects
+        """
+
+        return {
+            "voices": len(self.voices),
+            "active": self.active_voices(),
+            "max_voices": self.max_voices,
+            "played": self.played,
+            "coalesced": self.coalesced,
+            "stolen": self.stolen,
+        }
+
+
+effects = SoundManager()
+
+
+def play(name, volume=1.0):
+    """Shortcut for effects.play()"""
+
+    return effects.play(name, volume)
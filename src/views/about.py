@@ -1,6 +1,7 @@
 import arcade
-import os
+import asset_manager
 from views.base_view import BaseView
+from rendering.static_screen import StaticScreen
 from settings import SCREEN_HEIGHT, SCREEN_WIDTH
 
 class AboutView(arcade.View):
@@ -13,14 +14,27 @@ class AboutView(arcade.View):
         Initialize the AboutView and load the background image.
         """
         super().__init__()
-        background_path = os.path.join("assets", "images", "pwr.jpg")
-        self.background_texture = arcade.load_texture(background_path)
+        background_path = "images/pwr.jpg"
+        self.background_texture = asset_manager.load_texture(background_path, owner=self)
+        self.static_screen = StaticScreen(self.draw_content)
+
+    def on_hide_view(self):
+        """
+        Let the asset cache evict the background once this view is gone.
+        """
+        asset_manager.cache.release(self)
 
     def on_draw(self):
         """
-        Render the About screen, including background, overlay, title, and informational text.
+        Draw the About screen from the cache.
         """
         self.clear()
+        self.static_screen.draw(self.window)
+
+    def draw_content(self):
+        """
+        Render the About screen, including background, overlay, title, and informational text.
+        """
 
         rect = arcade.Rect(
             left=0,
@@ -1,5 +1,5 @@
 import arcade
-import os
+import asset_manager
 from settings import SCREEN_WIDTH, SCREEN_HEIGHT 
 
 class BaseView(arcade.View):
@@ -12,8 +12,14 @@ class BaseView(arcade.View):
         Initialize the view and load the background texture.
         """
         super().__init__()
-        background_path = os.path.join("assets", "images", "city.png")
-        self.background_texture = arcade.load_texture(background_path)
+        background_path = "images/city.png"
+        self.background_texture = asset_manager.load_texture(background_path, owner=self)
+
+    def on_hide_view(self):
+        """
+        Let the asset cache evict the background once this view is gone.
+        """
+        asset_manager.cache.release(self)
 
     def draw_background(self):
         """
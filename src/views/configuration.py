@@ -1,6 +1,7 @@
 import arcade
 import settings
 from views.base_view import BaseView
+from rendering.static_screen import StaticScreen
 from settings import SCREEN_HEIGHT, SCREEN_WIDTH
 
 class ConfigurationView(BaseView):
@@ -38,6 +39,9 @@ class ConfigurationView(BaseView):
         self.easy_button = (left_easy, right_easy, button_bottom, top_easy)
         self.hard_button = (left_hard, right_hard, button_bottom, top_hard)
 
+        # Ekran jest rysowany raz i odświeżany tylko po zmianie poziomu
+        self.static_screen = StaticScreen(self.draw_content)
+
     def on_show(self):
         """
         Called when this view is shown.
@@ -47,6 +51,23 @@ class ConfigurationView(BaseView):
         arcade.set_background_color(arcade.color.WHITE)
 
     def on_draw(self):
+        """
+        Draw the configuration screen from the cache.
+        """
+        self.clear()
+        self.static_screen.draw(self.window)
+
+    def set_difficulty(self, difficulty):
+        """
+        Select a difficulty level and redraw the screen to show the selection.
+
+        Args:
+            difficulty (str): "Łatwy" or "Trudny".
+        """
+        settings.difficulty = difficulty
+        self.static_screen.invalidate()
+
+    def draw_content(self):
         """
         Render the configuration screen.
 
@@ -58,7 +79,6 @@ class ConfigurationView(BaseView):
         - Instructions on how to select difficulty.
         - Reminder about pressing ESC to return to the main menu.
         """
-        self.clear()
         self.draw_background()
 
         # Draw semi-transparent dark panel
@@ -149,13 +169,9 @@ class ConfigurationView(BaseView):
             modifiers (int): Modifier keys pressed.
         """
         if self._point_in_rect(x, y, *self.easy_button):
-            settings.difficulty = "Łatwy"
-            self.window.clear()
-            self.on_draw()
+            self.set_difficulty("Łatwy")
         elif self._point_in_rect(x, y, *self.hard_button):
-            settings.difficulty = "Trudny"
-            self.window.clear()
-            self.on_draw()
+            self.set_difficulty("Trudny")
 
     def on_key_press(self, key, modifiers):
         """
@@ -170,13 +186,9 @@ class ConfigurationView(BaseView):
             modifiers (int): Modifier keys pressed.
         """
         if key == arcade.key.KEY_1:
-            settings.difficulty = "Łatwy"
-            self.window.clear()
-            self.on_draw()
+            self.set_difficulty("Łatwy")
         elif key == arcade.key.KEY_2:
-            settings.difficulty = "Trudny"
-            self.window.clear()
-            self.on_draw()
+            self.set_difficulty("Trudny")
         elif key == arcade.key.ESCAPE:
             from views.main_menu import MainMenuView
             self.window.show_view(MainMenuView())
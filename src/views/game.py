@@ -1,16 +1,42 @@
 import arcade
 import random
-import os
-import math
 import settings
 import score_manager
+import asset_manager
+import sound_manager
+import music
 from objects.player import Player
 from objects.obstacle import Obstacle
 from objects.bonus import Bonus
+from objects.pool import SpritePool
+from profiler import FrameProfiler, NULL_PROFILER
 from views.main_menu import MainMenuView
+from simulation.engine import (Simulation, OBSTACLE, START_LIVES, MOVE_UP, MOVE_DOWN, EVENT_SPAWN, EVENT_DESPAWN, EVENT_HIT,
+                               EVENT_COLLECT, EVENT_SPEED_UP, EVENT_TRIUMPH, EVENT_GAME_OVER)
+from simulation.replay import Replay
+from rendering.lanes import LaneBackground
+from rendering.profiler_overlay import ProfilerOverlay
+from rendering.hud import Hud
 from settings import SCREEN_HEIGHT, SCREEN_WIDTH
 
-SOUND_FOLDER = os.path.join("assets", "sounds")
+OBSTACLE_POOL_SIZE = 16
+BONUS_POOL_SIZE = 8
+
+LOSS_SOUND = "sounds/loss.wav"
+COLLECT_SOUND = "sounds/coin1.wav"
+HIT_SOUND = "sounds/burger.wav"
+SPEED_UP_SOUND = "sounds/speed.wav"
+TRIUMPH_SOUND = "sounds/triumph.wav"
+GAME_SOUNDS = [LOSS_SOUND, COLLECT_SOUND, HIT_SOUND, SPEED_UP_SOUND, TRIUMPH_SOUND]
+
+# Zasoby potrzebne do rozpoczęcia gry; main_menu wczytuje je w tle, jeśli nie ma ich jeszcze w pamięci
+GAME_ASSETS = [
+    "images/city1.png",
+    "images/heart.png",
+    "images/girl_avatar.png",
+    "images/szczur.png",
+    "images/notes.png",
+] + GAME_SOUNDS
 
 class GameView(arcade.View):
     """Main gameplay view where the player avoids obstacles and collects bonuses."""
@@ -19,296 +45,223 @@ class GameView(arcade.View):
         """Initialize the game view, including background, player, lanes, obstacles, bonuses, sounds and UI elements"""
 
         super().__init__()
-        self.game_over = False
-        self.loss_sound_played = False
 
-        self.background = arcade.load_texture("assets/images/city1.png")
-        self.lane_count = 3
-        self.lane_height = int((1 / 2) * SCREEN_HEIGHT // self.lane_count)
-        self.lanes = [self.lane_height // 2 + i * self.lane_height for i in range(self.lane_count)]
+        self.background = asset_manager.load_texture("images/city1.png", owner=self)
+        self.lane_count = settings.LANE_COUNT
+        self.simulation = Simulation(settings.difficulty, lane_count=self.lane_count)
+        self.lane_height = self.simulation.lane_height
+        self.lanes = self.simulation.lanes
+        self.lane_background = LaneBackground(self.background, SCREEN_WIDTH, SCREEN_HEIGHT,
+                                              self.lane_count, self.lane_height)
+
+        self.profiler = FrameProfiler() if settings.PROFILER_ENABLED else NULL_PROFILER
+        self.simulation.profiler = self.profiler
+        self.profiler_overlay = ProfilerOverlay(self.profiler, top=SCREEN_HEIGHT - 80, status=self.sound_status)
         self.player = Player(self.lanes, self.lane_height)
         self.player_list = arcade.SpriteList()
         self.player_list.append(self.player)
 
-        self.obstacle_list = arcade.SpriteList()
-        self.bonus_list = arcade.SpriteList()
+        # Sprite'y przeszkód i bonusów są wielokrotnie używane zamiast tworzenia nowych
+        self.obstacle_pool = SpritePool(
+            lambda: Obstacle(0, 0, height=self.lane_height * 0.5), OBSTACLE_POOL_SIZE)
+        self.bonus_pool = SpritePool(
+            lambda: Bonus(0, 0, lane_height=self.lane_height * 0.5), BONUS_POOL_SIZE)
+        self.obstacle_list = self.obstacle_pool.sprite_list
+        self.bonus_list = self.bonus_pool.sprite_list
+        self.sprites = {}
 
-        self.obstacle_timer = 0
-        self.bonus_timer = 0
-        self.obstacle_interval = 2.0
-        self.bonus_interval = 5.0
+        self.heart_texture = asset_manager.load_texture("images/heart.png", owner=self)
 
-        self.speed = 3
-        self.max_speed = 8
-        self.speed_increment = 0.2
-
-        self.score = 0
-        self.lives = 3
-        self.next_score_sound_threshold = 100
-
-        self.heart_texture = arcade.load_texture("assets/images/heart.png")
-
-        self.loss_sound = arcade.load_sound(os.path.join(SOUND_FOLDER, "loss.wav"))
-        self.notes_sound = arcade.load_sound(os.path.join(SOUND_FOLDER, "coin1.wav"))
-        self.rat_sound = arcade.load_sound(os.path.join(SOUND_FOLDER, "burger.wav"))
-        self.speed_up_sound = arcade.load_sound(os.path.join(SOUND_FOLDER, "speed.wav"))
-        self.triumph_sound = arcade.load_sound(os.path.join(SOUND_FOLDER, "triumph.wav"))
+        # Efekty są dekodowane raz na całą sesję; kolejne gry korzystają z tych samych
+        sound_manager.effects.load(GAME_SOUNDS)
 
         self.menu_button_x = SCREEN_WIDTH // 2
         self.menu_button_y = SCREEN_HEIGHT // 2 - 100
         self.menu_button_width = 200
         self.menu_button_height = 50
 
-    def setup(self):
-        """Configure or reset game state depending on difficulty level and initialize gameplay variables"""
+        # HUD jest budowany raz i zmieniany tylko przy zmianie wyniku, żyć lub końcu gry
+        self.hud = Hud(self.heart_texture, SCREEN_WIDTH, SCREEN_HEIGHT, START_LIVES,
+                       (self.menu_button_x, self.menu_button_y, self.menu_button_width, self.menu_button_height))
+
+    @property
+    def score(self):
+        """int: Current score, owned by the simulation"""
+
+        return self.simulation.score
+
+    @property
+    def lives(self):
+        """int: Remaining lives, owned by the simulation"""
+
+        return self.simulation.lives
+
+    @property
+    def game_over(self):
+        """bool: Whether the run has ended"""
+
+        return self.simulation.game_over
+
+    def setup(self, seed=None):
+        """Configure or reset game state depending on difficulty level and initialize gameplay variables
+
+        Args:
+            seed (int, optional): Seed of the run; a random one is drawn when None. Defaults to None
+        """
 
         Obstacle.load_texture()
         Bonus.load_texture()
-        if settings.difficulty == "Łatwy":
-            self.speed = 400
-            self.max_speed = 700
-            self.speed_increment = 50
-            self.obstacle_interval = 1.8
-            self.bonus_interval = 3.5
-        else:
-            self.speed = 600
-            self.max_speed = 1000
-            self.speed_increment = 75
-            self.obstacle_interval = 1.2
-            self.bonus_interval = 4.0
-
-        #losowy rozrzut czasowy
-        self.next_obstacle_time = self.obstacle_interval + random.uniform(-0.3, 0.3)
-        self.next_bonus_time = self.bonus_interval + random.uniform(-0.5, 0.5)
-        self.base_obstacle_interval = self.obstacle_interval
-
-        self.time_since_speed_increase = 0
-        self.score = 0
-        self.lives = 3
+
+        # Ziarno i wciśnięte klawisze wystarczą, żeby odtworzyć całą rozgrywkę
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(63)
+        self.simulation.reset(settings.difficulty, seed)
+        self.replay = Replay(seed, settings.difficulty, rate=settings.SIMULATION_RATE, lane_count=self.lane_count)
 
         self.player.reset()
         self.player_list = arcade.SpriteList()
         self.player_list.append(self.player)
 
-    def on_show(self):
-        """Called when this view is shown; sets up the game"""
+        self.obstacle_pool.release_all()
+        self.bonus_pool.release_all()
+        self.sprites = {}
 
-        self.setup()
+        self.accumulator = 0.0
+        self.fixed_timestep = 1 / settings.SIMULATION_RATE
+        self.hud.reset(self.score, self.lives)
 
-    def is_too_close(self, x, y, objects, min_distance=50):
-        """Check if a new object at (x, y) is too close to any existing object
+    def on_show_view(self):
+        """Fade the music over to the gameplay track"""
 
-        Args:
-            x (float): X coordinate of the new object
-            y (float): Y coordinate of the new object
-            objects (Iterable[arcade.Sprite]): List of existing objects to compare with
-            min_distance (int, optional): Minimum allowed distance. Defaults to 50.
+        music.play(music.GAME_MUSIC)
 
-        Returns:
-            bool: True if an object is too close, False otherwise
-        """
+    def on_hide_view(self):
+        """Let the asset cache evict the background and the heart once the game is left"""
 
-        for obj in objects:
-            dist = math.hypot(x - obj.center_x, y - obj.center_y)
-            if dist < min_distance:
-                return True
-        return False
+        asset_manager.cache.release(self)
 
     def on_update(self, delta_time):
-        """Update game logic including player, obstacles, bonuses, speed progression, collisions and scoring
+        """Advance the simulation in fixed steps and mirror its events in sprites and sounds
+
+        Frame time is collected in an accumulator and consumed in steps of
+        fixed_timestep. At most MAX_CATCH_UP_STEPS are run per frame; time beyond that
+        is dropped, so a slow machine plays slower instead of spiralling into ever
+        longer frames.
 
         Args:
             delta_time (float): Time passed since the last update
         """
 
-        if self.game_over and not self.loss_sound_played:
-            arcade.play_sound(self.loss_sound)
-            self.loss_sound_played = True
-            score_manager.add_score(self.score, settings.difficulty)
-            return
-
         if self.game_over:
             return
 
-        self.time_since_speed_increase += delta_time
-        if self.time_since_speed_increase >= 15:
-            self.speed = min(self.speed + self.speed_increment, self.max_speed)
-            arcade.play_sound(self.speed_up_sound)
-            self.time_since_speed_increase = 0
-
-        self.player.update(delta_time)
-        current_speed = self.speed
-
-        # Dynamiczne zmniejszanie odstępu między przeszkodami wraz z wynikiem
-        min_obstacle_interval = 0.6  # minimalny odstęp
-        self.obstacle_interval = max(self.base_obstacle_interval - (self.score // 100) * 0.2, min_obstacle_interval)
-
-        self.next_obstacle_time -= delta_time
-        if self.next_obstacle_time <= 0:
-            self.next_obstacle_time = self.obstacle_interval + random.uniform(-0.3, 0.3)
-
-            lane = random.randint(0, self.lane_count - 1)
-            y = self.lanes[lane]
-            new_x = SCREEN_WIDTH + 40
-            if not self.is_too_close(new_x, y, list(self.obstacle_list) + list(self.bonus_list), min_distance=80):
-                obstacle = Obstacle(new_x, y, speed=current_speed, height=self.lane_height * 0.5)
-                self.obstacle_list.append(obstacle)
-
-                # 33% szans na podwójną przeszkodę w innym pasie
-                if random.random() < 0.33:
-                    other_lane = (lane + random.choice([1, 2])) % self.lane_count
-                    y2 = self.lanes[other_lane]
-                    if not self.is_too_close(new_x + 60, y2, self.obstacle_list, min_distance=80):
-                        obstacle2 = Obstacle(new_x + 60, y2, speed=current_speed, height=self.lane_height * 0.5)
-                        self.obstacle_list.append(obstacle2)
-
-        self.next_bonus_time -= delta_time
-        if self.next_bonus_time <= 0:
-            self.next_bonus_time = self.bonus_interval + random.uniform(-0.5, 0.5)
-
-            lane = random.randint(0, self.lane_count - 1)
-            y = self.lanes[lane]
-            new_x = SCREEN_WIDTH + 40
-            if not self.is_too_close(new_x, y, list(self.obstacle_list) + list(self.bonus_list), min_distance=120):
-                bonus = Bonus(new_x, y, speed=current_speed, lane_height=self.lane_height * 0.5)
-                self.bonus_list.append(bonus)
-
-        # Aktualizacja przeszkód i bonusów
-        for obstacle in self.obstacle_list:
-            obstacle.update(delta_time)
-
-        for bonus in self.bonus_list:
-            bonus.update(delta_time)
-
-        # Usuwanie przeszkód poza ekranem
-        for obstacle in self.obstacle_list[:]:
-            if obstacle.right < 0:
-                self.obstacle_list.remove(obstacle)
-
-        for bonus in self.bonus_list[:]:
-            if bonus.center_x < -bonus.width:
-                self.bonus_list.remove(bonus)
-
-        # Kolizje z przeszkodami
-        for obstacle in self.obstacle_list:
-            if arcade.check_for_collision(self.player, obstacle):
-                arcade.play_sound(self.rat_sound)
-                self.lives -= 1
-                self.obstacle_list.remove(obstacle)
-                if self.lives <= 0:
-                    self.game_over = True
-
-        # Kolizje z bonusami
-        for bonus in self.bonus_list:
-            if arcade.check_for_collision(self.player, bonus):
-                arcade.play_sound(self.notes_sound)
-                self.score += 10
-                self.bonus_list.remove(bonus)
-                if self.score >= self.next_score_sound_threshold:
-                    arcade.play_sound(self.triumph_sound)
-                    self.next_score_sound_threshold += 100    
+        self.profiler.begin()
+        self.accumulator += delta_time
+        steps = 0
+        while self.accumulator >= self.fixed_timestep and steps < settings.MAX_CATCH_UP_STEPS:
+            for event, entity in self.simulation.step(self.fixed_timestep):
+                self.handle_event(event, entity)
+            self.profiler.mark("update.events")
+            self.accumulator -= self.fixed_timestep
+            steps += 1
+            if self.game_over:
+                break
+        if steps == settings.MAX_CATCH_UP_STEPS:
+            self.accumulator = min(self.accumulator, self.fixed_timestep)
+        elif not self.game_over:
+            # Wolny czas klatki: dogeneruj jedną porcję harmonogramu przeszkód
+            self.simulation.timeline.fill(max_chunks=1)
+            self.profiler.mark("update.timeline")
+
+    def sound_status(self):
+        """Describe the sound voices for the profiler overlay
+
+        Returns:
+            list[str]: One line with active voices and merged or stolen effects
+        """
+
+        stats = sound_manager.effects.stats()
+        return [f"dźwięk: głosy {stats['active']}/{stats['max_voices']}, "
+                f"scalone {stats['coalesced']}, przerwane {stats['stolen']}"]
+
+    def sync_sprites(self):
+        """Place sprites between the last two simulation steps according to the leftover frame time"""
+
+        alpha = min(self.accumulator / self.fixed_timestep, 1.0)
+        for entity in self.simulation.entities():
+            self.sprites[entity.uid].center_x = entity.interpolated_x(alpha)
+
+    def handle_event(self, event, entity):
+        """React to a single simulation event by updating sprites, playing sounds or saving the score
+
+        Args:
+            event (str): One of the EVENT_* constants from simulation.engine
+            entity (Entity or None): The entity the event refers to, if any
+        """
+
+        if event == EVENT_SPAWN:
+            pool = self.obstacle_pool if entity.kind == OBSTACLE else self.bonus_pool
+            self.sprites[entity.uid] = pool.acquire(entity.x, entity.y, entity.speed)
+        elif event in (EVENT_DESPAWN, EVENT_HIT, EVENT_COLLECT):
+            pool = self.obstacle_pool if entity.kind == OBSTACLE else self.bonus_pool
+            pool.release(self.sprites.pop(entity.uid))
+            if event == EVENT_HIT:
+                sound_manager.play(HIT_SOUND)
+                self.hud.set_lives(self.lives)
+            elif event == EVENT_COLLECT:
+                sound_manager.play(COLLECT_SOUND)
+                self.hud.set_score(self.score)
+        elif event == EVENT_SPEED_UP:
+            sound_manager.play(SPEED_UP_SOUND)
+        elif event == EVENT_TRIUMPH:
+            sound_manager.play(TRIUMPH_SOUND)
+        elif event == EVENT_GAME_OVER:
+            sound_manager.play(LOSS_SOUND)
+            self.hud.set_game_over(True)
+            self.replay.finish(self.score, self.simulation.tick)
+            score_manager.add_score(self.score, settings.difficulty, replay=self.replay)
+            self.profiler.write_csv_async()
 
     def on_draw(self):
         """Render the game screen including background, lanes, player, obstacles, bonuses, score, lives, and game over screen"""
 
+        profiler = self.profiler
+        profiler.begin()
         self.clear()
 
-        background_rect = arcade.Rect(
-            x=SCREEN_WIDTH // 2,
-            y=SCREEN_HEIGHT // 2,
-            width=SCREEN_WIDTH,
-            height=SCREEN_HEIGHT,
-            left=0,
-            right=SCREEN_WIDTH,
-            bottom=0,
-            top=SCREEN_HEIGHT
-        )
-        arcade.draw_texture_rect(self.background, background_rect)
-
-        total_height = SCREEN_HEIGHT // 2
-        lane_height = total_height // 3
-        bottom_start = 0
-
-        lane_colors = [
-            (100, 255, 100, 150),  # jasny zielony (pastelowy)
-            (150, 230, 255, 150),  # bardzo jasny niebieski
-            (255, 100, 120, 150)   # różowy pozostaje bez zmian
-        ]
-
-        border_colors = [
-            (80, 230, 80),
-            (150, 230, 255),
-            (255, 160, 170)
-        ]
-
-        for i in range(3):
-            bottom = bottom_start + i * lane_height
-            top = bottom + lane_height
-            left = 0
-            right = SCREEN_WIDTH
-
-            arcade.draw_lrbt_rectangle_outline(left, right, bottom, top, border_colors[i], border_width=2)
-
-            line_spacing = 4
-            line_thickness = 1
-            for y_line in range(bottom, top, line_spacing):
-                arcade.draw_line(left, y_line, right, y_line, lane_colors[i], line_thickness)
+        self.lane_background.draw()
+        profiler.mark("draw.background")
+        self.sync_sprites()
 
         self.player_list.draw()
         self.obstacle_list.draw()
         self.bonus_list.draw()
+        profiler.mark("draw.sprites")
 
-        arcade.draw_text(f"Wynik: {self.score}", 20, SCREEN_HEIGHT - 40, arcade.color.WHITE, 20)
-
-        for i in range(self.lives):
-            center_x = SCREEN_WIDTH - 30 - i * 40
-            center_y = SCREEN_HEIGHT - 30
-            width = 30
-            height = 30
-            left = center_x - width / 2
-            right = center_x + width / 2
-            bottom = center_y - height / 2
-            top = center_y + height / 2
-
-            heart_rect = arcade.Rect(
-                x=center_x,
-                y=center_y,
-                width=width,
-                height=height,
-                left=left,
-                right=right,
-                bottom=bottom,
-                top=top
-            )
-            arcade.draw_texture_rect(self.heart_texture, heart_rect)
-
-        if self.game_over:
-            arcade.draw_lrbt_rectangle_filled(0, SCREEN_WIDTH, 0, SCREEN_HEIGHT, (0, 0, 0, 180))
-            arcade.draw_text("Koniec Gry", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 40,
-                             arcade.color.WHITE, 40, anchor_x="center")
-
-            arcade.draw_lrbt_rectangle_filled(
-            self.menu_button_x - self.menu_button_width // 2,
-            self.menu_button_x + self.menu_button_width // 2,
-            self.menu_button_y - self.menu_button_height // 2, 
-            self.menu_button_y + self.menu_button_height // 2, 
-            arcade.color.LIGHT_BLUE
-            )
-            arcade.draw_text("Menu", self.menu_button_x, self.menu_button_y,
-                             arcade.color.BLACK, 20, anchor_x="center", anchor_y="center")
+        self.hud.draw()
+        profiler.mark("draw.hud")
+        self.profiler_overlay.draw()
+        profiler.mark("draw.overlay")
+        profiler.end_frame()
 
     def on_key_press(self, key, modifiers):
-        """Handle player input for moving up or down between lanes
+        """Handle player input for moving up or down between lanes; F3 toggles the profiler overlay
 
         Args:
             key (int): The key that was pressed
             modifiers (int): Bitmask for modifier keys (unused)
         """
 
-        if key == arcade.key.UP:
+        if key == arcade.key.UP and not self.game_over:
+            self.replay.record(self.simulation.tick, MOVE_UP)
+            self.simulation.move_up()
             self.player.move_up()
-        elif key == arcade.key.DOWN:
+        elif key == arcade.key.DOWN and not self.game_over:
+            self.replay.record(self.simulation.tick, MOVE_DOWN)
+            self.simulation.move_down()
             self.player.move_down()
+        elif key == arcade.key.F3 and self.profiler.enabled:
+            self.profiler_overlay.toggle()
 
     def on_mouse_press(self, x, y, button, modifiers):
         """Handle mouse click on the menu button when the game is over
@@ -0,0 +1,73 @@
+import arcade
+import asset_manager
+import settings
+from rendering.text_layer import TextLayer
+from settings import SCREEN_HEIGHT, SCREEN_WIDTH
+
+BAR_WIDTH = 400
+BAR_HEIGHT = 20
+BACKGROUND_COLOR = (20, 20, 30)
+
+
+class LoadingView(arcade.View):
+    """
+    View shown while assets are decoded in the background
+
+    Worker threads decode the files; every frame this view hands at most
+    LOADING_FRAME_BUDGET seconds' worth of finished assets to the cache and the GPU,
+    draws a progress bar and, once everything is loaded, switches to the next view.
+    Drawing uses no textures, so the screen appears before anything is decoded.
+    """
+    def __init__(self, names, make_view, pinned=False):
+        """Start loading the assets
+
+        Args:
+            names (Iterable[str]): Logical names of the assets the next view needs
+            make_view (Callable[[], arcade.View]): Creates the view shown after loading
+            pinned (bool, optional): Whether the assets must never be evicted. Defaults to False
+        """
+        super().__init__()
+        self.load = asset_manager.cache.load_async(names, pinned)
+        self.make_view = make_view
+
+        self.text_layer = TextLayer()
+        self.text_layer.add("title", "Ładowanie...", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 30,
+                            arcade.color.ORANGE, 24, anchor_x="center")
+        self.text_layer.add("progress", "0%", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50,
+                            arcade.color.WHITE, 14, anchor_x="center")
+
+    def on_update(self, delta_time):
+        """Finish a slice of the loaded assets and switch views when all are ready
+
+        Args:
+            delta_time (float): Time passed since the last update
+        """
+        if self.load.finalize(settings.LOADING_FRAME_BUDGET):
+            self.window.show_view(self.make_view())
+            return
+        self.text_layer.set_text("progress", f"{self.load.progress:.0%}")
+
+    def on_draw(self):
+        """Draw the title and the progress bar."""
+        self.clear(color=BACKGROUND_COLOR)
+        left = (SCREEN_WIDTH - BAR_WIDTH) / 2
+        bottom = SCREEN_HEIGHT / 2 - BAR_HEIGHT
+        arcade.draw_lbwh_rectangle_filled(left, bottom, BAR_WIDTH * self.load.progress, BAR_HEIGHT,
+                                          arcade.color.PINK)
+        arcade.draw_lbwh_rectangle_outline(left, bottom, BAR_WIDTH, BAR_HEIGHT, arcade.color.WHITE, 2)
+        self.text_layer.draw()
+
+
+def show_loaded(window, names, make_view, pinned=False):
+    """Show a view once its assets are cached, going through LoadingView only if needed
+
+    Args:
+        window (arcade.Window): Window to show the view in
+        names (Iterable[str]): Logical names of the assets the view needs
+        make_view (Callable[[], arcade.View]): Creates the view
+        pinned (bool, optional): Whether the assets must never be evicted. Defaults to False
+    """
+    if asset_manager.cache.loaded(names):
+        window.show_view(make_view())
+    else:
+        window.show_view(LoadingView(names, make_view, pinned))
@@ -1,5 +1,7 @@
 import arcade
-import os
+import asset_manager
+import music
+from rendering.text_layer import TextLayer
 from settings import SCREEN_HEIGHT, SCREEN_WIDTH
 
 
@@ -24,11 +26,24 @@ class MainMenuView(arcade.View):
         ]
         self.button_height = 35
         self.hovered_button_index = None
-        background_path = os.path.join("assets", "images", "city.png")
-        self.background_texture = arcade.load_texture(background_path)
+        background_path = "images/city.png"
+        self.background_texture = asset_manager.load_texture(background_path, owner=self)
 
-    def on_show(self):
+        # Napisy są tworzone raz; najechanie myszą zmienia tylko kolor
+        self.text_layer = TextLayer()
+        self.text_layer.add("title", "Wrocław City Girl", SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100,
+                            arcade.color.ORANGE, font_size=40, anchor_x="center", anchor_y="bottom")
+        for index, (text, y) in enumerate(self.buttons):
+            self.text_layer.add(index, text, SCREEN_WIDTH // 2, y, arcade.color.PINK,
+                                font_size=24, anchor_x="center", anchor_y="bottom")
+
+    def on_show_view(self):
         """Play menu music when the main menu is shown."""
+        music.play(music.MENU_MUSIC)
+
+    def on_hide_view(self):
+        """Let the asset cache evict the background once the menu is gone."""
+        asset_manager.cache.release(self)
 
     def on_hide(self):
         """Called when the view is hidden; music stop removed."""
@@ -49,55 +64,18 @@ class MainMenuView(arcade.View):
             y=SCREEN_HEIGHT / 2
         )
         arcade.draw_texture_rect(self.background_texture, rect)
-
-        # Draw game title
-        title = arcade.Text(
-            "Wrocław City Girl",
-            self.window.width // 2,
-            SCREEN_HEIGHT - 100,
-            arcade.color.ORANGE,
-            font_size=40,
-            anchor_x="center",
-            anchor_y="bottom"
-        )
-        title.draw()
-
-        # Draw menu buttons
-        for index, (text, y) in enumerate(self.buttons):
-            x = self.window.width // 2
-            color = arcade.color.DARK_PINK if self.hovered_button_index == index else arcade.color.PINK
-
-            button_text = arcade.Text(
-                text,
-                x,
-                y,
-                color,
-                font_size=24,
-                anchor_x="center",
-                anchor_y="bottom"
-            )
-            button_text.draw()
+        self.text_layer.draw()
 
     def on_mouse_motion(self, x, y, dx, dy):
         """Track mouse movement to update which button is hovered."""
-        self.hovered_button_index = None
-        for index, (text, y_pos) in enumerate(self.buttons):
-            x_center = self.window.width // 2
-            font_size = 24
-
-            # Create a text object to get its dimensions
-            text_obj = arcade.Text(text, x_center, y_pos, font_size=font_size, anchor_x="center", anchor_y="bottom")
-            text_width = text_obj.content_width
-            text_height = text_obj.content_height
-
-            left = x_center - text_width / 2
-            right = x_center + text_width / 2
-            bottom = y_pos
-            top = y_pos + text_height
-
-            if left <= x <= right and bottom <= y <= top:
-                self.hovered_button_index = index
-                break
+        hovered = self.text_layer.hit(x, y, keys=range(len(self.buttons)))
+        if hovered == self.hovered_button_index:
+            return
+        if self.hovered_button_index is not None:
+            self.text_layer.set_color(self.hovered_button_index, arcade.color.PINK)
+        if hovered is not None:
+            self.text_layer.set_color(hovered, arcade.color.DARK_PINK)
+        self.hovered_button_index = hovered
 
     def on_mouse_press(self, x, y, button, modifiers):
         """Handle mouse clicks on buttons to trigger corresponding actions."""
@@ -107,10 +85,15 @@ class MainMenuView(arcade.View):
         option = self.buttons[self.hovered_button_index][0]
 
         if option == "Start gry":
-            from views.game import GameView
-            game_view = GameView()
-            game_view.setup()
-            self.window.show_view(game_view)
+            from views.game import GameView, GAME_ASSETS
+            from views.loading import show_loaded
+
+            def create_game():
+                game_view = GameView()
+                game_view.setup()
+                return game_view
+
+            show_loaded(self.window, GAME_ASSETS, create_game)
         elif option == "Zasady gry":
             from views.rules import RulesView
             self.window.show_view(RulesView())
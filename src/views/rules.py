@@ -1,5 +1,6 @@
 import arcade
 from views.base_view import BaseView
+from rendering.static_screen import StaticScreen
 
 class RulesView(BaseView):
     """
@@ -7,13 +8,22 @@ class RulesView(BaseView):
 
     Shows a list of gameplay rules and hints, and allows returning to the main menu by pressing ESC
     """    
+    def __init__(self):
+        """Initialize the view and the cache holding the rendered screen."""
+        super().__init__()
+        self.static_screen = StaticScreen(self.draw_content)
+
     def on_show(self):
         """Set background color when the view is shown."""
         arcade.set_background_color(arcade.color.WHITE)
 
     def on_draw(self):
-        """Render the rules screen with instructions and background"""
+        """Draw the rules screen from the cache."""
         self.clear()
+        self.static_screen.draw(self.window)
+
+    def draw_content(self):
+        """Render the rules screen with instructions and background"""
         self.draw_background()
         arcade.draw_lrbt_rectangle_filled(
             left=50,
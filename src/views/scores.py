@@ -1,27 +1,66 @@
 import arcade
 from views.base_view import BaseView
+from rendering.static_screen import StaticScreen
 import score_manager
 
+PAGE_SIZE = 10
+DIFFICULTY_FILTERS = [None, "Łatwy", "Trudny"]
+
 class ScoresView(BaseView):
     """
     View displaying the list of high scores stored in the game
 
-    Loads scores from file and shows them on the screen, with an option to return to the main menu using ESC
+    Shows one page of the leaderboard at a time. Arrow keys change the page, D cycles the
+    difficulty filter, H switches between the ranking of verified scores and the full
+    history, and ESC returns to the main menu
     """
     def __init__(self):
-        """Initialize ScoresView and prepare an empty scores list."""
+        """Initialize ScoresView and load the first page of scores."""
         super().__init__()
+        self.page = 0
+        self.filter_index = 0
+        self.ranked = True
         self.scores = []
-        self._scores_loaded = False
+        self.total = 0
+        self.static_screen = StaticScreen(self.draw_content)
+        self.load_page()
+
+    @property
+    def difficulty_filter(self):
+        """str or None: Difficulty currently shown, None for all"""
+        return DIFFICULTY_FILTERS[self.filter_index]
+
+    @property
+    def page_count(self):
+        """int: Number of pages for the current filter (at least one)"""
+        return max(1, -(-self.total // PAGE_SIZE))
+
+    def load_page(self):
+        """Fetch the current page and the total count from the score store."""
+        self.revision = score_manager.revision()
+        self.total = score_manager.count_scores(self.difficulty_filter, ranked=self.ranked)
+        self.page = min(self.page, self.page_count - 1)
+        self.scores = score_manager.top_scores(PAGE_SIZE, self.page * PAGE_SIZE, self.difficulty_filter,
+                                               ranked=self.ranked)
+        self.static_screen.invalidate()
+
+    def on_update(self, delta_time):
+        """Reload the page when the score store has changed, e.g. after a background write.
+
+        Args:
+            delta_time (float): Time passed since the last update.
+        """
+        if score_manager.revision() != self.revision:
+            self.load_page()
 
     def on_draw(self):
-        """Render the scores screen with background and scores list."""
+        """Draw the scores screen from the cache."""
         self.clear()
-        self.draw_background()
+        self.static_screen.draw(self.window)
 
-        if not self._scores_loaded:
-            self.scores = score_manager.load_scores()
-            self._scores_loaded = True
+    def draw_content(self):
+        """Render the scores screen with background and scores list."""
+        self.draw_background()
 
         arcade.draw_lrbt_rectangle_filled(
             left=50,
@@ -30,7 +69,8 @@ class ScoresView(BaseView):
             bottom=50,
             color=(20, 20, 30, 180)
         )
-        arcade.draw_text("Najlepsze Wyniki", self.window.width // 2, self.window.height - 100,
+        title = "Najlepsze Wyniki" if self.ranked else "Historia Wyników"
+        arcade.draw_text(title, self.window.width // 2, self.window.height - 100,
                          arcade.color.ORANGE, 40, anchor_x="center")
 
         if not self.scores:
@@ -38,22 +78,40 @@ class ScoresView(BaseView):
                              arcade.color.GRAY, 20, anchor_x="center")
         else:
             start_y = self.window.height - 160
+            first = self.page * PAGE_SIZE
             for i, entry in enumerate(self.scores):
                 y = start_y - i * 30
-                text = f"{i+1}. {entry['score']} pkt – {entry['difficulty']} – {entry['date']}"
+                text = f"{first + i + 1}. {entry['score']} pkt – {entry['difficulty']} – {entry['date']}"
                 arcade.draw_text(text, self.window.width // 2, y,
                                 arcade.color.PINK, 20, anchor_x="center")
 
-        arcade.draw_text("Naciśnij ESC, aby wrócić do menu", self.window.width // 2, 50,
-                            arcade.color.LIGHT_PINK, 15, anchor_x="center")
+        shown = self.difficulty_filter or "wszystkie"
+        arcade.draw_text(f"Strona {self.page + 1}/{self.page_count} – poziom: {shown}",
+                         self.window.width // 2, 100, arcade.color.LIGHT_PINK, 15, anchor_x="center")
+        arcade.draw_text("Strzałki – strony, D – poziom, H – ranking/historia, ESC – powrót do menu",
+                         self.window.width // 2, 50, arcade.color.LIGHT_PINK, 15, anchor_x="center")
         
     def on_key_press(self, key, modifiers):
-        """Handle key press events to navigate back to the main menu.
+        """Handle key press events to change pages, change the filters or go back to the main menu.
 
         Args:
             key (int): The key code pressed.
             modifiers (int): Modifier keys pressed (Shift, Ctrl, etc.).
         """
-        if key == arcade.key.ESCAPE:
+        if key == arcade.key.RIGHT and self.page < self.page_count - 1:
+            self.page += 1
+            self.load_page()
+        elif key == arcade.key.LEFT and self.page > 0:
+            self.page -= 1
+            self.load_page()
+        elif key == arcade.key.D:
+            self.filter_index = (self.filter_index + 1) % len(DIFFICULTY_FILTERS)
+            self.page = 0
+            self.load_page()
+        elif key == arcade.key.H:
+            self.ranked = not self.ranked
+            self.page = 0
+            self.load_page()
+        elif key == arcade.key.ESCAPE:
             from views.main_menu import MainMenuView
             self.window.show_view(MainMenuView())
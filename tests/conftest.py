@@ -0,0 +1,13 @@
+import os
+import sys
+
+# Moduły gry importują się płasko względem src/, tak jak przy uruchamianiu python src/main.py
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+# pyglet.media potrzebuje kontekstu GL; bez ekranu używamy trybu headless
+os.environ.setdefault("ARCADE_HEADLESS", "1")
+
+# arcade ustawia pyglet w trybie headless przy imporcie, zanim testy sięgną po pyglet.media
+import arcade  # noqa: E402,F401
@@ -0,0 +1,127 @@
+import gc
+import json
+import weakref
+import arcade
+import pytest
+from PIL import Image
+from asset_manager import BUILD_FOLDER, BUILD_MANIFEST_VERSION, AssetCache
+from settings import LANE_COUNT, SCREEN_HEIGHT, SCREEN_WIDTH
+
+IMAGE_BYTES = 10 * 10 * 4
+
+
+class Owner:
+    """Stand-in for a view holding assets"""
+
+
+@pytest.fixture
+def root(tmp_path):
+    """Asset folder with small images and a sprite atlas described by a build manifest"""
+
+    (tmp_path / "images").mkdir()
+    for name in "abcd":
+        Image.new("RGBA", (10, 10), (255, 0, 0, 255)).save(tmp_path / "images" / f"{name}.png")
+    build = tmp_path / BUILD_FOLDER
+    build.mkdir()
+    Image.new("RGBA", (32, 16)).save(build / "atlas.png")
+    manifest = {
+        "version": BUILD_MANIFEST_VERSION,
+        "screen": [SCREEN_WIDTH, SCREEN_HEIGHT],
+        "lane_count": LANE_COUNT,
+        "images": {
+            "images/left.png": {"file": "build/atlas.png", "region": [0, 0, 16, 16]},
+            "images/right.png": {"file": "build/atlas.png", "region": [16, 0, 16, 16]},
+        },
+    }
+    (build / "manifest.json").write_text(json.dumps(manifest))
+    return str(tmp_path)
+
+
+def _cache(root, budget):
+    return AssetCache(memory_budget=budget, root=root, pack_path="missing.pack")
+
+
+def test_least_recently_used_entry_is_evicted_first(root):
+    cache = _cache(root, 2 * IMAGE_BYTES)
+    cache.texture("images/a.png")
+    cache.texture("images/b.png")
+    cache.texture("images/a.png")
+    cache.texture("images/c.png")
+    assert set(cache.entries) == {"images/a.png", "images/c.png"}
+    assert cache.memory_used == 2 * IMAGE_BYTES
+    assert cache.stats()["evictions"] == 1
+
+
+def test_owned_and_pinned_entries_stay_until_released(root):
+    cache = _cache(root, IMAGE_BYTES)
+    owner = Owner()
+    cache.preload(["images/a.png"])
+    cache.texture("images/b.png", owner=owner)
+    cache.texture("images/c.png")
+    assert set(cache.entries) == {"images/a.png", "images/b.png"}
+    assert cache.owners("images/b.png") == [owner]
+
+    cache.release(owner)
+    assert set(cache.entries) == {"images/a.png"}
+
+
+def test_entries_of_a_collected_owner_become_evictable(root):
+    cache = _cache(root, 0)
+    owner = Owner()
+    cache.texture("images/a.png", owner=owner)
+    assert "images/a.png" in cache.entries
+    del owner
+    gc.collect()
+    cache.texture("images/b.png")
+    assert not cache.entries
+
+
+def test_decoded_sprite_atlas_counts_towards_the_budget(root):
+    cache = _cache(root, 10 ** 6)
+    left = cache.texture("images/left.png")
+    cache.texture("images/right.png")
+    assert (left.width, left.height) == (16, 16)
+    assert cache.atlas_memory == 32 * 16 * 4
+    assert cache.stats()["atlas_memory"] == 32 * 16 * 4
+
+    cache.memory_budget = 2 * 16 * 16 * 4
+    cache.evict()
+    assert cache.atlas_memory == 0
+    assert len(cache.entries) == 2  # same sprites still fit without the atlas
+
+
+def test_build_for_another_lane_count_falls_back_to_sources(root, tmp_path):
+    manifest_path = tmp_path / BUILD_FOLDER / "manifest.json"
+    manifest = json.loads(manifest_path.read_text())
+    manifest["lane_count"] = LANE_COUNT + 1
+    manifest_path.write_text(json.dumps(manifest))
+    Image.new("RGBA", (10, 10)).save(tmp_path / "images" / "left.png")
+
+    cache = _cache(root, 10 ** 6)
+    assert cache.built_images() == {}
+    left = cache.texture("images/left.png")
+    assert (left.width, left.height) == (10, 10)
+    assert cache.atlas_memory == 0
+
+
+def test_evicted_texture_leaves_the_gpu_atlas(root, monkeypatch):
+    window = arcade.Window(64, 64, visible=False)
+    try:
+        atlas = window.ctx.default_atlas
+        rebuilds = []
+        rebuild = atlas.rebuild
+        monkeypatch.setattr(atlas, "rebuild", lambda: rebuilds.append(len(atlas.textures)) or rebuild())
+        cache = _cache(root, IMAGE_BYTES)
+        load = cache.load_async(["images/a.png"])
+        while not load.finalize(1.0):
+            pass
+        texture = weakref.ref(cache.entries["images/a.png"].asset)
+        assert atlas.has_texture(texture())
+
+        cache.texture("images/b.png")
+        gc.collect()
+        assert texture() is None
+        assert "images/a.png" not in cache.entries
+        assert rebuilds == [0]  # atlas przebudowany już bez usuniętej tekstury
+    finally:
+        window.close()
@@ -0,0 +1,55 @@
+import io
+import os
+import pytest
+from asset_pack import ALIGNMENT, AssetPack, write_pack
+
+
+def _write(tmp_path, files, **metadata):
+    paths = {}
+    for name, data in files.items():
+        path = tmp_path / name.replace("/", "_")
+        path.write_bytes(data)
+        paths[name] = str(path)
+    pack_path = str(tmp_path / "test.pack")
+    entries = write_pack(pack_path, paths, **metadata)
+    return pack_path, entries
+
+
+def test_write_and_read_back(tmp_path):
+    files = {
+        "images/a.png": os.urandom(1000),
+        "sounds/b.wav": b"RIFF" + os.urandom(4093),
+        "empty.bin": b"",
+    }
+    pack_path, entries = _write(tmp_path, files, build={"version": 2})
+    pack = AssetPack(pack_path)
+
+    assert sorted(pack.names()) == sorted(files)
+    assert pack.index["build"] == {"version": 2}
+    for name, data in files.items():
+        assert name in pack
+        assert pack.size(name) == len(data)
+        assert bytes(pack.view(name)) == data
+        assert entries[name][0] % ALIGNMENT == 0
+    assert "missing.png" not in pack
+
+
+def test_pack_file_reads_and_seeks(tmp_path):
+    data = bytes(range(256)) * 4
+    pack_path, _ = _write(tmp_path, {"x.bin": data})
+    with AssetPack(pack_path).open("x.bin") as f:
+        assert f.read(10) == data[:10]
+        assert f.tell() == 10
+        f.seek(-4, io.SEEK_END)
+        assert f.read() == data[-4:]
+        assert f.read(5) == b""
+        f.seek(100)
+        f.seek(6, io.SEEK_CUR)
+        assert f.read(3) == data[106:109]
+
+
+def test_rejects_files_that_are_not_packs(tmp_path):
+    path = tmp_path / "bogus.pack"
+    path.write_bytes(b"not a pack at all" * 4)
+    with pytest.raises(ValueError, match="is not an asset pack"):
+        AssetPack(str(path))
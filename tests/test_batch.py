@@ -0,0 +1,117 @@
+import numpy as np
+import pytest
+from difficulty_sweep import lookahead_action
+from simulation.batch import BatchEnv, BONUS as BATCH_BONUS, EMPTY, OBSTACLE as BATCH_OBSTACLE
+from simulation.engine import BONUS, OBSTACLE, PLAYER_X, Simulation
+
+KINDS = {OBSTACLE: BATCH_OBSTACLE, BONUS: BATCH_BONUS}
+
+
+def _idle(sim):
+    return 0
+
+
+def _lookahead(sim):
+    if sim.tick % 6:
+        return 0
+    return lookahead_action(sim, 0.5) or 0
+
+
+def _mirrored(seed, difficulty):
+    """A Simulation and a one-game BatchEnv that receives exactly the Simulation's spawns
+
+    The two use different generators, so the batch's own spawn timers are replaced by
+    a copy of every entity the Simulation spawns in the same step.
+    """
+
+    sim = Simulation(difficulty, seed=seed)
+    env = BatchEnv(1, difficulty, seed=0)
+    spawned = []
+    spawn = sim.spawn
+
+    def recording_spawn(kind, lane, x, speed=None):
+        spawned.append((kind, lane, x))
+        return spawn(kind, lane, x, speed)
+
+    def mirrored_spawn(dt):
+        for kind, lane, x in spawned:
+            env._insert(np.array([0]), KINDS[kind], np.array([lane]), x)
+        spawned.clear()
+
+    sim.spawn = recording_spawn
+    env._spawn = mirrored_spawn
+    return sim, env
+
+
+def _entities(sim):
+    return sorted((e.lane, KINDS[e.kind], e.x) for e in sim.entities())
+
+
+def _batch_entities(env):
+    slots = np.flatnonzero(env.kind[0] != EMPTY)
+    return sorted((int(env.lane[0, s]), int(env.kind[0, s]), float(env.x[0, s])) for s in slots)
+
+
+def test_geometry_matches_simulation():
+    sim = Simulation("Łatwy", seed=1)
+    env = BatchEnv(1, "Łatwy", seed=1)
+    assert env.spawn_x == sim.spawn_x
+    assert env.lane_height == sim.lane_height
+    assert env.lane_y.tolist() == sim.lanes
+    assert env.player_left == PLAYER_X - sim.player_half_width
+    assert env.player_right == PLAYER_X + sim.player_half_width
+    assert env.half_widths[BATCH_OBSTACLE] == sim.obstacle_size[0] / 2
+    assert env.half_widths[BATCH_BONUS] == sim.bonus_size[0] / 2
+
+
+@pytest.mark.parametrize("difficulty, policy", [("Łatwy", _idle), ("Trudny", _lookahead)])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_batch_follows_simulation_step_by_step(seed, difficulty, policy):
+    sim, env = _mirrored(seed, difficulty)
+    while not sim.game_over:
+        action = policy(sim)
+        if action:
+            sim.apply_input(action)
+        sim.step()
+        observation = env.step(np.array([action]))
+
+        assert (observation["lives"][0], observation["score"][0], observation["player_lane"][0]) == \
+            (sim.lives, sim.score, sim.player_lane), f"tick {sim.tick}"
+        assert observation["speed"][0] == sim.speed
+        assert observation["time"][0] == pytest.approx(sim.time)
+        assert observation["done"][0] == sim.game_over
+
+        if not sim.game_over:
+            expected = _entities(sim)
+            actual = _batch_entities(env)
+            assert [e[:2] for e in actual] == [e[:2] for e in expected], f"tick {sim.tick}"
+            # Pozycje w batchu są w float32
+            assert [e[2] for e in actual] == pytest.approx([e[2] for e in expected], abs=1e-2)
+
+            for lane in range(sim.lane_count):
+                for index, kind in enumerate((OBSTACLE, BONUS)):
+                    gaps = [contact * entity.speed for contact, entity in sim.contacts(lane) if entity.kind == kind]
+                    nearest = float(observation["nearest"][0, lane, index])
+                    assert nearest == pytest.approx(min(gaps, default=np.inf), abs=1e-2)
+    assert env.done[0]
+
+
+@pytest.mark.parametrize("difficulty", ["Łatwy", "Trudny"])
+def test_spawning_matches_simulation_on_average(difficulty):
+    # Generatory są różne, więc porównujemy rozkład: średni czas przeżycia bez ruchu gracza
+    env = BatchEnv(1000, difficulty, seed=1)
+    while not env.done.all():
+        env.step()
+    batch = env.time
+
+    times = []
+    for seed in range(200):
+        sim = Simulation(difficulty, seed=seed)
+        while not sim.game_over:
+            sim.step()
+        times.append(sim.time)
+    times = np.array(times)
+
+    error = np.hypot(batch.std() / np.sqrt(batch.size), times.std() / np.sqrt(times.size))
+    assert abs(batch.mean() - times.mean()) < 3 * error
+    assert env.dropped_spawns == 0
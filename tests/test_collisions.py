@@ -0,0 +1,61 @@
+import math
+import pytest
+from simulation.engine import BONUS, BONUS_POINTS, EVENT_COLLECT, EVENT_HIT, OBSTACLE, PLAYER_X, Simulation
+
+
+def _empty_simulation():
+    """Simulation that spawns nothing by itself"""
+
+    sim = Simulation("Łatwy", seed=1)
+    sim.timeline.next_obstacle_time = sim.timeline.next_bonus_time = math.inf
+    sim.lives = 10
+    return sim
+
+
+def _events(events, kind):
+    return [entity for event, entity in events if event == kind]
+
+
+@pytest.mark.parametrize("delta_time", [1 / 60, 0.25, 1.0, 5.0])
+def test_fast_obstacle_cannot_tunnel_through_the_player(delta_time):
+    sim = _empty_simulation()
+    # W jednym kroku przeszkoda przelatuje wiele szerokości gracza
+    obstacle = sim.spawn(OBSTACLE, sim.player_lane, sim.spawn_x, speed=20000)
+    hits = []
+    for _ in range(math.ceil(1 / delta_time) + 1):
+        hits += _events(sim.step(delta_time), EVENT_HIT)
+    assert hits == [obstacle]
+    assert sim.lives == 9
+    assert obstacle not in sim.entities()
+
+
+def test_every_entity_crossing_the_player_in_one_long_step_counts():
+    sim = _empty_simulation()
+    lane = sim.player_lane
+    spawned = [sim.spawn(kind, lane, sim.spawn_x + 200 * i, speed=5000)
+               for i, kind in enumerate((BONUS, OBSTACLE, BONUS, OBSTACLE))]
+    events = sim.step(2.0)
+    assert _events(events, EVENT_COLLECT) == [spawned[0], spawned[2]]
+    assert _events(events, EVENT_HIT) == [spawned[1], spawned[3]]
+    assert sim.score == 2 * BONUS_POINTS
+    assert sim.lives == 8
+
+
+def test_entities_in_other_lanes_pass_by():
+    sim = _empty_simulation()
+    other = (sim.player_lane + 1) % sim.lane_count
+    sim.spawn(OBSTACLE, other, sim.spawn_x, speed=20000)
+    events = sim.step(1.0)
+    assert not _events(events, EVENT_HIT)
+    assert sim.lives == 10
+
+
+def test_contacts_are_listed_nearest_first():
+    sim = _empty_simulation()
+    lane = sim.player_lane
+    near = sim.spawn(BONUS, lane, 400, speed=100)
+    far = sim.spawn(OBSTACLE, lane, 800, speed=100)
+    contacts = list(sim.contacts(lane))
+    assert [entity for _, entity in contacts] == [near, far]
+    assert contacts[0][0] == pytest.approx((near.left - PLAYER_X - sim.player_half_width) / 100)
+    assert list(sim.contacts((lane + 1) % sim.lane_count)) == []
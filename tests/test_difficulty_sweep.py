@@ -0,0 +1,24 @@
+import pytest
+from difficulty_sweep import main, parse_grid
+
+
+def test_grid_is_the_product_of_the_values():
+    swept, grid = parse_grid("Łatwy", ["speed=300,400", "double_chance=0.1,0.2,0.3"])
+    assert swept == ["speed", "double_chance"]
+    assert len(grid) == 6
+    assert {(d.speed, d.double_chance) for d in grid} == {(s, c) for s in (300, 400) for c in (0.1, 0.2, 0.3)}
+    assert all(d.max_speed == 700 for d in grid)
+
+
+@pytest.mark.parametrize("spec", ["speed=300,0", "max_speed=-5", "obstacle_interval=0", "bonus_interval=nan",
+                                  "unknown=1", "speed="])
+def test_invalid_specs_raise_value_error(spec):
+    with pytest.raises(ValueError):
+        parse_grid("Łatwy", [spec])
+
+
+def test_cli_reports_invalid_specs(capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        main(["--param", "speed=0"])
+    assert exit_info.value.code == 2
+    assert "speed must be positive" in capsys.readouterr().err
@@ -0,0 +1,56 @@
+import arcade
+from objects.pool import SpritePool
+
+
+def _pool(size):
+    return SpritePool(lambda: arcade.SpriteSolidColor(8, 8), size)
+
+
+def test_prebuilt_sprites_are_hidden_and_free():
+    pool = _pool(4)
+    assert pool.size == 4
+    assert pool.active == 0
+    assert not any(sprite.visible for sprite in pool.sprite_list)
+
+
+def test_released_sprite_is_handed_out_again():
+    pool = _pool(2)
+    sprite = pool.acquire(100, 50, 300)
+    assert (sprite.center_x, sprite.center_y, sprite.speed, sprite.visible) == (100, 50, 300, True)
+    pool.release(sprite)
+    assert not sprite.visible
+    assert pool.acquire(10, 20, 30) is sprite
+    assert pool.created == 2
+    assert pool.hit_rate == 1.0
+
+
+def test_empty_pool_grows_by_one_sprite():
+    pool = _pool(1)
+    first = pool.acquire(0, 0, 0)
+    second = pool.acquire(0, 0, 0)
+    assert first is not second
+    assert pool.size == 2
+    assert pool.stats()["created"] == 2
+    assert pool.hit_rate == 0.5
+
+
+def test_sprite_list_is_not_modified_by_reuse():
+    pool = _pool(8)
+    sprites = list(pool.sprite_list)
+    for _ in range(100):
+        taken = [pool.acquire(0, 0, 0) for _ in range(5)]
+        for sprite in taken:
+            pool.release(sprite)
+    assert list(pool.sprite_list) == sprites
+    assert pool.created == 8
+
+
+def test_release_all_frees_every_sprite():
+    pool = _pool(3)
+    for _ in range(5):
+        pool.acquire(0, 0, 0)
+    assert pool.active == 5
+    pool.release_all()
+    assert pool.active == 0
+    assert not any(sprite.visible for sprite in pool.sprite_list)
+    assert {id(s) for s in pool.free} == {id(s) for s in pool.sprite_list}
@@ -0,0 +1,38 @@
+import csv
+
+from profiler import FrameProfiler
+
+
+def _record(profiler, frames):
+    for _ in range(frames):
+        profiler.begin()
+        profiler.mark("update")
+        profiler.end_frame()
+
+
+def test_rows_are_bounded():
+    profiler = FrameProfiler(window=10, max_rows=50)
+    _record(profiler, 200)
+
+    assert len(profiler.rows) == 50
+    assert profiler.frame_count == 200
+    assert [row["frame"] for row in profiler.rows] == list(range(150, 200))
+
+
+def test_async_export_writes_the_kept_frames(tmp_path):
+    profiler = FrameProfiler(window=10, max_rows=20)
+    _record(profiler, 30)
+    path = tmp_path / "session.csv"
+
+    thread = profiler.write_csv_async(str(path))
+    _record(profiler, 5)  # nagrywanie trwa dalej, eksport pracuje na kopii
+    thread.join()
+
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [int(row["frame"]) for row in rows] == list(range(10, 30))
+    assert list(rows[0]) == ["frame", "frame_ms", "update"]
+
+
+def test_nothing_to_export():
+    assert FrameProfiler().write_csv_async() is None
@@ -0,0 +1,69 @@
+import pytest
+from difficulty_sweep import lookahead_action
+from simulation.engine import Simulation
+from simulation.replay import Replay, ReplayError
+
+
+def _recorded_game(seed=2024, difficulty="Trudny"):
+    """Play until game over with the lookahead bot, recording every lane change"""
+
+    sim = Simulation(difficulty, seed=seed)
+    replay = Replay(seed, difficulty)
+    while not sim.game_over:
+        if sim.tick % 6 == 0:
+            direction = lookahead_action(sim, 0.5)
+            if direction:
+                replay.record(sim.tick, direction)
+                sim.apply_input(direction)
+        sim.step()
+    replay.finish(sim.score, sim.tick)
+    return replay
+
+
+def test_recorded_game_is_not_trivial():
+    replay = _recorded_game()
+    assert replay.score > 0
+    assert len(replay.inputs) > 10
+
+
+def test_encode_decode_round_trip():
+    replay = _recorded_game()
+    decoded = Replay.decode(replay.encode())
+    assert decoded == replay
+
+
+def test_recorded_game_verifies():
+    replay = _recorded_game()
+    assert Replay.decode(replay.encode()).verify()
+
+
+def test_forged_score_is_rejected():
+    replay = _recorded_game()
+    replay.score += 10
+    assert not Replay.decode(replay.encode()).verify()
+
+
+def test_forged_length_is_rejected():
+    replay = _recorded_game()
+    replay.ticks += 1
+    assert not replay.verify()
+
+
+@pytest.mark.parametrize("data", [b"", b"WCGR", b"XXXX" + bytes(40)])
+def test_garbage_raises_replay_error(data):
+    with pytest.raises(ReplayError):
+        Replay.decode(data)
+
+
+def test_truncated_inputs_raise_replay_error():
+    data = _recorded_game().encode()
+    with pytest.raises(ReplayError):
+        Replay.decode(data[:-1])
+
+
+@pytest.mark.parametrize("field", ["rate", "lane_count"])
+def test_zero_rate_or_lanes_raise_replay_error(field):
+    replay = _recorded_game()
+    setattr(replay, field, 0)
+    with pytest.raises(ReplayError):
+        Replay.decode(replay.encode())
@@ -0,0 +1,48 @@
+import threading
+from music import RingBuffer
+
+
+def test_wraps_around_the_end():
+    ring = RingBuffer(10)
+    assert ring.write(b"abcdefg")
+    assert ring.read(5) == b"abcde"
+    assert ring.write(b"hijklm")
+    assert ring.size == 8
+    assert ring.start == 5
+    assert ring.read(100) == b"fghijklm"
+    assert ring.size == 0
+
+
+def test_read_returns_only_what_is_buffered():
+    ring = RingBuffer(8)
+    assert ring.read(4) == b""
+    ring.write(b"xy")
+    assert ring.read(4) == b"xy"
+
+
+def test_writer_waits_for_room_and_keeps_order():
+    ring = RingBuffer(16)
+    chunks = [bytes([i]) * 5 for i in range(50)]
+
+    def writer():
+        for chunk in chunks:
+            ring.write(chunk)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    received = bytearray()
+    while len(received) < 250:
+        received += ring.read(7)
+    thread.join(timeout=5)
+    assert bytes(received) == b"".join(chunks)
+
+
+def test_close_releases_a_blocked_writer():
+    ring = RingBuffer(4)
+    ring.write(b"full")
+    result = []
+    thread = threading.Thread(target=lambda: result.append(ring.write(b"more")))
+    thread.start()
+    ring.close()
+    thread.join(timeout=5)
+    assert result == [False]
@@ -0,0 +1,104 @@
+import importlib
+import json
+import threading
+import sqlite3
+import pytest
+import score_manager as _score_manager
+from simulation.engine import Simulation
+from simulation.replay import Replay
+
+
+@pytest.fixture
+def score_manager(tmp_path):
+    """Fresh module state with the database and legacy files in a temporary directory"""
+
+    module = importlib.reload(_score_manager)
+    module.DB_FILE = str(tmp_path / "scores.db")
+    module.SCORES_FILE = str(tmp_path / "scores.json")
+    module.JOURNAL_FILE = str(tmp_path / "scores.journal")
+    yield module
+    module.flush()
+
+
+def _rows(module):
+    with sqlite3.connect(module.DB_FILE) as connection:
+        return connection.execute("SELECT score, difficulty FROM scores ORDER BY id").fetchall()
+
+
+def test_bad_replay_does_not_stop_the_writer(score_manager):
+    forged = Replay(1, "Łatwy", score=10, ticks=100)
+    forged.rate = 0
+    score_manager.add_score(10, "Łatwy", replay=forged)
+    score_manager.add_score(50, "Łatwy")
+    assert score_manager.flush()
+    assert _rows(score_manager) == [(50, "Łatwy")]
+    assert score_manager.rejected == 1
+    assert score_manager._writer.is_alive()
+
+
+def test_failed_write_is_retried(score_manager, tmp_path):
+    score_manager.RETRY_DELAY = 0.01
+    score_manager.DB_FILE = str(tmp_path / "missing" / "scores.db")
+    score_manager.add_score(30, "Trudny")
+    assert not score_manager.flush(0.2)
+    assert score_manager.write_errors > 0
+    assert [e["score"] for e in score_manager._pending] == [30]  # wpis wciąż czeka w pamięci
+
+    (tmp_path / "missing").mkdir()
+    assert score_manager.flush()
+    assert _rows(score_manager) == [(30, "Trudny")]
+    assert score_manager._pending == []
+
+
+def test_legacy_scores_are_imported_once(score_manager):
+    legacy = [{"score": 7, "date": "2024-01-01 10:00:00", "difficulty": "Łatwy"},
+              {"score": 9, "date": "2024-01-02 10:00:00", "difficulty": "Trudny"}]
+    with open(score_manager.JOURNAL_FILE, "w", encoding="utf-8") as f:
+        for entry in legacy + legacy[:1]:
+            f.write(json.dumps(entry) + "\n")
+
+    # Czytelnik (wątek gry) i wątek zapisu otwierają pustą bazę jednocześnie
+    reader = threading.Thread(target=score_manager.count_scores)
+    reader.start()
+    score_manager.add_score(1, "Średni")
+    reader.join()
+    assert score_manager.flush()
+    assert sorted(_rows(score_manager)) == [(1, "Średni"), (7, "Łatwy"), (9, "Trudny")]
+
+
+def _idle_game(seed=7, difficulty="Łatwy"):
+    """Record a run in which the player never changes lane"""
+
+    sim = Simulation(difficulty, seed=seed)
+    while not sim.game_over:
+        sim.step()
+    replay = Replay(seed, difficulty)
+    replay.finish(sim.score, sim.tick)
+    return replay
+
+
+def test_scores_without_replay_stay_out_of_the_ranking(score_manager):
+    with open(score_manager.SCORES_FILE, "w", encoding="utf-8") as f:
+        json.dump([{"score": 900, "date": "2024-01-01 10:00:00", "difficulty": "Łatwy"}], f)
+    replay = _idle_game()
+    score_manager.add_score(replay.score, "Łatwy", replay=replay)
+    score_manager.add_score(800, "Łatwy")
+    assert score_manager.flush()
+    assert [e["score"] for e in score_manager.top_scores()] == [replay.score]
+    assert score_manager.count_scores() == 1
+    assert [e["score"] for e in score_manager.top_scores(ranked=False)] == [900, 800, replay.score]
+    assert score_manager.count_scores(ranked=False) == 3
+
+
+@pytest.mark.parametrize("difficulty", [None, "Łatwy"])
+def test_ranking_queries_use_an_index(score_manager, difficulty):
+    where, params = score_manager._where(difficulty, None, None, ranked=True)
+    queries = [
+        ("SELECT COUNT(*) FROM scores" + where, params),
+        ("SELECT score, date, difficulty FROM scores" + where + " ORDER BY score DESC, date LIMIT ? OFFSET ?",
+         params + [10, 0]),
+    ]
+    for query, query_params in queries:
+        plan = [row[3] for row in score_manager._reader().execute("EXPLAIN QUERY PLAN " + query, query_params)]
+        # Jeden krok planu: przejście po indeksie rankingu, bez sortowania w tymczasowym drzewie
+        assert len(plan) == 1 and "INDEX idx_scores_ranked" in plan[0], plan
@@ -0,0 +1,51 @@
+import random
+from simulation.engine import Simulation, MOVE_UP, MOVE_DOWN
+
+
+def _random_inputs(seed, ticks, count=200):
+    rng = random.Random(seed)
+    return sorted((rng.randrange(ticks), rng.choice((MOVE_UP, MOVE_DOWN))) for _ in range(count))
+
+
+def _play(seed, inputs, ticks=6000):
+    sim = Simulation("Trudny", seed=seed)
+    pending = list(inputs)
+    events = []
+    for _ in range(ticks):
+        if sim.game_over:
+            break
+        while pending and pending[0][0] <= sim.tick:
+            sim.apply_input(pending.pop(0)[1])
+        for event, entity in sim.step():
+            events.append((sim.tick, event, None if entity is None else (entity.uid, entity.lane, entity.x)))
+    return events, sim
+
+
+def test_same_seed_and_inputs_give_identical_trace():
+    inputs = _random_inputs(7, 6000)
+    trace_a = Simulation("Trudny", seed=42).run(6000, inputs)
+    trace_b = Simulation("Trudny", seed=42).run(6000, inputs)
+    assert trace_a == trace_b
+    assert len(trace_a) > 1
+
+
+def test_same_seed_and_inputs_give_identical_events():
+    inputs = _random_inputs(3, 6000)
+    events_a, sim_a = _play(1234, inputs)
+    events_b, sim_b = _play(1234, inputs)
+    assert events_a == events_b
+    assert (sim_a.tick, sim_a.score, sim_a.lives) == (sim_b.tick, sim_b.score, sim_b.lives)
+
+
+def test_reset_replays_the_same_game():
+    inputs = _random_inputs(5, 3000)
+    sim = Simulation("Łatwy", seed=99)
+    first = sim.run(3000, inputs)
+    sim.reset(seed=99)
+    assert sim.run(3000, inputs) == first
+
+
+def test_different_seeds_give_different_games():
+    events_a, _ = _play(1, [])
+    events_b, _ = _play(2, [])
+    assert events_a != events_b
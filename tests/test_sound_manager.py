@@ -0,0 +1,71 @@
+import pyglet
+import pytest
+from pyglet.media import synthesis
+from sound_manager import SoundManager
+
+
+class FakeClock:
+    """Clock advanced by hand, so coalescing and voice age do not depend on real time"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class Effect:
+    """Stand-in for a decoded arcade.Sound; long enough not to finish during a test"""
+
+    source = pyglet.media.StaticSource(synthesis.Silence(5.0))
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def manager(clock):
+    manager = SoundManager(max_voices=3, coalesce_window=0.05, clock=clock)
+    manager.sounds = {f"sounds/{name}.wav": Effect() for name in "abcde"}
+    yield manager
+    for voice in manager.voices:
+        voice.delete()
+
+
+def test_voices_are_limited_and_the_oldest_is_stolen(manager, clock):
+    voices = []
+    for name in "abc":
+        voices.append(manager.play(f"sounds/{name}.wav"))
+        clock.now += 0.1
+    assert manager.active_voices() == 3
+
+    assert manager.play("sounds/d.wav") is voices[0]
+    clock.now += 0.1
+    assert manager.play("sounds/e.wav") is voices[1]
+    assert manager.stats() == {"voices": 3, "active": 3, "max_voices": 3,
+                               "played": 5, "coalesced": 0, "stolen": 2}
+
+
+def test_finished_voice_is_reused_before_stealing(manager, clock):
+    first = manager.play("sounds/a.wav")
+    clock.now += 0.1
+    manager.play("sounds/b.wav")
+    first.next_source()  # efekt dograł do końca
+    clock.now += 0.1
+
+    assert manager.play("sounds/c.wav") is first
+    assert len(manager.voices) == 2
+    assert manager.stolen == 0
+
+
+def test_repeated_trigger_within_the_window_is_coalesced(manager, clock):
+    assert manager.play("sounds/a.wav") is not None
+    clock.now += 0.04
+    assert manager.play("sounds/a.wav") is None
+    assert manager.play("sounds/b.wav") is not None  # inny efekt nie jest łączony
+
+    clock.now += 0.02  # okno liczy się od ostatniego odtworzenia, nie od pominiętego wywołania
+    assert manager.play("sounds/a.wav") is not None
+    assert (manager.played, manager.coalesced) == (3, 1)
@@ -0,0 +1,69 @@
+import math
+import random
+from collections import deque
+import pytest
+from simulation.engine import BONUS, EVENT_SPAWN, OBSTACLE, Entity, Simulation, _too_close
+
+LANE_HEIGHT = 100
+LANE_YS = [50, 150, 250, 350, 450]
+
+
+def _brute_force(lanes, x, lane, min_distance, kind):
+    y = LANE_YS[lane]
+    return any(math.hypot(x - entity.x, y - entity.y) < min_distance
+               for entities in lanes for entity in entities
+               if kind is None or entity.kind == kind)
+
+
+def _random_lanes(rng):
+    lanes = []
+    for lane, y in enumerate(LANE_YS):
+        xs = sorted(rng.uniform(0, 1000) for _ in range(rng.randrange(12)))
+        lanes.append(deque(Entity(0, rng.choice((OBSTACLE, BONUS)), lane, x, y, 100, 40, 40) for x in xs))
+    return lanes
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_lane_tail_walk_matches_brute_force(seed):
+    rng = random.Random(seed)
+    lanes = _random_lanes(rng)
+    for _ in range(200):
+        x = rng.uniform(0, 1100)
+        lane = rng.randrange(len(LANE_YS))
+        min_distance = rng.choice((50, 80, 120, 250))
+        kind = rng.choice((None, OBSTACLE, BONUS))
+        assert (_too_close(lanes, LANE_YS, LANE_HEIGHT, x, lane, min_distance, kind)
+                == _brute_force(lanes, x, lane, min_distance, kind))
+
+
+def test_entity_in_a_neighbouring_lane_counts_only_within_the_distance():
+    lanes = [deque() for _ in LANE_YS]
+    lanes[1].append(Entity(0, OBSTACLE, 1, 500, LANE_YS[1], 100, 40, 40))
+    assert _too_close(lanes, LANE_YS, LANE_HEIGHT, 500, 0, 120)
+    assert not _too_close(lanes, LANE_YS, LANE_HEIGHT, 500, 0, 80)
+    assert not _too_close(lanes, LANE_YS, LANE_HEIGHT, 500, 0, 120, kind=BONUS)
+
+
+@pytest.mark.parametrize("difficulty", ["Łatwy", "Trudny"])
+def test_spawned_entities_keep_their_distance(difficulty):
+    sim = Simulation(difficulty, seed=11)
+    sim.lives = 10 ** 9
+    spawned_count = 0
+    for _ in range(60 * 120):
+        # Odstępy są sprawdzane względem położeń z końca poprzedniego kroku
+        placed = [(entity.kind, entity.x, entity.y) for entity in sim.entities()]
+        for event, entity in sim.step():
+            if event != EVENT_SPAWN:
+                continue
+            x = entity.prev_x
+            if entity.kind == BONUS:
+                min_distance, kinds = 120, (OBSTACLE, BONUS)
+            elif x == sim.spawn_x:
+                min_distance, kinds = 80, (OBSTACLE, BONUS)
+            else:  # druga przeszkoda pary
+                min_distance, kinds = 80, (OBSTACLE,)
+            assert all(math.hypot(x - other_x, entity.y - other_y) >= min_distance
+                       for kind, other_x, other_y in placed if kind in kinds)
+            placed.append((entity.kind, x, entity.y))
+            spawned_count += 1
+    assert spawned_count > 100
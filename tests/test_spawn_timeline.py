@@ -0,0 +1,84 @@
+import random
+import pytest
+from difficulty_sweep import lookahead_action
+from settings import SCREEN_WIDTH
+from simulation.engine import EVENT_COLLECT, EVENT_HIT, Difficulty, Simulation, SpawnTimeline
+
+GAME_STEPS = 60 * 120
+# Gry, w których cofanie po zmianie długości kroku przechodziło przez zmianę progu punktów
+SWITCH_GAMES = [(3, "Łatwy"), (12, "Trudny")]
+RANDOM_GAMES = [(3, "Trudny"), (8, "Trudny"), (12, "Łatwy")]
+# Tak wąska plansza i tak gęste, wolne obiekty, że zebrany bonus lub trafienie zmienia
+# odstępy sprawdzane przy kolejnych losowaniach
+NARROW_WIDTH = 200
+DENSE = Difficulty(speed=200, max_speed=400, speed_increment=25, obstacle_interval=0.8, bonus_interval=0.3)
+
+
+class OnTheFlyTimeline(SpawnTimeline):
+    """Reference that spawns each step only when it is due, checking spacing against the simulation's own entities"""
+
+    def __init__(self, sim):
+        super().__init__(sim, chunk_ticks=1)
+
+    def _rewind(self, tick):
+        assert self.tick == tick
+
+    def _step(self, emit=True):
+        self.tracked = self._track()
+        super()._step(emit)
+
+
+def _play(seed, difficulty, steps, on_the_fly=False, width=SCREEN_WIDTH):
+    """Play with the lookahead bot and return the score and events of every step"""
+
+    sim = Simulation(difficulty, seed=seed, width=width)
+    if on_the_fly:
+        sim.timeline = OnTheFlyTimeline(sim)
+        sim.reset(seed=seed)
+    sim.lives = 10 ** 9  # gra trwa do końca listy kroków, z wieloma zmianami progu punktów
+    history = []
+    for tick, delta_time in enumerate(steps):
+        if tick % 6 == 0:
+            direction = lookahead_action(sim, 1.0)
+            if direction:
+                sim.apply_input(direction)
+        events = sim.step(delta_time)
+        history.append((sim.score, [(event, entity and (entity.uid, entity.lane, entity.x))
+                                    for event, entity in events]))
+        if not on_the_fly:
+            sim.timeline.fill(max_chunks=1)  # jak GameView między klatkami
+    return history
+
+
+def _switched_steps():
+    return [1 / 60] * (GAME_STEPS // 2) + [1 / 30] * (GAME_STEPS // 2)
+
+
+def _random_steps(seed):
+    rng = random.Random(seed)
+    return [rng.choice((1 / 60, 1 / 30, 1 / 45, 1 / 120)) for _ in range(GAME_STEPS)]
+
+
+def test_fixed_steps_match_spawning_on_the_fly():
+    steps = [1 / 60] * GAME_STEPS
+    assert _play(5, "Trudny", steps) == _play(5, "Trudny", steps, on_the_fly=True)
+
+
+@pytest.mark.parametrize("seed, difficulty", SWITCH_GAMES)
+def test_step_length_switch_matches_spawning_on_the_fly(seed, difficulty):
+    steps = _switched_steps()
+    assert _play(seed, difficulty, steps) == _play(seed, difficulty, steps, on_the_fly=True)
+
+
+@pytest.mark.parametrize("seed, difficulty", RANDOM_GAMES)
+def test_random_step_lengths_match_spawning_on_the_fly(seed, difficulty):
+    steps = _random_steps(seed)
+    assert _play(seed, difficulty, steps) == _play(seed, difficulty, steps, on_the_fly=True)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_narrow_playfield_matches_spawning_on_the_fly(seed):
+    steps = _random_steps(seed)[:GAME_STEPS // 4]
+    history = _play(seed, DENSE, steps, width=NARROW_WIDTH)
+    assert any(event in (EVENT_HIT, EVENT_COLLECT) for _, events in history for event, _ in events)
+    assert history == _play(seed, DENSE, steps, on_the_fly=True, width=NARROW_WIDTH)